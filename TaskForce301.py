@@ -16,11 +16,11 @@ from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtCore import Qt, QPoint
 from PyQt5.QtWidgets import QMessageBox
 
-from library import MainClock, Mapping, InGameData
 from library.displays import GameDisplay, InteractiveList
-from library.Ship import Ship
-from library.dialogs import BattleSetup, InGameMenus, dialogsUtils
-from library.controllers.game_controller import GameController
+from library.dialogs import dialogsUtils
+
+# The battle modules (ships, world, map generator, configs, battle setup
+# dialogs) are imported on first use, to keep them off the startup path.
 
 
 class Ui_TSKF301MainWindow(object):
@@ -345,7 +345,10 @@ class Ui_TSKF301MainWindow(object):
         self.actionEscapePause.setShortcut(_translate("TSKF301MainWindow", "Escape"))
 
     def initData(self):
+        if getattr(self, "world", None):
+            self.world.detach()
         self.mainClock = None
+        self.world = None
         self.mapGen = None
         self.rComs = None
         self._game_controller = None
@@ -383,6 +386,8 @@ class Ui_TSKF301MainWindow(object):
             ),
             Qt.KeepAspectRatio,
         )
+        from library import InGameData, Mapping
+
         self.mapGen = Mapping.MapGenerator(
             self.gameScene.width(), self.gameScene.height(), mapResolution
         )
@@ -400,6 +405,9 @@ class Ui_TSKF301MainWindow(object):
         playerShipsConfigs: list,
         ennemyShipsConfigs=None,
     ):
+        from library import InGameData
+        from library.Ship import Ship
+
         ## GENERAL VARS ##
         a_spawnXOffset = mapExtension + 1000
         e_spawnXOffset = mapExtension + mapSize - 1500
@@ -604,10 +612,15 @@ class Ui_TSKF301MainWindow(object):
                 self.gameScene.addShip(currentShip)
                 currentShip = None
 
-        self.rComs.updateShipLists()
+        InGameData.TargetEvaluationTable.build(self.gameScene.shipList.values())
 
     def createBattle(self):
+        from library import MainClock, World
+        from library.controllers.game_controller import GameController
+        from library.dialogs import BattleSetup
+
         self.mainClock = MainClock.MainClock(25)  # ms
+        self.world = World.World(self.mainClock, self.gameScene)
         self._game_controller = GameController(self)
         b_setup = BattleSetup.BattleSetup()
         self.gameScene.attachedGController = self._game_controller
@@ -652,6 +665,9 @@ class Ui_TSKF301MainWindow(object):
                 )
                 self.inBattle = True
                 self.battleState = False
+        if not self.inBattle:
+            # Setup cancelled
+            self.initData()
 
     def inBattlePause(self):
         if self.inBattle:
@@ -670,6 +686,8 @@ class Ui_TSKF301MainWindow(object):
                 self.mainClock.stopClock()
                 self.battleState = False
 
+            from library.dialogs import InGameMenus
+
             pauseMenu = InGameMenus.PauseMenu()
             result = pauseMenu.pauseMenuUI()
             if result[1] == 0:
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: doctrines.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+
+    Monte-Carlo evaluation of the AI doctrines. For each doctrine, funds
+    preset and map preset, runs N seeded headless battles of the doctrine
+    against an opponent doctrine drawn from the same seed. The battles run
+    in a process pool, one offscreen game per worker. The seeds are shared by
+    all the doctrines, and the doctrine swaps sides with the seed parity.
+
+    Both fleets are given the same orders: sail to the open water nearest to
+    the middle of the map, then fight with their own target selection. A
+    battle ends when a fleet is sunk, or as a draw after --max-ticks ticks.
+
+    Writes a CSV summary (and a Parquet one with --parquet, if pandas is
+    installed) of the win rate, battle duration, damage dealt and taken, and
+    simulation speed in ticks per second.
+
+    Usage: python -m benchmarks.doctrines [--runs N] [--workers W] [--out CSV]
+           [--funds Small Standard ...] [--sizes Medium ...]
+           [--obstructions Light ...] [--max-ticks T] [--seed S] [--parquet]
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+
+from os import path
+
+from library.utils.ConfigRegistry import ConfigRegistry
+
+CONFIGS_DIR = path.join(
+    path.dirname(path.dirname(path.realpath(__file__))), "library", "configs"
+)
+TICK = 25  # ms, the timestep of the game clock
+
+_ui = None
+
+
+def presets():
+    mapGen = ConfigRegistry.view(path.join(CONFIGS_DIR, "mapGenConfig.py"))
+    doctrines = ConfigRegistry.view(path.join(CONFIGS_DIR, "ai_fleet_configs.py"))
+    return mapGen, sorted(doctrines["doctrines"])
+
+
+def initWorker():
+    """
+
+    Returns
+    -------
+    None.
+
+    Summary
+    -------
+    Builds the game once per worker process, offscreen and never shown.
+
+    """
+    global _ui
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5 import QtWidgets
+
+    import TaskForce301
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = QtWidgets.QMainWindow()
+    _ui = TaskForce301.Ui_TSKF301MainWindow()
+    _ui.setupUi(window)
+    _ui.initData()
+    # Keeps the Qt objects alive
+    _ui.headless = (app, window)
+
+
+def rallyPoint(astar, point):
+    """
+
+    Parameters
+    ----------
+    astar : Astar
+        The pathfinder of a ship.
+    point : QPointF
+        The point the ship is ordered to.
+
+    Returns
+    -------
+    QPointF
+        The traversible node nearest to point, so that the path to it exists.
+
+    """
+    from PyQt5.QtCore import QPointF
+
+    nodes = astar.allNodes
+    i0 = min(max(round(point.y() / astar.gridS), 0), len(nodes) - 1)
+    j0 = min(max(round(point.x() / astar.gridS), 0), len(nodes[0]) - 1)
+    for radius in range(max(len(nodes), len(nodes[0]))):
+        ring = [
+            nodes[i][j]
+            for i in range(max(i0 - radius, 0), min(i0 + radius + 1, len(nodes)))
+            for j in range(max(j0 - radius, 0), min(j0 + radius + 1, len(nodes[0])))
+            if max(abs(i - i0), abs(j - j0)) == radius and nodes[i][j].traversible
+        ]
+        if ring:
+            node = min(ring, key=lambda n: (n.iGrid - i0) ** 2 + (n.jGrid - j0) ** 2)
+            return QPointF(node.xPos, node.yPos)
+    return point
+
+
+def runBattle(task):
+    """
+
+    Parameters
+    ----------
+    task : tuple
+        (doctrine, opponent, funds, size, obstruction, seed, maxTicks), the
+        doctrines and the preset keys of the battle.
+
+    Returns
+    -------
+    row : dict
+        The task and the outcome of the battle, from the doctrine side.
+
+    """
+    from PyQt5.QtCore import QPointF
+
+    from library import MainClock, World
+    from library.controllers.game_controller import GameController
+
+    doctrine, opponent, funds, size, obstruction, seed, maxTicks = task
+    mapGen, _ = presets()
+    ui = _ui
+    random.seed(seed)
+
+    ui.initData()
+    ui.mainClock = MainClock.MainClock(TICK)
+    ui.world = World.World(ui.mainClock, ui.gameScene)
+    ui._game_controller = GameController(ui)
+    ui.gameScene.attachedGController = ui._game_controller
+    doctrineFleet = ui._game_controller.generate_ai_fleet(
+        mapGen["funds"][funds], doctrine
+    )
+    opponentFleet = ui._game_controller.generate_ai_fleet(
+        mapGen["funds"][funds], opponent
+    )
+    doctrineTag = "ENNEMY" if seed % 2 == 0 else "ALLY"
+    opponentTag = "ALLY" if doctrineTag == "ENNEMY" else "ENNEMY"
+    fleets = {doctrineTag: doctrineFleet, opponentTag: opponentFleet}
+
+    mapSize = mapGen["size"][size]
+    extension = mapGen["mapExtension"]
+    ui.newGame(
+        mapSize,
+        extension,
+        mapGen["mapResolution"],
+        mapGen["obstruction"][obstruction],
+        list(mapGen["obstacles"]),
+    )
+    ui.spawnShips(mapSize, extension, 1500, fleets["ALLY"], fleets["ENNEMY"])
+
+    clock = ui.mainClock
+    world = ui.world
+    roster = ui.gameScene.roster
+    ships = list(ui.gameScene.shipList.values())
+
+    def tick():
+        # One frame of MainClock.raiseTimeout, rendered at the simulated state
+        world.step()
+        clock.clockSignal.emit(True)
+        clock.elapsedTime += clock.period
+        world.render(1)
+
+    tick()
+    middle = extension + mapSize / 2
+    for ship in ships:
+        target = QPointF(middle, ship.coordinates.center.y())
+        ship.updatePath(rallyPoint(ship.astar, target))
+
+    ticks = 1
+    start = time.perf_counter()
+    while ticks < maxTicks and roster.team("ALLY") and roster.team("ENNEMY"):
+        tick()
+        ticks += 1
+    wallTime = time.perf_counter() - start
+
+    damage = {doctrineTag: 0, opponentTag: 0}
+    for ship in ships:
+        damage[ship.data(1)] += ship.hull["max_hp"] - max(ship.instant_vars.hp, 0)
+    doctrineAfloat = bool(roster.team(doctrineTag))
+    opponentAfloat = bool(roster.team(opponentTag))
+    if doctrineAfloat and not opponentAfloat:
+        result = "win"
+    elif opponentAfloat and not doctrineAfloat:
+        result = "loss"
+    else:
+        result = "draw"
+
+    ui.gameScene.clearGameScene()
+    ui.shipsListView.clearList()
+    ui.initData()
+
+    return {
+        "doctrine": doctrine,
+        "opponent": opponent,
+        "funds": funds,
+        "map": "{}/{}".format(size, obstruction),
+        "seed": seed,
+        "result": result,
+        "ticks": ticks,
+        "damage_dealt": damage[opponentTag],
+        "damage_taken": damage[doctrineTag],
+        "ticks_per_s": ticks / wallTime if wallTime > 0 else 0,
+    }
+
+
+def makeTasks(doctrines, funds, sizes, obstructions, runs, seed, maxTicks):
+    tasks = []
+    for run in range(runs):
+        runSeed = seed + run
+        opponent = random.Random(runSeed).choice(doctrines)
+        for doctrine in doctrines:
+            for fundsKey in funds:
+                for size in sizes:
+                    for obstruction in obstructions:
+                        tasks.append(
+                            (
+                                doctrine,
+                                opponent,
+                                fundsKey,
+                                size,
+                                obstruction,
+                                runSeed,
+                                maxTicks,
+                            )
+                        )
+    return tasks
+
+
+def summarize(rows):
+    """
+
+    Parameters
+    ----------
+    rows : list of dict
+        The outcomes of the battles.
+
+    Returns
+    -------
+    summary : list of dict
+        One row per doctrine, funds preset and map preset.
+
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault((row["doctrine"], row["funds"], row["map"]), []).append(row)
+    summary = []
+    for (doctrine, funds, mapPreset), battles in sorted(groups.items()):
+        results = [battle["result"] for battle in battles]
+        summary.append(
+            {
+                "doctrine": doctrine,
+                "funds": funds,
+                "map": mapPreset,
+                "battles": len(battles),
+                "wins": results.count("win"),
+                "losses": results.count("loss"),
+                "draws": results.count("draw"),
+                "win_rate": results.count("win") / len(battles),
+                "mean_duration_s": statistics.mean(
+                    battle["ticks"] * TICK / 1000 for battle in battles
+                ),
+                "mean_damage_dealt": statistics.mean(
+                    battle["damage_dealt"] for battle in battles
+                ),
+                "mean_damage_taken": statistics.mean(
+                    battle["damage_taken"] for battle in battles
+                ),
+                "mean_ticks_per_s": statistics.mean(
+                    battle["ticks_per_s"] for battle in battles
+                ),
+            }
+        )
+    return summary
+
+
+def writeSummary(summary, out, parquet=False):
+    with open(out, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(summary[0]))
+        writer.writeheader()
+        writer.writerows(summary)
+    print("summary written to", out)
+    if parquet:
+        try:
+            import pandas
+        except ImportError:
+            print("pandas is not installed, no Parquet summary")
+            return
+        parquetOut = path.splitext(out)[0] + ".parquet"
+        pandas.DataFrame(summary).to_parquet(parquetOut)
+        print("summary written to", parquetOut)
+
+
+def main(argv=None):
+    mapGen, doctrines = presets()
+    parser = argparse.ArgumentParser(description="Monte-Carlo doctrine evaluator")
+    parser.add_argument("--runs", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--out",
+        default=path.join(
+            path.dirname(path.realpath(__file__)), "doctrines_summary.csv"
+        ),
+    )
+    parser.add_argument("--funds", nargs="+", default=list(mapGen["funds"]))
+    parser.add_argument("--sizes", nargs="+", default=["Medium"])
+    parser.add_argument("--obstructions", nargs="+", default=["Light"])
+    parser.add_argument("--max-ticks", type=int, default=24000)
+    parser.add_argument("--seed", type=int, default=301)
+    parser.add_argument("--parquet", action="store_true")
+    args = parser.parse_args(argv)
+
+    tasks = makeTasks(
+        doctrines,
+        args.funds,
+        args.sizes,
+        args.obstructions,
+        args.runs,
+        args.seed,
+        args.max_ticks,
+    )
+    print(len(tasks), "battles on", args.workers, "workers")
+    start = time.perf_counter()
+    # Workers are spawned, not forked, so that each owns its QApplication
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    with context.Pool(args.workers, initializer=initWorker) as pool:
+        for row in pool.imap_unordered(runBattle, tasks, chunksize=1):
+            rows.append(row)
+            print("\r{}/{} battles".format(len(rows), len(tasks)), end="")
+    print("\ndone in {:.1f} s".format(time.perf_counter() - start))
+
+    summary = summarize(rows)
+    header = ("doctrine", "funds", "map", "battles", "win_rate")
+    print("{:<24}{:<10}{:<16}{:>8}{:>12}".format(*header))
+    for line in summary:
+        print(
+            "{:<24}{:<10}{:<16}{:>8}{:>12.2f}".format(
+                line["doctrine"],
+                line["funds"],
+                line["map"],
+                line["battles"],
+                line["win_rate"],
+            )
+        )
+    writeSummary(summary, args.out, args.parquet)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: maths_formulas.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+
+    Micro-benchmarks of the MathsFormulas kernels. Compares, for N points,
+    the QPointF functions called in a loop, their scalar fast paths called in
+    a loop, and their vectorized versions called once.
+
+    Usage: python -m benchmarks.maths_formulas [N]
+"""
+
+import math
+import random
+import sys
+import timeit
+
+import numpy as np
+
+from PyQt5.QtCore import QPointF
+
+from library.utils.MathsFormulas import (
+    Geometrics as geo,
+    Cinematics as cin,
+    Controllers as con,
+)
+
+
+def makeData(n):
+    rng = random.Random(301)
+    ax = [rng.uniform(0, 40000) for _ in range(n)]
+    ay = [rng.uniform(0, 40000) for _ in range(n)]
+    bx = [rng.uniform(0, 40000) for _ in range(n)]
+    by = [rng.uniform(0, 40000) for _ in range(n)]
+    angles = [rng.uniform(-180, 180) for _ in range(n)]
+    headings = [rng.uniform(-180, 180) for _ in range(n)]
+    speeds = [rng.uniform(0, 9) for _ in range(n)]
+    return {
+        "ax": ax,
+        "ay": ay,
+        "bx": bx,
+        "by": by,
+        "pa": [QPointF(x, y) for x, y in zip(ax, ay)],
+        "pb": [QPointF(x, y) for x, y in zip(bx, by)],
+        "angles": angles,
+        "headings": headings,
+        "speeds": speeds,
+        "arrays": {
+            key: np.array(value)
+            for key, value in (
+                ("ax", ax),
+                ("ay", ay),
+                ("bx", bx),
+                ("by", by),
+                ("angles", angles),
+                ("headings", headings),
+                ("speeds", speeds),
+            )
+        },
+    }
+
+
+def cases(d):
+    a = d["arrays"]
+    turnRate = 0.13
+    return {
+        "distance": (
+            lambda: [geo.distance_A_B(p, q) for p, q in zip(d["pa"], d["pb"])],
+            lambda: [
+                geo.distance_xy(*c) for c in zip(d["ax"], d["ay"], d["bx"], d["by"])
+            ],
+            lambda: geo.distance_array(a["ax"], a["ay"], a["bx"], a["by"]),
+        ),
+        "angle": (
+            lambda: [geo.angle(p, q) for p, q in zip(d["pa"], d["pb"])],
+            lambda: [
+                geo.angle_xy(*c) for c in zip(d["ax"], d["ay"], d["bx"], d["by"])
+            ],
+            lambda: geo.angle_array(a["ax"], a["ay"], a["bx"], a["by"]),
+        ),
+        "smallestAngle": (
+            lambda: [
+                geo.smallestAngle(t, c) for t, c in zip(d["angles"], d["headings"])
+            ],
+            None,
+            lambda: geo.smallestAngle_array(a["angles"], a["headings"]),
+        ),
+        "movementBy": (
+            lambda: [
+                cin.movementBy(p, v, math.radians(h))
+                for p, v, h in zip(d["pa"], d["speeds"], d["headings"])
+            ],
+            lambda: [
+                cin.movementBy_xy(x, y, v, math.radians(h))
+                for x, y, v, h in zip(d["ax"], d["ay"], d["speeds"], d["headings"])
+            ],
+            lambda: cin.movementBy_array(
+                a["ax"], a["ay"], a["speeds"], np.radians(a["headings"])
+            ),
+        ),
+        "rotationCenters": (
+            lambda: [
+                cin.rotationCenters(p, h, v, turnRate)
+                for p, h, v in zip(d["pa"], d["headings"], d["speeds"])
+            ],
+            lambda: [
+                cin.rotationCenters_xy(x, y, h, v, turnRate)
+                for x, y, h, v in zip(d["ax"], d["ay"], d["headings"], d["speeds"])
+            ],
+            lambda: cin.rotationCenters_array(
+                a["ax"], a["ay"], a["headings"], a["speeds"], turnRate
+            ),
+        ),
+        "proportional": (
+            lambda: [
+                con.proportional(t, c, turnRate)
+                for t, c in zip(d["angles"], d["headings"])
+            ],
+            None,
+            lambda: con.proportional_array(a["angles"], a["headings"], turnRate),
+        ),
+    }
+
+
+def best(function, repeat=5, number=20):
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number
+
+
+def main(n=1000):
+    d = makeData(n)
+    print("N =", n, "(time per call over the N points, in us)")
+    header = ("", "QPointF", "scalar", "array", "speedup")
+    print("{:<16}{:>12}{:>12}{:>12}{:>10}".format(*header))
+    for name, (qt, scalar, array) in cases(d).items():
+        tQt = best(qt) * 1e6
+        tScalar = best(scalar) * 1e6 if scalar else float("nan")
+        tArray = best(array) * 1e6
+        print(
+            "{:<16}{:>12.1f}{:>12.1f}{:>12.1f}{:>9.1f}x".format(
+                name, tQt, tScalar, tArray, tQt / tArray
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: startup.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+
+    Cold start benchmark of the game. Reports the heaviest imports of
+    TaskForce301 (python -X importtime), and the time from interpreter launch
+    to the main window shown, against a time budget. Exits with status 1 when
+    the median time to shown is over budget.
+
+    Usage: python -m benchmarks.startup [RUNS] [BUDGET_MS]
+    Set QT_QPA_PLATFORM=offscreen to run it without a display.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+BUDGET_MS = 1500
+
+SHOW_WINDOW = """
+import sys, time
+from PyQt5 import QtCore, QtWidgets
+import TaskForce301 as tf
+
+app = QtWidgets.QApplication(sys.argv)
+window = QtWidgets.QMainWindow()
+ui = tf.Ui_TSKF301MainWindow()
+ui.setupUi(window)
+ui.initData()
+window.show()
+QtCore.QTimer.singleShot(0, app.quit)
+app.exec_()
+print("shown", flush=True)
+"""
+
+
+def importTimes():
+    """
+
+    Returns
+    -------
+    total : float
+        The cumulative import time of TaskForce301, in ms.
+    modules : list of tuples (cumulative : float, name : str)
+        The top level imports of TaskForce301, heaviest first, in ms.
+
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import TaskForce301"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    # Children are reported before their parent, one level deeper
+    children = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth == 0:
+            if name.strip() == "TaskForce301":
+                return int(cumulative) / 1000, sorted(children, reverse=True)
+            children = []
+        elif depth == 1:
+            children.append((int(cumulative) / 1000, name.strip()))
+    raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+
+def timeToShown():
+    """
+
+    Returns
+    -------
+    float
+        The time from interpreter launch to the main window shown, in ms.
+
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", SHOW_WINDOW], cwd=ROOT, stdout=subprocess.PIPE, text=True
+    )
+    for line in process.stdout:
+        if line.strip() == "shown":
+            elapsed = (time.perf_counter() - start) * 1000
+            break
+    else:
+        process.wait()
+        raise RuntimeError("the main window was not shown")
+    process.wait()
+    return elapsed
+
+
+def main(runs=5, budget=BUDGET_MS):
+    total, modules = importTimes()
+    print("import TaskForce301: {:.1f} ms, heaviest imports:".format(total))
+    for cumulative, name in modules[:15]:
+        print("{:>10.1f} ms  {}".format(cumulative, name))
+
+    times = [timeToShown() for _ in range(runs)]
+    median = statistics.median(times)
+    print(
+        "time to main window shown: median {:.1f} ms, min {:.1f} ms over {} runs"
+        " (budget {} ms)".format(median, min(times), runs, budget)
+    )
+    return 0 if median <= budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 5,
+            int(sys.argv[2]) if len(sys.argv) > 2 else BUDGET_MS,
+        )
+    )
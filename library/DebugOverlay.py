@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: DebugOverlay.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from collections import deque
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QColor, QPen, QPainterPath
+from PyQt5.QtWidgets import QGraphicsItem
+
+
+class DebugOverlay(QGraphicsItem):
+    """
+
+    A pure display class drawing the debug points of the battle, ships trails
+    and trajectories, in a single item. Trail points are kept in a bounded
+    ring buffer, so the oldest points are dropped instead of accumulating in
+    the game scene. The overlay has an empty shape: it is never returned by
+    itemAt or collidingItems. While disabled, it records and draws nothing.
+    Its bounds are those of the points it holds, updated once per frame with
+    the area changed during the frame.
+
+    ...
+
+    Attributes
+    ----------
+    enabled : bool
+        True if the overlay records and draws the debug points.
+
+    trail : deque of tuples (x : float, y : float, size : int, color : string)
+        The last trail points, oldest first.
+
+    waypoints : dict
+        The current trajectory points of each ship, by ship.
+
+    Methods
+    -------
+    __init__(capacity[2048] : int)
+        Constructor of the class.
+
+    setOverlayEnabled(enabled : bool)
+        Switches the overlay on or off.
+
+    addTrailPoint(point : QPointF, size : int, color : string)
+        Adds a point to the trail ring buffer.
+
+    setWaypoints(owner : object, points : list of QPointF, size : int,
+                 color : string)
+        Replaces the trajectory points of owner.
+
+    clearWaypoints(owner : object)
+        Removes the trajectory points of owner.
+
+    clear()
+        Removes all the debug points.
+
+    endFrame()
+        Fits the bounds to the points and repaints the area changed.
+
+    boundingRect()
+        Returns the area covered by the debug points.
+
+    shape()
+        Returns an empty shape, so that the overlay is never hit.
+
+    paint(painter : QPainter, option : QtOption, widget[None]: QWidget)
+        Draws all the debug points.
+
+    """
+
+    thk = 20
+
+    def __init__(self, capacity=2048):
+        """
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The maximum number of trail points kept. The default is 2048.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Constructor of the class. The overlay starts disabled.
+
+        """
+        super(DebugOverlay, self).__init__()
+
+        self.setData(2, False)  # Not an obstacle
+        self.setAcceptHoverEvents(False)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.setFlag(QGraphicsItem.ItemIsSelectable, False)
+        self.setFlag(QGraphicsItem.ItemIsFocusable, False)
+
+        self.enabled = False
+        self.trail = deque(maxlen=capacity)
+        self.waypoints = {}
+        self._bounds = QRectF()
+        # The area changed since the last frame
+        self._dirty = QRectF()
+        self.setVisible(False)
+
+    def setOverlayEnabled(self, enabled):
+        """
+
+        Parameters
+        ----------
+        enabled : bool
+            True to switch the overlay on, False to switch it off.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Switches the overlay on or off. Switching it off drops all the points.
+
+        """
+        self.enabled = enabled
+        if not enabled:
+            self.clear()
+        self.setVisible(enabled)
+
+    def _pointRect(self, x, y, size):
+        return QRectF(x - size / 2, y - size / 2, size, size).adjusted(
+            -self.thk, -self.thk, self.thk, self.thk
+        )
+
+    def _touch(self, points):
+        for x, y, size, _ in points:
+            self._dirty = self._dirty.united(self._pointRect(x, y, size))
+
+    def addTrailPoint(self, point, size, color):
+        """
+
+        Parameters
+        ----------
+        point : QPointF
+            The center of the point.
+        size : int
+            The diameter of the point.
+        color : string
+            The color of the point as a string.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Adds a point to the trail. Past the capacity of the ring buffer, the
+        oldest point is dropped. Does nothing while disabled.
+
+        """
+        if not self.enabled:
+            return
+        if len(self.trail) == self.trail.maxlen:
+            # The oldest point is dropped
+            self._touch([self.trail[0]])
+        trailPoint = (point.x(), point.y(), size, color)
+        self.trail.append(trailPoint)
+        self._touch([trailPoint])
+
+    def setWaypoints(self, owner, points, size, color):
+        """
+
+        Parameters
+        ----------
+        owner : object
+            The object the points belong to, usually a Ship.
+        points : list of QPointF
+            The centers of the points.
+        size : int
+            The diameter of the points.
+        color : string
+            The color of the points as a string.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Replaces the trajectory points of owner. Does nothing while disabled.
+
+        """
+        if not self.enabled:
+            return
+        self._touch(self.waypoints.get(owner, ()))
+        self.waypoints[owner] = [(p.x(), p.y(), size, color) for p in points]
+        self._touch(self.waypoints[owner])
+
+    def clearWaypoints(self, owner):
+        """
+
+        Parameters
+        ----------
+        owner : object
+            The object the points belong to, usually a Ship.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes the trajectory points of owner.
+
+        """
+        self._touch(self.waypoints.pop(owner, ()))
+
+    def clear(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes all the debug points.
+
+        """
+        self.prepareGeometryChange()
+        self.trail.clear()
+        self.waypoints.clear()
+        self._bounds = QRectF()
+        self._dirty = QRectF()
+
+    def endFrame(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Called once per rendered frame. Fits the bounds to the points held,
+        so that they shrink when old points are dropped, and repaints only
+        the area changed during the frame.
+
+        """
+        if self._dirty.isNull():
+            return
+        bounds = QRectF()
+        for points in [self.trail, *self.waypoints.values()]:
+            if points:
+                x0 = min(x - size / 2 for x, _, size, _ in points)
+                y0 = min(y - size / 2 for _, y, size, _ in points)
+                x1 = max(x + size / 2 for x, _, size, _ in points)
+                y1 = max(y + size / 2 for _, y, size, _ in points)
+                bounds = bounds.united(
+                    QRectF(x0, y0, x1 - x0, y1 - y0).adjusted(
+                        -self.thk, -self.thk, self.thk, self.thk
+                    )
+                )
+        if bounds != self._bounds:
+            self.prepareGeometryChange()
+            self._bounds = bounds
+        # The dropped points may lie outside of the new bounds
+        if self.scene():
+            self.scene().update(self._dirty)
+        self._dirty = QRectF()
+
+    def boundingRect(self):
+        """
+
+        Returns
+        -------
+        QRectF
+            The area covered by the debug points.
+
+        """
+        return self._bounds
+
+    def shape(self):
+        """
+
+        Returns
+        -------
+        QPainterPath
+            An empty path, so that the overlay is never hit nor colliding.
+
+        """
+        return QPainterPath()
+
+    def paint(self, painter, option, widget=None):
+        """
+
+        Parameters
+        ----------
+        painter : QPainter
+            A QPainter object.
+        option : QtOption
+            Options to apply to the QPainter.
+        widget : QWidget, optional
+            A QWidget object. The default is None.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Draws all the debug points, changing pen only when the color changes.
+
+        """
+        currentColor = None
+        for points in [self.trail, *self.waypoints.values()]:
+            for x, y, size, color in points:
+                if color != currentColor:
+                    painter.setPen(QPen(QColor(color), self.thk))
+                    currentColor = color
+                painter.drawEllipse(QRectF(x - size / 2, y - size / 2, size, size))
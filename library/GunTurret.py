@@ -19,9 +19,14 @@ from PyQt5.QtGui import QColor, QPen, QBrush
 from PyQt5.QtWidgets import QGraphicsRectItem
 
 from library.Projectile import Projectile
-from library.utils.MathsFormulas import Geometrics as geo, Controllers as con
+from library.utils.MathsFormulas import (
+    Geometrics as geo,
+    Cinematics as cin,
+    Controllers as con,
+)
 from library.InGameData import TechsData as tech_dat
-from library.utils.Config import Config
+from library.displays.LevelOfDetail import LevelOfDetail as lod
+from library.utils.ConfigRegistry import ConfigRegistry
 
 
 class GunTurret(QGraphicsRectItem):
@@ -33,9 +38,6 @@ class GunTurret(QGraphicsRectItem):
 
     Attributes
     ----------
-    d_shipCenter : int
-        The distance between the turret center and its parent ship center.
-
     shot_t : string
         The tag defining which shot type to fire.
 
@@ -62,11 +64,14 @@ class GunTurret(QGraphicsRectItem):
         The position on the y axis of the target in the scene referential at
         time t-1 (the previous refresh).
 
+    t_tick_1 : int
+        The tick of the world at time t-1 (the previous refresh).
+
     t_v_x : float
-        The instantaneous speed of the target on the x axis.
+        The speed of the target on the x axis, in scene units per tick.
 
     t_v_y : float
-        The instantaneous speed of the target on the y axis.
+        The speed of the target on the y axis, in scene units per tick.
 
     Methods
     -------
@@ -86,10 +91,13 @@ class GunTurret(QGraphicsRectItem):
         Creates a large turret.
 
     fixedUpdate()
-        Called every clock signal, this function updates every aspect of the
-        turret.
-        Nota: The turret position is not taken care of by the turret itself, but
-        by its parent.
+        Called by the parent ship while the turret is awake, this function
+        updates every aspect of the turret.
+        Nota: The turret is a child item of its parent ship, placed once at
+        spawn in the ship referential. Qt moves it along with the ship.
+
+    isIdle()
+        Returns True if the turret has nothing to do until it is woken up.
 
     setTarget(targetShip : Ship)
         Sets the target of the turret to be the given Ship object.
@@ -101,6 +109,9 @@ class GunTurret(QGraphicsRectItem):
     rotateToTAzimut()
         Rotates the turret towards target angle.
 
+    sceneCenter()
+        Computes the center of the turret in the scene referential.
+
     setShot(shot_t : string)
         Selects the type of shot to shoot depending on shot_t.
 
@@ -115,7 +126,7 @@ class GunTurret(QGraphicsRectItem):
     fcErrorReduction()
         Gradually reduces the error fc_error depending on fc_e_reduc_rate.
 
-    computeSpawnPos(yposOnTur : int, angleInRad : float)
+    computeSpawnPos(center : QPointF, yposOnTur : int, angleInRad : float)
         Computes the spawn position of a projectile depending on the position
         of the gun in the turret, and the current turret rotation.
 
@@ -130,11 +141,10 @@ class GunTurret(QGraphicsRectItem):
 
     """
 
-    cfg_dict, cfg_txt = Config._file2dict(
+    cfg_dict = ConfigRegistry.view(
         path.join(path.dirname(path.realpath(__file__)), "configs", "turretConfig.py")
     )
 
-    d_shipCenter = 0
     shot_t = "HE"
     azimut = 0
 
@@ -144,6 +154,8 @@ class GunTurret(QGraphicsRectItem):
     t_range = 0
     t_x_1 = t_v_x = 0
     t_y_1 = t_v_y = 0
+    t_tick_1 = 0
+    isAwake = False
 
     def __init__(self, clock, gameScene, parent=None):
         """
@@ -176,8 +188,6 @@ class GunTurret(QGraphicsRectItem):
         self.setFlag(QGraphicsRectItem.ItemIsSelectable, False)
         self.setFlag(QGraphicsRectItem.ItemIsFocusable, False)
 
-        self.clock.clockSignal.connect(self.fixedUpdate)
-
     def __init_instance__(self):
         """
 
@@ -203,8 +213,13 @@ class GunTurret(QGraphicsRectItem):
         self.fc_e_reduc_rate = tech_dat.pc_tech_reduc[self.parentShip.techs["pc_tech"]]
         self.nextShot = self.reload_t
         self.next_fc_correction = self.fc_corr_rate
+        # Ballistic data of the shells fired by this turret #
+        self.shell_dat = Projectile.cfg_dict[
+            {"s": "small", "m": "medium", "l": "large"}[self.shot_s]
+        ]
 
         self.setRect(rect)
+        self.setTransformOriginPoint(rect.center())
 
     @classmethod
     def small(cls, clock, gameScene, parent=None):
@@ -302,8 +317,9 @@ class GunTurret(QGraphicsRectItem):
 
         Summary
         -------
-        Called at each clock signal. Updates all time bound functions like
-        reloading, rotating, firing solution...
+        Called by the parent ship at each clock signal, as long as the turret
+        is awake. Updates all time bound functions like reloading, rotating,
+        firing solution...
 
         """
         if self.nextShot > 0:
@@ -316,17 +332,37 @@ class GunTurret(QGraphicsRectItem):
                 self.next_fc_correction -= 1
             self.computeFiringSolution()
             self.rotateToTAzimut()
-            if (self.t_azimut - self.azimut < 1) | (
-                (self.t_azimut - self.azimut > 359)
-                & (self.t_azimut - self.azimut < 361)
-            ):
+            # Fires as soon as the turret is slewed on the firing solution
+            if abs(geo.smallestAngle(self.t_azimut, self.azimut)) < 1:
                 if self.nextShot <= 0:
                     self.shoot()
                     self.nextShot = self.reload_t
         else:
-            self.t_azimut = self.parentShip.coordinates["heading"]
+            self.t_azimut = self.parentShip.coordinates.heading
             self.rotateToTAzimut()
 
+    def isIdle(self):
+        """
+
+        Returns
+        -------
+        bool
+            True if the turret is idle, False otherwise.
+
+        Summary
+        -------
+        A turret is idle when it has no target, is reloaded and is aligned
+        with its parent ship heading. An idle turret does not need to be
+        updated until it is woken up by its parent ship.
+
+        """
+        return (
+            self.target is None
+            and self.nextShot <= 0
+            and abs(geo.smallestAngle(self.parentShip.coordinates.heading, self.azimut))
+            < 0.001
+        )
+
     def setTarget(self, targetShip):
         """
 
@@ -347,23 +383,30 @@ class GunTurret(QGraphicsRectItem):
         """
         self.target = targetShip
         if self.target:
+            self.parentShip.wakeTurret(self)
             # If there was no target before or the target has changed
             if (self.t_id is None) or (targetShip.data(0) != self.t_id):
                 self.t_id = self.target.data(0)
                 # Stores the position of the target
-                self.t_x_1 = self.target.pos().x()
-                self.t_y_1 = self.target.pos().y()
+                self.t_x_1 = self.target.coordinates.center.x()
+                self.t_y_1 = self.target.coordinates.center.y()
+                self.t_tick_1 = self.clock.world.scheduler.tick
                 # Resets the error on the speed estimation
                 self.fc_error = self.base_fc_error
             # If the target is the same as the previously selected target
             else:
                 # Get the speed from substracting the position of the target at t-1
-                # from its current position (at t)
-                self.t_v_x = self.target.pos().x() - self.t_x_1
-                self.t_v_y = self.target.pos().y() - self.t_y_1
+                # from its current position (at t), over the ticks between both
+                targetCenter = self.target.coordinates.center
+                tick = self.clock.world.scheduler.tick
+                ticks = tick - self.t_tick_1
+                if ticks > 0:
+                    self.t_v_x = (targetCenter.x() - self.t_x_1) / ticks
+                    self.t_v_y = (targetCenter.y() - self.t_y_1) / ticks
                 # Updates the position of the target at t-1
-                self.t_x_1 = self.target.pos().x()
-                self.t_y_1 = self.target.pos().y()
+                self.t_x_1 = targetCenter.x()
+                self.t_y_1 = targetCenter.y()
+                self.t_tick_1 = tick
 
     def computeFiringSolution(self):
         """
@@ -375,39 +418,37 @@ class GunTurret(QGraphicsRectItem):
         Summary
         -------
         Calculates the angle at which to rotate the turret in order to hit a
-        target.
+        target. The intercept point is solved directly, taking into account the
+        deceleration of the shells, so that a single evaluation gives the
+        correct azimut.
 
         """
         shellSpeed = (
-            tech_dat.speeds_shellType[0]
-            if self.shot_t == "AP"
-            else tech_dat.speeds_shellType[1]
+            self.shell_dat["v_AP"] if self.shot_t == "AP" else self.shell_dat["v_HE"]
         )
-        shellSpeed *= self.parentShip.refresh[
-            "refresh_rate"
-        ]  # We accomodate for the fact that the firing soluting is not computed every frame
-        estimatedFlightTime = round(self.t_range / shellSpeed, 4)
+        # The target speed is measured between two target locks, per tick
         estimated_t_speed_x = self.fcREG(self.t_v_x)
         estimated_t_speed_y = self.fcREG(self.t_v_y)
+        targetCenter = self.target.coordinates.center
+        center = self.sceneCenter()
+        dx = targetCenter.x() - center.x()
+        dy = targetCenter.y() - center.y()
         # See docs for more infos on the maths
-        estimatedPos = QPointF(
-            self.target.pos().x() + estimated_t_speed_x * estimatedFlightTime,
-            self.target.pos().y() + estimated_t_speed_y * estimatedFlightTime,
+        flightTime = cin.interceptTime(
+            dx,
+            dy,
+            estimated_t_speed_x,
+            estimated_t_speed_y,
+            shellSpeed,
+            self.shell_dat["decc"],
         )
-        estimatedCenter = geo.parallelepiped_Center(
-            estimatedPos, self.target.rect().width(), self.target.rect().height()
-        )
-        self.t_range = int(geo.distance_A_B(self.pos(), estimatedCenter))
-        a_h = (estimatedCenter.x() - self.pos().x()) / self.t_range
-        # Avoid non definition errors
-        if a_h > 1.0:
-            a_h = 1
-        elif a_h < -1:
-            a_h = -1
-        self.t_azimut = round(math.degrees(math.acos(a_h)), 4)
-        # Determine the sign of the angle
-        if (estimatedCenter.y() - self.pos().y()) < 0:
-            self.t_azimut *= -1
+        # If the target can not be caught, aim at its current position
+        if flightTime is None:
+            flightTime = 0
+        aim_x = dx + estimated_t_speed_x * flightTime
+        aim_y = dy + estimated_t_speed_y * flightTime
+        self.t_range = int(geo.pythagore(aim_x, aim_y))
+        self.t_azimut = round(math.degrees(math.atan2(aim_y, aim_x)), 4)
 
     def rotateToTAzimut(self):
         """
@@ -419,7 +460,8 @@ class GunTurret(QGraphicsRectItem):
         Summary
         -------
         Applies a basic controller to rotate the turret from its current angle
-        to the target angle.
+        to the target angle. The azimut is in the scene referential, the item
+        rotation is relative to the parent ship.
 
         """
         diff = geo.smallestAngle(self.t_azimut, self.azimut)
@@ -427,10 +469,32 @@ class GunTurret(QGraphicsRectItem):
         self.azimut += con.proportional(
             self.t_azimut, self.azimut, self.rot_speed, diff
         )
-        self.setTransformOriginPoint(
-            QPointF(self.rect().width() / 2, self.rect().height() / 2)
+        self.setRotation(self.azimut - self.parentShip.coordinates.heading)
+
+    def sceneCenter(self):
+        """
+
+        Returns
+        -------
+        QPointF
+            The center of the turret in the scene referential.
+
+        Summary
+        -------
+        Computes the center of the turret in the scene referential, from the
+        simulated center and heading of its parent ship rather than from the
+        rendered items. Only called when the turret aims or fires.
+
+        """
+        ship = self.parentShip
+        teta = math.radians(ship.coordinates.heading)
+        offsetX = self.x() + self.rect().width() / 2 - ship.rect().width() / 2
+        offsetY = self.y() + self.rect().height() / 2 - ship.rect().height() / 2
+        center = ship.coordinates.center
+        return QPointF(
+            center.x() + offsetX * math.cos(teta) - offsetY * math.sin(teta),
+            center.y() + offsetX * math.sin(teta) + offsetY * math.cos(teta),
         )
-        self.setRotation(self.azimut)
 
     def setShot(self, shot_type):
         """
@@ -506,11 +570,13 @@ class GunTurret(QGraphicsRectItem):
         if self.fc_error < 0:
             self.fc_error = 0
 
-    def computeSpawnPos(self, yposOnTur, angleInRad):
+    def computeSpawnPos(self, center, yposOnTur, angleInRad):
         """
 
         Parameters
         ----------
+        center : QPointF
+            The center of the turret in the scene referential.
         yposOnTur : int
             The y position of the gun in the turret referential.
         angleInRad : float
@@ -527,11 +593,15 @@ class GunTurret(QGraphicsRectItem):
         of the gun in the turret, and the current turret rotation.
 
         """
-        h = geo.pythagore(self.rect().width(), yposOnTur)
-        teta_offset = math.acos(self.rect().width() / h)
-        teta_t = angleInRad + teta_offset
-        xpos = self.x() + h * math.cos(teta_t)
-        ypos = self.y() + self.rect().height() + h * math.sin(teta_t)
+        # Muzzle of the gun, relative to the turret center
+        offsetX = self.rect().width() / 2
+        offsetY = yposOnTur - self.rect().height() / 2
+        xpos = (
+            center.x() + offsetX * math.cos(angleInRad) - offsetY * math.sin(angleInRad)
+        )
+        ypos = (
+            center.y() + offsetX * math.sin(angleInRad) + offsetY * math.cos(angleInRad)
+        )
         spawnPos = QPointF(xpos, ypos)
         return spawnPos
 
@@ -549,6 +619,7 @@ class GunTurret(QGraphicsRectItem):
         """
         az_rad = math.radians(self.azimut)
         tag = self.parentShip.data(1)
+        center = self.sceneCenter()
 
         for pos in self.guns_pos:
             a = self.gunDispersion()
@@ -566,7 +637,7 @@ class GunTurret(QGraphicsRectItem):
                     self.clock, self.gameScene, tag, self.t_range, a, self.shot_t
                 )
 
-            spawnPos = self.computeSpawnPos(pos, az_rad)
+            spawnPos = self.computeSpawnPos(center, pos, az_rad)
             shot.setZValue(4)
             shot.setPos(spawnPos)
             self.gameScene.addItem(shot)
@@ -624,9 +695,12 @@ class GunTurret(QGraphicsRectItem):
 
         Summary
         -------
-        Instructions to draw the item on the game scene.
+        Instructions to draw the item on the game scene. Not drawn when too
+        small on screen.
 
         """
+        if lod.isHidden(lod.scale(painter), self.rect().width()):
+            return
         painter.setBrush(QBrush(QColor("darkGray")))
         painter.setPen(QPen(QColor("black"), self.thk))
         painter.drawRect(self.rect())
@@ -9,6 +9,17 @@
     Python version: 3.8.1
 """
 
+import math
+
+from os import path
+
+from library.utils.ConfigRegistry import ConfigRegistry
+from library.utils.MathsFormulas import Geometrics as geo
+
+TURRETS_CFG = path.join(
+    path.dirname(path.realpath(__file__)), "configs", "turretConfig.py"
+)
+
 
 class TechsData:
     """
@@ -79,6 +90,534 @@ class TechsData:
     ]  # HE shells have much lower penetration power than AP shells
 
 
+class TargetEvaluationTable:
+    """
+
+    A lookup table of target evaluations, used by ships to select their target.
+
+    ...
+
+    Attributes
+    ----------
+    table : dict
+        The evaluations (potential damage, shot type) keyed by
+        (shell size, guns tech, number of turrets, target type, range bucket).
+
+    bucketSize : int
+        The length of a range bucket. Matches the penetration tables step.
+
+    turretsCfg : dict
+        The turret configs by shell size, read once per battle.
+
+    Methods
+    -------
+    build(ships : list of Ships)
+        Precomputes the evaluations for all pairs of ships in ships.
+
+    rangeBucket(distance : float)
+        Returns the range bucket of distance.
+
+    lookup(shooter : Ship, target : Ship, rangeBucket : int)
+        Returns the evaluation of target by shooter at rangeBucket.
+
+    evaluate(shooter : Ship, target : Ship, rangeBucket : int)
+        Computes the evaluation of target by shooter at rangeBucket.
+
+    """
+
+    table = {}
+    bucketSize = 1000
+    turretsCfg = None
+
+    @classmethod
+    def build(cls, ships):
+        """
+
+        Parameters
+        ----------
+        ships : list of Ships
+            All the ships of the battle.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Precomputes the evaluations for every shooter profile against every
+        target type present in the battle, for all range buckets. To be
+        called once when the battle loads.
+
+        """
+        cls.table.clear()
+        cls.turretsCfg = ConfigRegistry.view(TURRETS_CFG)
+        shooters = {}
+        targets = {}
+
+        for ship in ships:
+            turrets = len(ship.weapons["turrets_list"])
+            shooters[(ship.shellSize, ship.techs["guns_tech"], turrets)] = ship
+            targets[ship.naming["_type"]] = ship
+
+        for shooter in shooters.values():
+            for target in targets.values():
+                for rangeBucket in range(len(shooter.table)):
+                    cls.lookup(shooter, target, rangeBucket)
+
+    @classmethod
+    def rangeBucket(cls, distance):
+        """
+
+        Parameters
+        ----------
+        distance : float
+            The distance between a shooter and its target.
+
+        Returns
+        -------
+        int
+            The index of distance in the penetration table.
+
+        """
+        return int(distance / cls.bucketSize)
+
+    @classmethod
+    def lookup(cls, shooter, target, rangeBucket):
+        """
+
+        Parameters
+        ----------
+        shooter : Ship
+            The ship evaluating the target.
+        target : Ship
+            The ship to evaluate.
+        rangeBucket : int
+            The index of the distance between both ships in the penetration table.
+
+        Returns
+        -------
+        tuple : (potential: float, shot_choice: str)
+
+        Summary
+        -------
+        Returns the evaluation of target by shooter. Evaluations missing from
+        the table are computed and stored.
+
+        """
+        key = (
+            shooter.shellSize,
+            shooter.techs["guns_tech"],
+            len(shooter.weapons["turrets_list"]),
+            target.naming["_type"],
+            rangeBucket,
+        )
+        try:
+            return cls.table[key]
+        except KeyError:
+            evaluation = cls.evaluate(shooter, target, rangeBucket)
+            cls.table[key] = evaluation
+            return evaluation
+
+    @classmethod
+    def evaluate(cls, shooter, target, rangeBucket):
+        """
+
+        Parameters
+        ----------
+        shooter : Ship
+            The ship evaluating the target.
+        target : Ship
+            The ship to evaluate.
+        rangeBucket : int
+            The index of the distance between both ships in the penetration table.
+
+        Returns
+        -------
+        tuple : (potential: float, shot_choice: str)
+
+        Summary
+        -------
+        Computes the minimal amount of damage that shooter can do to target
+        at the middle distance of rangeBucket, and the best suited shot type.
+        The guns of the turrets are read from the turret config of the shell
+        size. A shooter without turrets can do no damage.
+
+        """
+        shot_choice = ""
+        potential = 0
+        p_dat = shooter.p_dat
+        turrets = shooter.weapons["turrets_list"]
+        if not turrets:
+            return (potential, "HE")
+        if cls.turretsCfg is None:
+            cls.turretsCfg = ConfigRegistry.view(TURRETS_CFG)
+        turretCfg = cls.turretsCfg[shooter.shellSize]
+        ##################### COMPUTE HIT PROBABILITY PER SALVO #####################
+        #############################################################################
+        targetDistance = rangeBucket * cls.bucketSize + cls.bucketSize // 2
+        targetArea = round(target.geometry["_width"] * target.geometry["_height"])
+        n_shots = len(turrets) * turretCfg["n_guns"]
+        gun_acc = round(
+            turretCfg["gun_disp"] * TechsData.gun_tech_acc[shooter.techs["guns_tech"]],
+            4,
+        )
+        azimut_error = math.radians(gun_acc)
+        errorOnD = round(p_dat["accy"] * targetDistance)
+        hitArea = round(
+            errorOnD * math.tan(azimut_error) * (2 * targetDistance - errorOnD)
+        )
+        hitChance = min(targetArea / hitArea, 1) if hitArea > 0 else 1
+        hitProbability = round(1 - (1 - hitChance) ** n_shots, 4)
+        #############################################################################
+        #############################################################################
+
+        ####################### CHOOSES BEST SUITED SHOT TYPE #######################
+        #############################################################################
+        penAtDist = shooter.table[min(rangeBucket, len(shooter.table) - 1)]
+        dmgHE = min(
+            int((p_dat["pen_HE"] / target.hull["armor"]) * p_dat["dmg_HE"]),
+            p_dat["dmg_HE"],
+        )
+        if penAtDist > target.hull["armor"]:
+            dmgAP = p_dat["dmg_AP"]
+            if dmgHE > dmgAP:
+                shot_choice = "HE"
+                potential = dmgHE
+            else:
+                shot_choice = "AP"
+                potential = dmgAP
+        else:
+            shot_choice = "HE"
+            potential = dmgHE
+        potential = round(potential * hitProbability)
+        #############################################################################
+        #############################################################################
+        return (potential, shot_choice)
+
+
+class ShipRoster:
+    """
+
+    The roster of all the ships in battle, per team.
+
+    ...
+
+    Methods
+    -------
+    __init__()
+        The constructor of the class.
+
+    add(ship : Ship)
+        Adds ship to the roster of its team.
+
+    remove(ship : Ship)
+        Removes ship from the roster of its team.
+
+    team(tag : str)
+        Returns a live view of the ships of the team tag.
+
+    opponents(tag : str)
+        Iterates over all the ships not in the team tag.
+
+    addListener(listener : callable)
+        Registers a function called with ("ADD" | "REMOVE", ship) on changes.
+
+    removeListener(listener : callable)
+        Unregisters a function registered with addListener.
+
+    clear()
+        Removes all ships and listeners.
+
+    """
+
+    def __init__(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class.
+
+        """
+        self._teams = {}  # Tag -> dict used as an ordered set of ships
+        self._listeners = []
+
+    def add(self, ship):
+        """
+
+        Parameters
+        ----------
+        ship : Ship
+            The ship entering the battle.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Adds ship to the roster of its team and notifies the listeners.
+
+        """
+        self._teams.setdefault(ship.data(1), {})[ship] = None
+        for listener in self._listeners:
+            listener("ADD", ship)
+
+    def remove(self, ship):
+        """
+
+        Parameters
+        ----------
+        ship : Ship
+            The ship leaving the battle.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes ship from the roster of its team and notifies the listeners.
+
+        """
+        team = self._teams.get(ship.data(1))
+        if team is not None and ship in team:
+            del team[ship]
+            for listener in self._listeners:
+                listener("REMOVE", ship)
+
+    def team(self, tag):
+        """
+
+        Parameters
+        ----------
+        tag : str
+            The tag of the team ("ALLY" or "ENNEMY").
+
+        Returns
+        -------
+        KeysView of Ships
+            A live view of the ships of the team.
+
+        """
+        return self._teams.setdefault(tag, {}).keys()
+
+    def opponents(self, tag):
+        """
+
+        Parameters
+        ----------
+        tag : str
+            The tag of the reference team.
+
+        Returns
+        -------
+        generator of Ships
+            All the ships which are not in the team tag.
+
+        """
+        for teamTag, team in self._teams.items():
+            if teamTag != tag:
+                yield from team
+
+    def addListener(self, listener):
+        """
+
+        Parameters
+        ----------
+        listener : callable
+            A function taking an event ("ADD" or "REMOVE") and a Ship.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._listeners.append(listener)
+
+    def removeListener(self, listener):
+        """
+
+        Parameters
+        ----------
+        listener : callable
+            A function registered with addListener.
+
+        Returns
+        -------
+        None.
+
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def clear(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Empties all teams (live views stay valid) and removes all listeners.
+
+        """
+        for team in self._teams.values():
+            team.clear()
+        self._listeners.clear()
+
+
+class ContactTable:
+    """
+
+    A table of the ennemy ships detected by all the ships of a fleet.
+
+    ...
+
+    Attributes
+    ----------
+    version : int
+        Incremented each time a contact is added to or removed from the table.
+
+    Methods
+    -------
+    __init__()
+        The constructor of the class.
+
+    report(reporter : Ship, detectedShips : list of Ships)
+        Updates the table with the ships currently detected by reporter.
+
+    removeReporter(reporter : Ship)
+        Removes all the contacts reported by reporter.
+
+    removeContact(ship : Ship)
+        Removes ship from the contacts, whoever reported it.
+
+    view()
+        Returns a read-only view of all the contacts.
+
+    """
+
+    def __init__(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class.
+
+        """
+        self.version = 0
+        self._contacts = {}  # Contact -> number of ships reporting it
+        self._reports = {}  # Reporter -> set of reported contacts
+        self._view = ()
+        self._viewVersion = 0
+
+    def report(self, reporter, detectedShips):
+        """
+
+        Parameters
+        ----------
+        reporter : Ship
+            The ship reporting its detections.
+        detectedShips : list of Ships
+            The ships currently detected by reporter.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Adds the contacts newly detected by reporter, and removes those it
+        lost if no other ship of the fleet still reports them.
+
+        """
+        newReport = set(detectedShips) if detectedShips else set()
+        oldReport = self._reports.get(reporter, set())
+
+        for ship in newReport - oldReport:
+            if ship in self._contacts:
+                self._contacts[ship] += 1
+            else:
+                self._contacts[ship] = 1
+                self.version += 1
+        for ship in oldReport - newReport:
+            self._contacts[ship] -= 1
+            if self._contacts[ship] <= 0:
+                del self._contacts[ship]
+                self.version += 1
+        self._reports[reporter] = newReport
+
+    def removeReporter(self, reporter):
+        """
+
+        Parameters
+        ----------
+        reporter : Ship
+            A ship that no longer reports contacts.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes all the contacts reported by reporter.
+
+        """
+        self.report(reporter, None)
+        self._reports.pop(reporter)
+
+    def removeContact(self, ship):
+        """
+
+        Parameters
+        ----------
+        ship : Ship
+            A ship that can no longer be a contact (sunk).
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes ship from the contacts and from all the reports.
+
+        """
+        for report in self._reports.values():
+            report.discard(ship)
+        if self._contacts.pop(ship, None) is not None:
+            self.version += 1
+
+    def view(self):
+        """
+
+        Returns
+        -------
+        tuple of Ships
+            All the contacts of the fleet.
+
+        Summary
+        -------
+        Returns a read-only view of the contacts. The view is only rebuilt
+        when the version of the table changed.
+
+        """
+        if self._viewVersion != self.version:
+            self._view = tuple(self._contacts)
+            self._viewVersion = self.version
+        return self._view
+
+
 class RadioCommunications:
     """
 
@@ -89,17 +628,23 @@ class RadioCommunications:
 
     Attributes
     ----------
-    alliedShips : list of Ships
-        A list of all allied ships on the scene.
+    alliedShips : KeysView of Ships
+        A live view of all allied ships on the scene, read from the roster.
 
-    ennemyShips : list of Ships
-        A list of all ennemy ships on the scene.
+    ennemyShips : KeysView of Ships
+        A live view of all ennemy ships on the scene, read from the roster.
 
-    alliedDetectedShips : list of Ships
-        A list of all ennemy ships detected by all allied ships.
+    alliedContacts : ContactTable
+        The table of all ennemy ships detected by all allied ships.
 
-    ennemyDetectedShips : list of Ships
-        A list of all allied ships detected by all ennemy ships.
+    ennemyContacts : ContactTable
+        The table of all allied ships detected by all ennemy ships.
+
+    alliedDetectedShips : tuple of Ships
+        A view of all ennemy ships detected by all allied ships.
+
+    ennemyDetectedShips : tuple of Ships
+        A view of all allied ships detected by all ennemy ships.
 
     radioCommsRate : int
         The period between two radio emmissions.
@@ -109,8 +654,9 @@ class RadioCommunications:
     __init__(mainClock : MainClock, gameScene : GameScene)
         The constructor of the class.
 
-    updateShipLists()
-        Updates the allied ship list and the ennemy ship list.
+    onRosterChange(event : str, ship : Ship)
+        Keeps the contact tables up to date when a ship enters or leaves the
+        battle.
 
     fixedUpdate()
         Performs a radio communication each radioCommsRate.
@@ -122,6 +668,11 @@ class RadioCommunications:
     transmitDetectedShips()
         Transmit to each allied ship a list of all detected ennemy ships.
         Transmit to each ennemy ship a list of all detected allied ships.
+        Nothing is transmitted if the contacts did not change.
+
+    assignTargets(ships : list of Ships, detectedShips : list of Ships)
+        Assigns a target to each ship of a fleet, spreading the fleet damage
+        potential over all the detected ships.
 
     """
 
@@ -148,32 +699,51 @@ class RadioCommunications:
         """
         self.gameScene = gameScene
         self.clock = mainClock
-        self.next_radioComm = self.radioCommsRate
 
-        self.alliedShips = []
-        self.ennemyShips = []
-        self.alliedDetectedShips = []
-        self.ennemyDetectedShips = []
+        self.alliedShips = self.gameScene.roster.team("ALLY")
+        self.ennemyShips = self.gameScene.roster.team("ENNEMY")
+        self.alliedContacts = ContactTable()
+        self.ennemyContacts = ContactTable()
+        self.alliedDetectedShips = ()
+        self.ennemyDetectedShips = ()
+        self.alliedVersionSent = None
+        self.ennemyVersionSent = None
 
-        self.clock.clockSignal.connect(self.fixedUpdate)
+        self.gameScene.roster.addListener(self.onRosterChange)
+        self.clock.world.addComms(self)
 
-    def updateShipLists(self):
+    def onRosterChange(self, event, ship):
         """
 
+        Parameters
+        ----------
+        event : str
+            "ADD" when ship enters the battle, "REMOVE" when it leaves it.
+        ship : Ship
+            The ship concerned by the event.
+
         Returns
         -------
         None.
 
         Summary
         -------
-        Updates the alliedShips list and the ennmyShips list.
+        Gives a new ship the contact table of its fleet. Removes a leaving
+        ship from its fleet contact table, and from the contacts of the
+        opposing fleet.
 
         """
-        for ship in self.gameScene.shipList.values():
-            if ship.data(1) == "ALLY":
-                self.alliedShips.append(ship)
-            else:
-                self.ennemyShips.append(ship)
+        if ship.data(1) == "ALLY":
+            ownContacts, opposingContacts = self.alliedContacts, self.ennemyContacts
+        else:
+            ownContacts, opposingContacts = self.ennemyContacts, self.alliedContacts
+
+        if event == "ADD":
+            ship.contactTable = ownContacts
+        elif event == "REMOVE":
+            ship.contactTable = None
+            ownContacts.removeReporter(ship)
+            opposingContacts.removeContact(ship)
 
     def fixedUpdate(self):
         """
@@ -184,16 +754,14 @@ class RadioCommunications:
 
         Summary
         -------
-        Synchronisation with the game main clock. Each radioCommsRate, performs
+        Scheduled in the comms phase, every radioCommsRate + 1 ticks. Performs
         the 'radio comm' process.
         
         """
-        if self.next_radioComm <= 0:
-            self.gatherDetectedShips()
-            self.transmitDetectedShips()
-            self.next_radioComm = self.radioCommsRate
-        else:
-            self.next_radioComm -= 1
+        self.gatherDetectedShips()
+        self.transmitDetectedShips()
+        self.assignTargets(self.alliedShips, self.alliedDetectedShips)
+        self.assignTargets(self.ennemyShips, self.ennemyDetectedShips)
 
     def gatherDetectedShips(self):
         """
@@ -205,24 +773,12 @@ class RadioCommunications:
         Summary
         -------
         Gather all detected ships from all ships, for allies and ennemies
-        respectively.
+        respectively. The contact tables are kept up to date by the ships
+        scans, only their views are read here.
 
         """
-        tmpADS = []
-        tmpEDS = []
-
-        for ship in self.alliedShips:
-            shipDSList = ship.det_and_range["detected_ships"]
-            tmpADS = tmpADS + shipDSList
-        tmpADS = list(dict.fromkeys(tmpADS))
-
-        for ship in self.ennemyShips:
-            shipDSList = ship.det_and_range["detected_ships"]
-            tmpEDS = tmpEDS + shipDSList
-        tmpEDS = list(dict.fromkeys(tmpEDS))
-
-        self.alliedDetectedShips = tmpADS
-        self.ennemyDetectedShips = tmpEDS
+        self.alliedDetectedShips = self.alliedContacts.view()
+        self.ennemyDetectedShips = self.ennemyContacts.view()
 
     def transmitDetectedShips(self):
         """
@@ -237,7 +793,86 @@ class RadioCommunications:
         ennemies respectively.
 
         """
-        for alliedShip in self.alliedShips:
-            alliedShip.receiveRadioComm(self.alliedDetectedShips)
-        for ennemyShip in self.ennemyShips:
-            ennemyShip.receiveRadioComm(self.ennemyDetectedShips)
+        if self.alliedVersionSent != self.alliedContacts.version:
+            for alliedShip in self.alliedShips:
+                alliedShip.receiveRadioComm(self.alliedDetectedShips)
+            self.alliedVersionSent = self.alliedContacts.version
+        if self.ennemyVersionSent != self.ennemyContacts.version:
+            for ennemyShip in self.ennemyShips:
+                ennemyShip.receiveRadioComm(self.ennemyDetectedShips)
+            self.ennemyVersionSent = self.ennemyContacts.version
+
+    def assignTargets(self, ships, detectedShips):
+        """
+
+        Parameters
+        ----------
+        ships : list of Ships
+            The ships of a fleet.
+        detectedShips : list of Ships
+            The ennemy ships detected by this fleet.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Builds the damage potential matrix (ships x detected ships) and
+        assigns targets greedily: the best pairs are assigned first, and a
+        detected ship stops receiving shooters once the cumulated potential
+        damage exceeds its hp, to avoid overkill. Ships left without target
+        then take their best pair. Ships shoot their assigned target and skip
+        their own target selection. Only the targets within gun range and line
+        of sight are assigned, and the ships with a target designated by the
+        player keep it: their potential damage on it counts against its hp.
+
+        """
+        pairs = []
+        assignments = {}
+        remainingHp = {}
+
+        for target in detectedShips:
+            remainingHp[target] = target.instant_vars.hp
+
+        for ship in ships:
+            assignments[ship] = None
+            if not ship.weapons["turrets_list"]:
+                continue
+            center = ship.coordinates.center
+            if ship.playerTarget:
+                target = ship.playerTarget
+                if target in remainingHp:
+                    distance = geo.distance_A_B(center, target.coordinates.center)
+                    remainingHp[target] -= TargetEvaluationTable.lookup(
+                        ship, target, TargetEvaluationTable.rangeBucket(distance)
+                    )[0]
+                continue
+            for target in detectedShips:
+                targetCenter = target.coordinates.center
+                distance = geo.distance_A_B(center, targetCenter)
+                if distance > ship.weapons["guns_range"]:
+                    continue
+                # The expensive line of sight check is only done within gun range
+                if not ship.gameScene.isInLineOfSight(center, targetCenter, 250):
+                    continue
+                potential, shotType = TargetEvaluationTable.lookup(
+                    ship, target, TargetEvaluationTable.rangeBucket(distance)
+                )
+                if potential > 0:
+                    pairs.append((potential, ship, target, shotType))
+
+        pairs.sort(key=lambda pair: pair[0], reverse=True)
+        for potential, ship, target, shotType in pairs:
+            if assignments[ship] is None and remainingHp[target] > 0:
+                assignments[ship] = (target, shotType)
+                remainingHp[target] -= potential
+        for potential, ship, target, shotType in pairs:
+            if assignments[ship] is None:
+                assignments[ship] = (target, shotType)
+
+        for ship, assignment in assignments.items():
+            if assignment:
+                ship.receiveTargetAssignment(*assignment)
+            else:
+                ship.receiveTargetAssignment()
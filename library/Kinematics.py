@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: Kinematics.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import math
+
+import numpy as np
+
+from PyQt5.QtCore import QPointF
+
+from library.utils.MathsFormulas import (
+    Geometrics as geo,
+    Cinematics as cin,
+    Controllers as con,
+)
+
+
+class KinematicsStore:
+    """
+
+    Holds the kinematic state of all the ships of a battle in arrays, and
+    moves all of them in one vectorized step per tick: speed controller,
+    heading controller and position update. The ships only write their
+    commands (checkpoint, speed options, dodge manoeuvers) in the store, and
+    read back their new state after each step. The Qt items are moved once
+    per rendered frame, by push(), so the geometric queries of the simulation
+    run on the arrays, with shipsAt().
+
+    ...
+
+    Attributes
+    ----------
+    ships : list of Ships
+        The ships of the store. A ship index in the arrays is ship.kinIndex.
+
+    x, y : numpy.ndarray
+        The positions of the ships items (top left corners).
+
+    heading : numpy.ndarray
+        The headings of the ships, in degrees.
+
+    renderX, renderY, renderHeading : numpy.ndarray
+        The positions and headings displayed by the last push().
+
+    speed : numpy.ndarray
+        The speeds of the ships.
+
+    rotDirection : numpy.ndarray
+        -1 when turning to port, 1 to starboard, 0 otherwise.
+
+    cpX, cpY : list of float
+        Command. The current checkpoints of the ships, nan if None.
+
+    steer : list of int
+        Command. -1 to steer to port, 1 to starboard, 0 otherwise.
+
+    dodging : list of bool
+        Command. True if the ship is dodging an obstacle instead of following
+        its path.
+
+    dodgeSpeed : list of float
+        Command. The speed to reach while dodging, nan to keep the current one.
+
+    overrideSpeed : list of float
+        Command. The speed chosen by the player, nan if None.
+
+    defaultSpeed : list of float
+        Command. The speed used when there is no override.
+
+    Methods
+    -------
+    __init__()
+        The constructor of the class.
+
+    add(ship : Ship)
+        Adds a ship to the store.
+
+    remove(ship : Ship)
+        Removes a ship from the store.
+
+    step()
+        Moves all the ships by one tick.
+
+    sync()
+        Writes back the new state of the ships in their state objects.
+
+    shipsAt(x : float, y : float)
+        Returns the ships whose hull contains the point (x, y).
+
+    push(alpha : float)
+        Moves the Qt items of the ships, interpolated between the last two
+        steps.
+
+    """
+
+    _stateArrays = (
+        "x",
+        "y",
+        "prevX",
+        "prevY",
+        "heading",
+        "prevHeading",
+        "speed",
+        "prevSpeed",
+        "renderX",
+        "renderY",
+        "renderHeading",
+    )
+    _constArrays = ("halfWidth", "halfHeight", "turnRate", "maxAccel", "slowSpeed")
+    _commandLists = (
+        "cpX",
+        "cpY",
+        "steer",
+        "dodging",
+        "dodgeSpeed",
+        "overrideSpeed",
+        "defaultSpeed",
+    )
+
+    def __init__(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class.
+
+        """
+        self.ships = []
+        for name in self._stateArrays + self._constArrays:
+            setattr(self, name, np.zeros(0))
+        self.rotDirection = np.zeros(0, dtype=np.int8)
+        self.tolerance = np.zeros(0)
+        for name in self._commandLists:
+            setattr(self, name, [])
+        self.tHeading = np.zeros(0)
+        self.tracking = np.zeros(0, dtype=bool)
+        self.reached = np.zeros(0, dtype=bool)
+
+    def add(self, ship):
+        """
+
+        Parameters
+        ----------
+        ship : Ship
+            The ship to add, already placed in the game scene.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Adds a ship to the store, with its current position, heading and
+        speed, and the constants of its hull. The ship gets a reference to the
+        store, to write its commands.
+
+        """
+        ship.kinematics = self
+        ship.kinIndex = len(self.ships)
+        self.ships.append(ship)
+        pos = ship.pos()
+        ship.coordinates.center = QPointF(
+            pos.x() + ship.rect().width() / 2, pos.y() + ship.rect().height() / 2
+        )
+        ship.coordinates.r_centers = None
+        values = {
+            "x": pos.x(),
+            "y": pos.y(),
+            "prevX": pos.x(),
+            "prevY": pos.y(),
+            "heading": ship.coordinates.heading,
+            "prevHeading": ship.coordinates.heading,
+            "speed": ship.instant_vars.speed,
+            "prevSpeed": ship.instant_vars.speed,
+            "renderX": pos.x(),
+            "renderY": pos.y(),
+            "renderHeading": ship.coordinates.heading,
+            "halfWidth": ship.rect().width() / 2,
+            "halfHeight": ship.rect().height() / 2,
+            "turnRate": ship.hull["turn_rate"],
+            "maxAccel": ship.hull["max_accel"],
+            "slowSpeed": ship.speed_params.speed_options["SLOW"],
+        }
+        for name, value in values.items():
+            setattr(self, name, np.append(getattr(self, name), value))
+        self.rotDirection = np.append(
+            self.rotDirection, ship.coordinates.rot_direction
+        ).astype(np.int8)
+        self.tolerance = np.append(self.tolerance, ship.pathfinding.cp_tolerance)
+        self.cpX.append(math.nan)
+        self.cpY.append(math.nan)
+        self.steer.append(0)
+        self.dodging.append(False)
+        self.dodgeSpeed.append(math.nan)
+        self.overrideSpeed.append(math.nan)
+        self.defaultSpeed.append(0)
+        ship.setTransformOriginPoint(ship.rect().center())
+
+    def remove(self, ship):
+        """
+
+        Parameters
+        ----------
+        ship : Ship
+            The ship to remove.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes a ship from the store. The last ship of the store takes its
+        index.
+
+        """
+        index = ship.kinIndex
+        last = len(self.ships) - 1
+        if index != last:
+            moved = self.ships[last]
+            self.ships[index] = moved
+            moved.kinIndex = index
+            for name in self._stateArrays + self._constArrays:
+                array = getattr(self, name)
+                array[index] = array[last]
+            self.rotDirection[index] = self.rotDirection[last]
+            self.tolerance[index] = self.tolerance[last]
+            for name in self._commandLists:
+                commands = getattr(self, name)
+                commands[index] = commands[last]
+        self.ships.pop()
+        for name in self._stateArrays + self._constArrays:
+            setattr(self, name, getattr(self, name)[:last].copy())
+        self.rotDirection = self.rotDirection[:last].copy()
+        self.tolerance = self.tolerance[:last].copy()
+        for name in self._commandLists:
+            getattr(self, name).pop()
+        ship.kinematics = None
+        ship.kinIndex = None
+
+    def step(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Moves all the ships by one tick. A ship following its path turns
+        towards its checkpoint and adapts its speed to brake before the
+        checkpoint, or to slow down when the checkpoint is inside its turn
+        radius. A dodging ship steers as commanded. Both then move forward.
+
+        """
+        if not self.ships:
+            return
+        self.prevX[:] = self.x
+        self.prevY[:] = self.y
+        self.prevHeading[:] = self.heading
+        self.prevSpeed[:] = self.speed
+        x, y, heading, speed = self.x, self.y, self.heading, self.speed
+        turnRate, maxAccel = self.turnRate, self.maxAccel
+
+        cpX = np.array(self.cpX)
+        cpY = np.array(self.cpY)
+        steer = np.array(self.steer)
+        dodging = np.array(self.dodging, dtype=bool)
+        dodgeSpeed = np.array(self.dodgeSpeed)
+        overrideSpeed = np.array(self.overrideSpeed)
+        defaultSpeed = np.array(self.defaultSpeed, dtype=float)
+        hasCheckpoint = ~np.isnan(cpX)
+        tracking = hasCheckpoint & ~dodging
+
+        centerX = x + self.halfWidth
+        centerY = y + self.halfHeight
+
+        # Heading controller
+        tHeading = np.round(np.degrees(geo.angle_array(centerX, centerY, cpX, cpY)), 4)
+        diff = geo.smallestAngle_array(tHeading, heading)
+        rotDirection = np.where(
+            tracking,
+            np.where(diff < -0.5, -1, np.where(diff > 0.5, 1, 0)),
+            self.rotDirection,
+        )
+        rotDirection = np.where(dodging & (steer != 0), steer, rotDirection)
+        newHeading = heading + np.where(
+            tracking,
+            con.proportional_array(tHeading, heading, turnRate, diff),
+            steer * turnRate,
+        )
+
+        # Speed controller
+        radius = np.trunc((180 * speed) / (math.pi * turnRate))
+        brakeDistance = np.trunc(speed ** 2 / (2 * maxAccel))
+        portX, portY, starboardX, starboardY = cin.rotationCenters_array(
+            centerX, centerY, heading, speed, turnRate
+        )
+        rotCenterX = np.where(rotDirection < 0, portX, starboardX)
+        rotCenterY = np.where(rotDirection < 0, portY, starboardY)
+        inTurnRadius = (rotDirection != 0) & (
+            geo.distance_array(rotCenterX, rotCenterY, cpX, cpY) < radius
+        )
+        noOverride = np.isnan(overrideSpeed)
+        pathSpeed = np.where(noOverride, defaultSpeed, overrideSpeed)
+        targetSpeed = np.where(
+            hasCheckpoint,
+            np.where(
+                geo.distance_array(centerX, centerY, cpX, cpY) <= brakeDistance,
+                0,
+                np.where(inTurnRadius, self.slowSpeed, pathSpeed),
+            ),
+            np.where(noOverride, 0, overrideSpeed),
+        )
+        targetSpeed = np.where(dodging, dodgeSpeed, targetSpeed)
+        newSpeed = np.where(
+            np.isnan(targetSpeed),
+            speed,
+            speed + con.proportional_array(targetSpeed, speed, maxAccel),
+        )
+
+        # Position
+        self.x, self.y = cin.movementBy_array(x, y, newSpeed, np.radians(newHeading))
+        self.heading = newHeading
+        self.speed = newSpeed
+        self.rotDirection = rotDirection.astype(np.int8)
+        self.tHeading = tHeading
+        self.tracking = tracking
+        self.reached = tracking & (
+            (np.abs(self.x + self.halfWidth - cpX) <= self.tolerance)
+            & (np.abs(self.y + self.halfHeight - cpY) <= self.tolerance)
+        )
+
+        # Commands only last one tick
+        n = len(self.ships)
+        self.dodging = [False] * n
+        self.steer = [0] * n
+
+    def sync(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Writes back the new state of the ships in their state objects, selects
+        the next checkpoint of the ships which reached theirs, and wakes the
+        turrets of the ships which turned. The cached center of a ship is only
+        replaced when it moved, and its cached rotation centers are cleared
+        when it moved, turned or changed speed.
+
+        """
+        if not self.ships:
+            return
+        centersX = (self.x + self.halfWidth).tolist()
+        centersY = (self.y + self.halfHeight).tolist()
+        headings = self.heading.tolist()
+        moved = ((self.x != self.prevX) | (self.y != self.prevY)).tolist()
+        turned = (self.heading != self.prevHeading).tolist()
+        accelerated = (self.speed != self.prevSpeed).tolist()
+        speeds = self.speed.tolist()
+        rotDirections = self.rotDirection.tolist()
+        tHeadings = self.tHeading.tolist()
+        tracking = self.tracking.tolist()
+        reached = self.reached.tolist()
+        for i, ship in enumerate(self.ships):
+            coordinates = ship.coordinates
+            if moved[i]:
+                coordinates.center = QPointF(centersX[i], centersY[i])
+            if moved[i] or turned[i] or accelerated[i]:
+                coordinates.r_centers = None
+            coordinates.heading = headings[i]
+            coordinates.rot_direction = rotDirections[i]
+            ship.instant_vars.speed = speeds[i]
+            if tracking[i]:
+                ship.pathfinding.t_heading = tHeadings[i]
+            if reached[i]:
+                ship.pathfinding.checkpoint = None
+                ship.selectNextCheckpoint()
+            if turned[i]:
+                ship.wakeAllTurrets()
+
+    def shipsAt(self, x, y):
+        """
+
+        Parameters
+        ----------
+        x : float
+            The x position of the point in the game scene.
+        y : float
+            The y position of the point in the game scene.
+
+        Returns
+        -------
+        list of Ships
+            The ships whose hull rectangle, at its simulated position and
+            heading, contains the point.
+
+        """
+        if not self.ships:
+            return []
+        dx = x - (self.x + self.halfWidth)
+        dy = y - (self.y + self.halfHeight)
+        heading = np.radians(self.heading)
+        cos = np.cos(heading)
+        sin = np.sin(heading)
+        # The point in the referential of each ship
+        inside = (np.abs(dx * cos + dy * sin) <= self.halfWidth) & (
+            np.abs(dy * cos - dx * sin) <= self.halfHeight
+        )
+        return [self.ships[i] for i in np.flatnonzero(inside)]
+
+    def push(self, alpha):
+        """
+
+        Parameters
+        ----------
+        alpha : float
+            The fraction of a tick elapsed since the last step, in [0, 1].
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Moves the Qt items of the ships, their turrets and gizmos to their
+        positions interpolated between the last two steps.
+
+        """
+        if not self.ships:
+            return
+        self.renderX = self.prevX + (self.x - self.prevX) * alpha
+        self.renderY = self.prevY + (self.y - self.prevY) * alpha
+        self.renderHeading = (
+            self.prevHeading + (self.heading - self.prevHeading) * alpha
+        )
+        xs = self.renderX.tolist()
+        ys = self.renderY.tolist()
+        headings = self.renderHeading.tolist()
+        for i, ship in enumerate(self.ships):
+            ship.pushTransform(xs[i], ys[i], headings[i])
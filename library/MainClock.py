@@ -16,22 +16,31 @@ from PyQt5.QtCore import QObject
 class MainClock(QObject):
     """
 
-    A class to set up the main clock of the game.
+    A class to set up the main clock of the game. The simulation runs at a
+    fixed timestep: each frame, the clock runs as many steps as the real time
+    elapsed demands, then renders the world once.
 
     ...
 
     Attributes
     ----------
     clockSignal : QtCore.pyqtSignal
-        A signal to be emmited by the timer.
+        A signal to be emmited at each simulation step.
 
     elapsedTime : float
-        the total time elapsed since last start of the timer.
+        the total simulated time since the creation of the clock.
+
+    maxStepsPerFrame : int
+        The maximum number of steps run in one frame. Past it, the simulation
+        drops the time it is late rather than trying to catch up forever.
+
+    world : World
+        The battle stepped by the clock. The default is None.
 
     Methods
     -------
     raiseTimeout()
-        Emit a signal with value True on timeout.
+        Steps the world as many times as needed and renders it.
 
     startClock()
         Starts the timer.
@@ -43,16 +52,19 @@ class MainClock(QObject):
 
     clockSignal = QtCore.pyqtSignal(bool)
     elapsedTime = 0  # in ms
+    maxStepsPerFrame = 5
 
-    def __init__(self, period, parent=None):
+    def __init__(self, period, parent=None, framePeriod=16):
         """
 
         Parameters
         ----------
         period : int
-            The time between two signals of the timer.
+            The simulation timestep, in ms.
         parent : QWidget, optional
             Not used. The default is None.
+        framePeriod : int, optional
+            The time between two frames, in ms. The default is 16.
 
         Returns
         -------
@@ -65,9 +77,13 @@ class MainClock(QObject):
         """
         super(MainClock, self).__init__(parent)
 
-        self.fromStop = False
+        self.period = period
+        self.accumulator = 0
+        self.world = None
+        self.elapsed = QtCore.QElapsedTimer()
         self.clock = QtCore.QTimer()
-        self.clock.setInterval(period)
+        self.clock.setTimerType(QtCore.Qt.PreciseTimer)
+        self.clock.setInterval(framePeriod)
         self.clock.timeout.connect(self.raiseTimeout)
 
     @QtCore.pyqtSlot()
@@ -80,13 +96,25 @@ class MainClock(QObject):
 
         Summary
         -------
-        Emits a signal "True" on timeout.
+        Adds the real time elapsed since the last frame to the accumulator, then
+        steps the world and emits a signal "True" once per period accumulated.
+        Finally renders the world, interpolated between its last two steps.
 
         """
-        self.clockSignal.emit(True)
-        self.elapsedTime+=self.clock.interval()
-        if not self.fromStop:
-            self.clock.start()
+        self.accumulator += self.elapsed.restart()
+        steps = 0
+        while self.accumulator >= self.period:
+            if steps >= self.maxStepsPerFrame:
+                self.accumulator %= self.period
+                break
+            if self.world is not None:
+                self.world.step()
+            self.clockSignal.emit(True)
+            self.elapsedTime += self.period
+            self.accumulator -= self.period
+            steps += 1
+        if self.world is not None:
+            self.world.render(self.accumulator / self.period)
 
     @QtCore.pyqtSlot()
     def startClock(self):
@@ -101,8 +129,9 @@ class MainClock(QObject):
         Starts the timer.
 
         """
+        self.accumulator = 0
+        self.elapsed.start()
         self.clock.start()
-        self.fromStop = False
 
     @QtCore.pyqtSlot()
     def stopClock(self):
@@ -114,8 +143,9 @@ class MainClock(QObject):
 
         Summary
         -------
-        Stops the timer
+        Stops the timer, leaving the world at its last simulated state.
 
         """
         self.clock.stop()
-        self.fromStop = True
+        if self.world is not None:
+            self.world.render(1)
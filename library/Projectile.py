@@ -18,7 +18,8 @@ from PyQt5.QtCore import QRectF
 from PyQt5.QtGui import QPen, QBrush, QColor
 from PyQt5.QtWidgets import QGraphicsRectItem
 
-from library.utils.Config import Config
+from library.displays.LevelOfDetail import LevelOfDetail as lod
+from library.utils.ConfigRegistry import ConfigRegistry
 from library.utils.MathsFormulas import Cinematics as cin
 
 
@@ -50,6 +51,12 @@ class Projectile(QGraphicsRectItem):
         Moves the projectile in the direction of its rotation according to its
         speed.
 
+    checkImpact()
+        Destroys the projectile on impact, damaging the ship hit.
+
+    destroy()
+        Removes the projectile from the battle.
+
     range_rng(_range : int)
         Returns a random distance within the target range +/- dispersion interval.
 
@@ -70,7 +77,7 @@ class Projectile(QGraphicsRectItem):
 
     """
 
-    cfg_dict, cfg_text = Config._file2dict(
+    cfg_dict = ConfigRegistry.view(
         path.join(
             path.dirname(path.realpath(__file__)), "configs", "projectileConfig.py"
         )
@@ -106,7 +113,7 @@ class Projectile(QGraphicsRectItem):
         self.gameScene = gameScene
         self._type = _type
 
-        self.clock.clockSignal.connect(self.move)
+        self.clock.world.addProjectile(self)
 
     def __init_instance__(self, tag, _range, _rotation):
         """
@@ -283,26 +290,61 @@ class Projectile(QGraphicsRectItem):
 
         Summary
         -------
-        Calculate the new position of the projectile according to its speed and
-        rotation, and move the object to that new position.
+        Projectiles phase of a tick. Calculate the new position of the projectile
+        according to its speed and rotation, and move the object to that new
+        position.
 
         """
         rot_rad = math.radians(self._rotation)
         nextPos = cin.movementBy(self.pos(), self.v, rot_rad)
         self.cur_d += self.v
         if (self.cur_d >= self.m_range) | (self.cur_d >= self.eff_range):
-            self.gameScene.destroyObject(self)
+            self.destroy()
         else:
             self.setPos(nextPos)
             self.v_decrease()
             if self._type == "AP":
                 self.pen_decrease()
-            for item in self.collidingItems():
-                if item.data(3) == "TERRAIN":
-                    self.gameScene.destroyObject(self)
-                elif (item.data(3) == "SHIP") and (item.data(1) != self.data(1)):
-                    self.onImpact(item)
-                    self.gameScene.destroyObject(self)
+
+    def checkImpact(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Damage phase of a tick. Destroys the projectile if it hit the terrain
+        or an ennemy ship, damaging the ship. The ships are tested at their
+        simulated state, in the kinematics store.
+
+        """
+        for item in self.collidingItems():
+            if item.data(3) == "TERRAIN":
+                self.destroy()
+                return
+        center = self.mapToScene(self.rect().center())
+        for ship in self.clock.world.kinematics.shipsAt(center.x(), center.y()):
+            if ship.data(1) != self.data(1):
+                self.onImpact(ship)
+                self.destroy()
+                return
+
+    def destroy(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes the projectile from the battle and from the game scene.
+
+        """
+        self.clock.world.removeProjectile(self)
+        self.gameScene.destroyObject(self)
 
     def range_rng(self, _range):
         """
@@ -414,9 +456,12 @@ class Projectile(QGraphicsRectItem):
 
         Summary
         -------
-        Instructions to draw the item on the game scene.
+        Instructions to draw the item on the game scene. Not drawn when too
+        small on screen.
 
         """
+        if lod.isHidden(lod.scale(painter), self.rect().width()):
+            return
         painter.setBrush(QBrush(QColor(self.colors[0])))
         painter.setPen(QPen(QColor(self.colors[1]), self.thk))
         painter.drawRect(self.rect())
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: Scheduler.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import time
+
+
+class ScheduledJob:
+    """
+
+    A periodic job of the task scheduler.
+
+    ...
+
+    Attributes
+    ----------
+    phase : str
+        The phase of the tick the job runs in.
+
+    callback : callable
+        The function called when the job is due.
+
+    period : int
+        The number of ticks between two runs of the job.
+
+    lowPriority : bool
+        If True, the job is deferred when the tick is over budget.
+
+    cancelled : bool
+        True once the job has been cancelled.
+
+    Methods
+    -------
+    __init__(phase : str, callback : callable, period : int, lowPriority : bool,
+             slot : int)
+        The constructor of the class.
+
+    """
+
+    def __init__(self, phase, callback, period, lowPriority, slot):
+        """
+
+        Parameters
+        ----------
+        phase : str
+            The phase of the tick the job runs in.
+        callback : callable
+            The function called when the job is due.
+        period : int
+            The number of ticks between two runs of the job.
+        lowPriority : bool
+            If True, the job is deferred when the tick is over budget.
+        slot : int
+            The phase offset of the job, in [0, period[.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class.
+
+        """
+        self.phase = phase
+        self.callback = callback
+        self.period = period
+        self.lowPriority = lowPriority
+        self.slot = slot
+        self.cancelled = False
+
+
+class TaskScheduler:
+    """
+
+    Runs periodic jobs, spreading the jobs of same phase and period evenly
+    over the ticks, so that jobs created at the same time do not all land on
+    the same tick. Low priority jobs are deferred to the next tick when the
+    current tick already used its time budget.
+
+    ...
+
+    Attributes
+    ----------
+    budget : float
+        The time a tick may use before low priority jobs are deferred, in s.
+
+    tick : int
+        The current tick.
+
+    Methods
+    -------
+    __init__(budget[0.010] : float)
+        The constructor of the class.
+
+    schedule(phase : str, callback : callable, period : int,
+             lowPriority[False] : bool)
+        Schedules callback to be called every period ticks, in phase.
+
+    cancel(job : ScheduledJob)
+        Stops a scheduled job.
+
+    startTick()
+        Starts a new tick.
+
+    run(phase : str)
+        Runs the jobs of phase due this tick.
+
+    """
+
+    def __init__(self, budget=0.010):
+        """
+
+        Parameters
+        ----------
+        budget : float, optional
+            The time a tick may use before low priority jobs are deferred, in s.
+            The default is 0.010.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class.
+
+        """
+        self.budget = budget
+        self.tick = 0
+        self._tickStart = 0
+        self._due = {}  # Phase -> {tick: list of jobs}
+        self._load = {}  # (phase, period) -> number of jobs per slot
+
+    def schedule(self, phase, callback, period, lowPriority=False):
+        """
+
+        Parameters
+        ----------
+        phase : str
+            The phase of the tick the job runs in.
+        callback : callable
+            The function called when the job is due.
+        period : int
+            The number of ticks between two runs of the job.
+        lowPriority : bool, optional
+            If True, the job is deferred when the tick is over budget.
+            The default is False.
+
+        Returns
+        -------
+        job : ScheduledJob
+            The job, to be cancelled later.
+
+        Summary
+        -------
+        Schedules callback every period ticks. The job is given the least
+        loaded phase offset among the jobs of same phase and period.
+
+        """
+        period = max(1, int(period))
+        load = self._load.setdefault((phase, period), [0] * period)
+        slot = load.index(min(load))
+        load[slot] += 1
+
+        job = ScheduledJob(phase, callback, period, lowPriority, slot)
+        firstTick = self.tick + 1 + (slot - self.tick - 1) % period
+        self._push(job, firstTick)
+        return job
+
+    def cancel(self, job):
+        """
+
+        Parameters
+        ----------
+        job : ScheduledJob
+            The job to stop.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Stops a scheduled job. It is dropped the next time it is due.
+
+        """
+        if not job.cancelled:
+            job.cancelled = True
+            self._load[(job.phase, job.period)][job.slot] -= 1
+
+    def _push(self, job, tick):
+        self._due.setdefault(job.phase, {}).setdefault(tick, []).append(job)
+
+    def startTick(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Starts a new tick and its time budget.
+
+        """
+        self.tick += 1
+        self._tickStart = time.perf_counter()
+
+    def run(self, phase):
+        """
+
+        Parameters
+        ----------
+        phase : str
+            The phase being run.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Calls the jobs of phase due this tick, and schedules their next run.
+        Once the tick is over budget, low priority jobs are moved to the next
+        tick instead.
+
+        """
+        dueJobs = self._due.get(phase)
+        if not dueJobs:
+            return
+        jobs = dueJobs.pop(self.tick, None)
+        if not jobs:
+            return
+        tick = self.tick
+        deadline = self._tickStart + self.budget
+        for job in jobs:
+            if job.cancelled:
+                continue
+            if job.lowPriority and time.perf_counter() > deadline:
+                self._push(job, tick + 1)
+                continue
+            job.callback()
+            if not job.cancelled:
+                self._push(job, tick + job.period)
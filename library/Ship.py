@@ -19,9 +19,21 @@ from PyQt5.QtGui import QColor, QPen, QBrush, QCursor
 from PyQt5.QtWidgets import QGraphicsItem, QGraphicsRectItem
 
 from library.GunTurret import GunTurret as tur
-from library.InGameData import TechsData as tech_dat
+from library.InGameData import (
+    TechsData as tech_dat,
+    TargetEvaluationTable as eval_table,
+)
+from library.displays.LevelOfDetail import LevelOfDetail as lod
+from library.ShipState import (
+    Coordinates,
+    InstantVars,
+    Pathfinding,
+    DetectionState,
+    SpeedParams,
+    RefreshRates,
+)
 from library.utils import HEAP
-from library.utils.Config import Config
+from library.utils.ConfigRegistry import ConfigRegistry
 from library.utils.MathsFormulas import (
     Geometrics as geo,
     Cinematics as cin,
@@ -52,32 +64,41 @@ class Ship(QGraphicsRectItem):
              mapSlicing : int)
         Constructor of the class.
 
-    fixedUpdate()
-        Updates the ship state.
+    scheduleJobs(scheduler : TaskScheduler)
+        Schedules the periodic work of the ship.
 
-    hoverMoveEvent(mousePos)
-        Changes the appearance of the cursor, display hp informations.
+    cancelJobs(scheduler : TaskScheduler)
+        Cancels the periodic work of the ship.
 
-    mousePressEvent(mousePos)
-        Prints the position of the ship at click.
+    sense()
+        Performs a radar scan.
 
-    updateCenter()
-        Gets the current position of the ship center and stores it.
+    lockTarget()
+        Gives the turrets a target.
 
-    updateRCenters()
-        Updates the rotation centers (left and right) positions.
+    navigate()
+        Movement phase of a tick: moves the ship along its path.
 
-    reachSpeed(speedOption : string)
-        Applies a controller to reach the speed indicated by SpeedOption.
+    refreshPath()
+        Updates the path to the target point.
+
+    printDebugPoints()
+        Adds the ship center and rotation center to the debug overlay trail.
 
-    setSpeed()
-        Sets the speed for the ship to reach.
+    rotationCenters()
+        Returns the cached rotation centers of the ship.
 
-    computeHeading()
-        Computes the angle for the ship to reach.
+    syncDisplay()
+        Ui sync phase of a tick: hides the gizmos of an unselected ship.
 
-    rotateToHeading()
-        Applies a controller to rotate the ship until self.t_heading is reached.
+    hoverMoveEvent(mousePos)
+        Changes the appearance of the cursor, display hp informations.
+
+    mousePressEvent(mousePos)
+        Prints the position of the ship at click.
+
+    reachSpeed(speedOption : string)
+        Commands the speed indicated by SpeedOption while dodging.
 
     updatePath()
         Updates the trajectory by calling the Astar with the new position of th ship.
@@ -89,21 +110,28 @@ class Ship(QGraphicsRectItem):
     selectNextCheckpoint()
         Selects the next checkpoint to be reached in the trajectory list.
 
-    checkpointInTurnRadius()
-        Checks if the next checkpoint to reach is within the hardest turn radius.
+    pushTransform(x : float, y : float, heading : float)
+        Moves the ship item, and with it its turrets, and its gizmos in the
+        game scene.
+
+    wakeTurret(turret : GunTurret)
+        Adds turret to the list of turrets updated each clock signal.
 
-    updateTurretPos()
-        Update the ships turrets positions according to its position and rotation in the game scene.
+    wakeAllTurrets()
+        Wakes all the turrets of the ship.
 
-    move()
-        Updates the ship position in the game scene according to its speed and rotation.
+    updateTurrets()
+        Updates the awake turrets, puts the idle ones back to sleep.
 
     scan()
         Callback to GameScene shipsIndetectionRange function. Gets a list of all ships within
         detection range who have a different tag.
 
     receiveRadioComm(infosList : list)
-        Sets det_and_range["rcom_ships"] to infosList. Receives a list of all ennemy ships detected by all allied ships.
+        Sets det_and_range.rcom_ships to infosList. Receives a list of all ennemy ships detected by all allied ships.
+
+    receiveTargetAssignment(targetShip[None] : Ship, shotType[None] : str)
+        Receives the target assigned to this ship by the fleet.
 
     computeShipsInRange()
         Computes the list list of all detected ships which are withing the ships gun range.
@@ -111,6 +139,9 @@ class Ship(QGraphicsRectItem):
     autoSelectTarget()
         Uses an algorithm to determine the best target to shoot at.
 
+    sink()
+        Removes the ship from the battle.
+
     repair()
         Repairs a ship core component.
 
@@ -154,50 +185,59 @@ class Ship(QGraphicsRectItem):
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setFlag(QGraphicsItem.ItemIsFocusable, True)
 
-        self.clock.clockSignal.connect(self.fixedUpdate)
-
     def __init_instance__(self, tag, pos, rotation=None):
+        self.coordinates = Coordinates.fromConfig(self.coordinates)
+        self.instant_vars = InstantVars.fromConfig(self.instant_vars)
+        self.pathfinding = Pathfinding.fromConfig(self.pathfinding)
+        self.det_and_range = DetectionState.fromConfig(self.det_and_range)
+        self.speed_params = SpeedParams.fromConfig(self.speed_params)
+        self.refresh = RefreshRates.fromConfig(self.refresh)
+
         rect = QRectF(0, 0, self.geometry["_width"], self.geometry["_height"])
-        self.coordinates["center"] = QPointF()
-        self.instant_vars["hp"] = self.hull["max_hp"]
-        self.instant_vars["shield"] = self.hull["max_shield"]
-        self.instant_vars["concealement"] = self.hull["base_concealement"]
-        self.instant_vars["detection_range"] = (
+        self.coordinates.center = QPointF()
+        self.instant_vars.hp = self.hull["max_hp"]
+        self.instant_vars.shield = self.hull["max_shield"]
+        self.instant_vars.concealement = self.hull["base_concealement"]
+        self.instant_vars.detection_range = (
             self.hull["base_detection_range"]
             + self.hull["base_detection_range"]
             * tech_dat.radar_tech_aug[self.techs["radar_tech"]]
         )
-        self.speed_params["speed_options"] = {
+        self.speed_params.speed_options = {
             "AHEAD_FULL": self.hull["max_speed"],
             "FAST": int(2 * self.hull["max_speed"] / 3),
             "SLOW": int(self.hull["max_speed"] / 3),
             "STOP": 0,
         }
-        self.det_and_range["det_r_range"] = cin.rotationRadius(
-            self.speed_params["speed_options"]["SLOW"], self.hull["turn_rate"]
+        self.det_and_range.det_r_range = cin.rotationRadius(
+            self.speed_params.speed_options["SLOW"], self.hull["turn_rate"]
         )
-        self.det_and_range["fleet_detected_ships"] = []
-        self.discoveredShips = []
+        self.det_and_range.fleet_detected_ships = set()
+        self.discoveredShips = set()
+        self.contactTable = None
+        self.contactsChanged = True
+        self.awakeTurrets = []
 
         p_cfg = path.join(
             path.dirname(path.realpath(__file__)), "configs/projectileConfig.py"
         )
-        all_p_dat, _ = Config._file2dict(p_cfg)
+        all_p_dat = ConfigRegistry.view(p_cfg)
         table_cfg = path.join(
             path.dirname(path.realpath(__file__)), "configs/penetrationTable.py"
         )
-        all_table, _ = Config._file2dict(table_cfg)
+        all_table = ConfigRegistry.view(table_cfg)
         if self.naming["_type"] == "BB":
-            self.p_dat = all_p_dat["large"]
-            self.table = all_table["large"]
+            self.shellSize = "large"
         elif self.naming["_type"] == "CA":
-            self.p_dat = all_p_dat["medium"]
-            self.table = all_table["medium"]
+            self.shellSize = "medium"
         else:
-            self.p_dat = all_p_dat["small"]
-            self.table = all_table["small"]
+            self.shellSize = "small"
+        self.p_dat = all_p_dat[self.shellSize]
+        self.table = all_table[self.shellSize]
         self.currentTurret = None
         self.playerTarget = None
+        self.assignedTarget = None
+        self.assignedShot = None
         self.follow_ship = None
 
         self.setData(1, tag)
@@ -251,100 +291,63 @@ class Ship(QGraphicsRectItem):
 
         return pt
 
-    def fixedUpdate(self):
+    def scheduleJobs(self, scheduler):
         """
 
+        Parameters
+        ----------
+        scheduler : TaskScheduler
+            The task scheduler of the battle.
+
         Returns
         -------
         None.
 
         Summary
         -------
-        Updates the ship at each clock signal.
+        Schedules the periodic work of the ship: radar scans, target locks,
+        path updates and debug points.
+
+        """
+        self.jobs = [
+            scheduler.schedule("SENSING", self.sense, self.refresh.refresh_rate + 1),
+            scheduler.schedule(
+                "TARGETING", self.lockTarget, self.refresh.refresh_rate + 1
+            ),
+            scheduler.schedule(
+                "MOVEMENT", self.refreshPath, self.refresh.path_update_rate + 1
+            ),
+            scheduler.schedule(
+                "MOVEMENT",
+                self.printDebugPoints,
+                self.refresh.print_point_rate + 1,
+                lowPriority=True,
+            ),
+        ]
 
+    def cancelJobs(self, scheduler):
         """
-        self.updateCenter()
-        self.updateRCenters()
-        obs_det_results = self.dynamicObjectDetection()
-        if obs_det_results:
-            self.dodgeManoeuver(obs_det_results)
-        else:
-            self.move()
-
-        # Debug display #
-        if self.iterators["next_point_print"] <= 0:
-            self.gameScene.printPoint(self.coordinates["center"], 100, "blue", True)
-            if self.coordinates["rot_direction"] < 0:
-                self.gameScene.printPoint(
-                    self.coordinates["r_centers"][0], 100, "blue", True
-                )
-            elif self.coordinates["rot_direction"] > 0:
-                self.gameScene.printPoint(
-                    self.coordinates["r_centers"][1], 100, "blue", True
-                )
-            self.iterators["next_point_print"] = self.refresh["print_point_rate"]
-        else:
-            self.iterators["next_point_print"] -= 1
-        ##################
-        # If follow mode, update target point to new target ship pos:
-        if self.follow_ship:
-            self.pathfinding["targetPoint"] = self.follow_ship.pos()
-        # Test if the target point of the pathfinding has been reached
-        if self.checkpointReached(self.pathfinding["targetPoint"], True) is False:
-            if (self.iterators["next_path_update"] <= 0) & (
-                self.pathfinding["targetPoint"] is not None
-            ):
-                try:
-                    self.updatePath()
-                except Exception as e:
-                    print("WARNING: Skipped a path update.\n", e)
-                self.iterators["next_path_update"] = self.refresh["path_update_rate"]
-            else:
-                self.iterators["next_path_update"] -= 1
 
-        # Test to launch a radar scan (gets all ships in detection range)
-        if self.iterators["next_radar_scan"] <= 0:
-            self.scan()
-            self.addNewTargets()
-            self.iterators["next_radar_scan"] = self.refresh["refresh_rate"]
-        else:
-            self.iterators["next_radar_scan"] -= 1
+        Parameters
+        ----------
+        scheduler : TaskScheduler
+            The task scheduler of the battle.
 
-        # Test to acquire the best target
-        if self.iterators["next_target_lock"] <= 0:
-            for turret in self.weapons["turrets_list"]:
-                if self.playerTarget:
-                    if self.isTargetable(self.playerTarget):
-                        turret.setTarget(self.playerTarget)
-                    elif (
-                        self.playerTarget in self.det_and_range["fleet_detected_ships"]
-                    ):
-                        self.updatePath(self.attack_move())
-                    else:
-                        self.playerTarget = None
-                else:
-                    try:
-                        targetShip, shotType = self.autoSelectTarget()
-                        turret.setTarget(targetShip)
-                        turret.setShot(shotType)
-                    except:
-                        pass
-            self.iterators["next_target_lock"] = self.refresh["refresh_rate"]
-        else:
-            self.iterators["next_target_lock"] -= 1
+        Returns
+        -------
+        None.
 
-        # Test to hide the range circles
-        if self.isSelected() is False:
-            for gizmo in self.displays.values():
-                gizmo.hide()
+        Summary
+        -------
+        Cancels the periodic work of the ship.
 
-    def hoverMoveEvent(self, mousePos):
         """
+        for job in self.jobs:
+            scheduler.cancel(job)
+        self.jobs = []
 
-        Parameters
-        ----------
-        mousePos : QEvent
-            An event indicating that the mouse was moved over the item..
+    def sense(self):
+        """
 
         Returns
         -------
@@ -352,26 +355,15 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Changes the apperance of the cursor and display basic infos.
+        Scheduled in the sensing phase. Performs a radar scan and adds the new
+        contacts to the potential targets.
 
         """
-        self.setCursor(QCursor(Qt.PointingHandCursor))
-        # Display an information bubble
-        info = (
-            self.naming["_type"]
-            + str(self.data(0))
-            + "  "
-            + "HP: "
-            + str(self.instant_vars["hp"])
-        )
-        super().setToolTip(info)
+        self.scan()
+        self.addNewTargets()
 
-    def mousePressEvent(self, mouseDown):
+    def lockTarget(self):
         """
-        Parameters
-        ----------
-        mouseDown: QMouseEvent
-            A signal indicating that a mouse button was pressed.
 
         Returns
         -------
@@ -379,13 +371,33 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Prints the postion of the item. Displays the range circles.
+        Scheduled in the targeting phase. Gives the turrets a target: the player
+        target first, then the target assigned by the fleet, then the best
+        target found by the ship itself.
 
         """
-        for gizmo in self.displays.values():
-            gizmo.show()
+        if self.playerTarget:
+            if self.isTargetable(self.playerTarget):
+                for turret in self.weapons["turrets_list"]:
+                    turret.setTarget(self.playerTarget)
+            elif self.playerTarget in self.det_and_range.fleet_detected_ships:
+                self.updatePath(self.attack_move())
+            else:
+                self.playerTarget = None
+        elif self.assignedTarget and self.isTargetable(self.assignedTarget):
+            for turret in self.weapons["turrets_list"]:
+                turret.setTarget(self.assignedTarget)
+                turret.setShot(self.assignedShot)
+        else:
+            try:
+                targetShip, shotType = self.autoSelectTarget()
+                for turret in self.weapons["turrets_list"]:
+                    turret.setTarget(targetShip)
+                    turret.setShot(shotType)
+            except:
+                pass
 
-    def updateCenter(self):
+    def navigate(self):
         """
 
         Returns
@@ -394,14 +406,37 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Updates the position of the ship center.
+        Movement phase of a tick. Writes the movement commands of the ship in
+        the kinematics store, dodging obstacles, and checks if its target point
+        has been reached. The ship is moved by the next kinematics step.
 
         """
-        self.coordinates["center"] = geo.parallelepiped_Center(
-            self.pos(), self.rect().width(), self.rect().height()
+        kinematics = self.kinematics
+        i = self.kinIndex
+        checkpoint = self.pathfinding.checkpoint
+        if checkpoint is None:
+            kinematics.cpX[i] = kinematics.cpY[i] = math.nan
+        else:
+            kinematics.cpX[i] = checkpoint.x()
+            kinematics.cpY[i] = checkpoint.y()
+        speedOptions = self.speed_params.speed_options
+        speedOverride = self.speed_params.speed_user_override
+        kinematics.overrideSpeed[i] = (
+            speedOptions[speedOverride] if speedOverride else math.nan
         )
+        kinematics.defaultSpeed[i] = speedOptions[self.speed_params.default_speed]
+
+        obs_det_results = self.dynamicObjectDetection()
+        if obs_det_results:
+            self.dodgeManoeuver(obs_det_results)
+
+        # If follow mode, update target point to new target ship pos:
+        if self.follow_ship:
+            self.pathfinding.targetPoint = QPointF(self.follow_ship.coordinates.center)
+        # Clears the target point of the pathfinding once reached
+        self.checkpointReached(self.pathfinding.targetPoint, True)
 
-    def updateRCenters(self):
+    def refreshPath(self):
         """
 
         Returns
@@ -410,47 +445,64 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Updates the position od the ship rotation centers.
+        Scheduled in the movement phase. Updates the path to the target point,
+        if any.
 
         """
-        self.coordinates["r_centers"] = cin.rotationCenters(
-            self.coordinates["center"],
-            self.coordinates["heading"],
-            self.instant_vars["speed"],
-            self.hull["turn_rate"],
-        )
+        if self.pathfinding.targetPoint is not None:
+            try:
+                self.updatePath()
+            except Exception as e:
+                print("WARNING: Skipped a path update.\n", e)
 
-    def reachSpeed(self, speedOption):
+    def printDebugPoints(self):
         """
 
-        Parameters
-        ----------
-        speedOption : string
-            A string corresponding to a key of the speed_option dictionary.
-
         Returns
         -------
         None.
 
         Summary
         -------
-        Tries to reach the discrete speed value corresponding to speedOption.
+        Scheduled in the movement phase, with a low priority. Adds the center
+        and the current rotation center of the ship to the debug overlay trail,
+        when the overlay is enabled.
 
         """
-        targetSpeed = 0
+        overlay = self.gameScene.debugOverlay
+        if not overlay.enabled:
+            return
+        overlay.addTrailPoint(self.coordinates.center, 100, "blue")
+        if self.coordinates.rot_direction < 0:
+            overlay.addTrailPoint(self.rotationCenters()[0], 100, "blue")
+        elif self.coordinates.rot_direction > 0:
+            overlay.addTrailPoint(self.rotationCenters()[1], 100, "blue")
 
-        if speedOption is None:
-            targetSpeed = self.speed_params["speed_options"][
-                self.speed_params["default_speed"]
-            ]
-        else:
-            targetSpeed = self.speed_params["speed_options"][speedOption]
+    def rotationCenters(self):
+        """
 
-        self.instant_vars["speed"] += con.proportional(
-            targetSpeed, self.instant_vars["speed"], self.hull["max_accel"]
-        )
+        Returns
+        -------
+        list of QPointF
+            The port and starboard rotation centers of the ship.
+
+        Summary
+        -------
+        Returns the rotation centers of the ship. They are cached in
+        coordinates.r_centers, and only recomputed after the kinematics store
+        cleared them because the ship moved, turned or changed speed.
+
+        """
+        if self.coordinates.r_centers is None:
+            self.coordinates.r_centers = cin.rotationCenters(
+                self.coordinates.center,
+                self.coordinates.heading,
+                self.instant_vars.speed,
+                self.hull["turn_rate"],
+            )
+        return self.coordinates.r_centers
 
-    def setSpeed(self):
+    def syncDisplay(self):
         """
 
         Returns
@@ -459,67 +511,47 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Sets the speed that the ship should reach.
+        Ui sync phase of a tick. Hides the range circles of an unselected ship.
 
         """
-        if self.pathfinding["checkpoint"] is None:
-            if self.speed_params["speed_user_override"]:
-                self.reachSpeed(self.speed_params["speed_user_override"])
-                # print("User overridde:", self.speed_user_override)
-            else:
-                self.reachSpeed("STOP")
-                # print("No user override, using: STOP because no further checkpoints.")
-        else:
-            # print("Remaining distance to checkpoint:", geo.distance_A_B(self.center, self.checkpoint))
-            brakeD = cin.brakeDistance(
-                self.instant_vars["speed"], -self.hull["max_accel"]
-            )
-            if (
-                geo.distance_A_B(
-                    self.coordinates["center"], self.pathfinding["checkpoint"]
-                )
-                <= brakeD
-            ):
-                self.reachSpeed("STOP")
-            elif self.checkpointInTurnRadius() is False:
-                # print("Slowing down to match checkpoint")
-                self.reachSpeed("SLOW")
-            else:
-                if self.speed_params["speed_user_override"]:
-                    # print("No brake triggers. Using user overridde:", self.speed_user_override)
-                    self.reachSpeed(self.speed_params["speed_user_override"])
-                else:
-                    # print("No brake triggers. No user override. Using default speed:", self.speed_params["default_speed"])
-                    self.reachSpeed(self.speed_params["default_speed"])
+        if self.isSelected() is False:
+            for gizmo in self.displays.values():
+                gizmo.hide()
 
-    def computeHeading(self):
+    def hoverMoveEvent(self, mousePos):
         """
 
+        Parameters
+        ----------
+        mousePos : QEvent
+            An event indicating that the mouse was moved over the item..
+
         Returns
         -------
         None.
 
         Summary
         -------
-        Computes the rotation angle to apply in order to reach the next checkpoint.
+        Changes the apperance of the cursor and display basic infos.
 
         """
-        distance = geo.distance_A_B(
-            self.coordinates["center"], self.pathfinding["checkpoint"]
+        self.setCursor(QCursor(Qt.PointingHandCursor))
+        # Display an information bubble
+        info = (
+            self.naming["_type"]
+            + str(self.data(0))
+            + "  "
+            + "HP: "
+            + str(self.instant_vars.hp)
         )
-        a_h = (
-            self.pathfinding["checkpoint"].x() - self.coordinates["center"].x()
-        ) / distance
-        if a_h > 1.0:
-            a_h = 1
-        elif a_h < -1:
-            a_h = -1
-        self.pathfinding["t_heading"] = round(math.degrees(math.acos(a_h)), 4)
-        if (self.pathfinding["checkpoint"].y() - self.coordinates["center"].y()) < 0:
-            self.pathfinding["t_heading"] *= -1
+        super().setToolTip(info)
 
-    def rotateToHeading(self):
+    def mousePressEvent(self, mouseDown):
         """
+        Parameters
+        ----------
+        mouseDown: QMouseEvent
+            A signal indicating that a mouse button was pressed.
 
         Returns
         -------
@@ -527,26 +559,33 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Applies a basic controller to rotate the ship from its current heading
-        to the target heading.
+        Prints the postion of the item. Displays the range circles.
 
         """
-        diff = geo.smallestAngle(
-            self.pathfinding["t_heading"], self.coordinates["heading"]
-        )
-        if diff < -0.5:
-            self.coordinates["rot_direction"] = -1
-        elif diff > 0.5:
-            self.coordinates["rot_direction"] = 1
-        else:
-            self.coordinates["rot_direction"] = 0
-        self.coordinates["heading"] += con.proportional(
-            self.pathfinding["t_heading"],
-            self.coordinates["heading"],
-            self.hull["turn_rate"],
-            diff,
-        )
-        self.rotate()
+        for gizmo in self.displays.values():
+            gizmo.show()
+
+    def reachSpeed(self, speedOption):
+        """
+
+        Parameters
+        ----------
+        speedOption : string
+            A string corresponding to a key of the speed_option dictionary.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Commands the discrete speed value corresponding to speedOption, for the
+        dodge manoeuver of the next kinematics step.
+
+        """
+        self.kinematics.dodgeSpeed[self.kinIndex] = self.speed_params.speed_options[
+            speedOption
+        ]
 
     def follow(self, ship):
         """
@@ -577,26 +616,25 @@ class Ship(QGraphicsRectItem):
         Updates the trajectory by calling the Astar pathfinding algorithm.
 
         """
-        self.gameScene.clearWaypoints()  # Debug display
-        if self.pathfinding["trajectory"]:
-            self.pathfinding["trajectory"].clear()
+        if self.pathfinding.trajectory:
+            self.pathfinding.trajectory.clear()
         else:
-            self.pathfinding["trajectory"] = []
+            self.pathfinding.trajectory = []
 
         if targetPoint:
-            self.pathfinding["targetPoint"] = targetPoint
+            self.pathfinding.targetPoint = targetPoint
             self.follow_ship = None
 
-        self.pathfinding["sel_checkpoint_id"] = None
+        self.pathfinding.sel_checkpoint_id = None
         self.astar.reset()
         for node in self.astar.findPath(
-            self.coordinates["center"], self.pathfinding["targetPoint"]
+            self.coordinates.center, self.pathfinding.targetPoint
         ):
-            self.pathfinding["trajectory"].append(QPointF(node.xPos, node.yPos))
+            self.pathfinding.trajectory.append(QPointF(node.xPos, node.yPos))
         self.selectNextCheckpoint()
-        # Debug display
-        for point in self.pathfinding["trajectory"]:
-            self.gameScene.printPoint(point, 1000, "black")
+        self.gameScene.debugOverlay.setWaypoints(
+            self, self.pathfinding.trajectory, 1000, "black"
+        )
 
     def checkpointReached(self, checkpoint, targetPoint=False):
         """
@@ -621,16 +659,16 @@ class Ship(QGraphicsRectItem):
         """
         if checkpoint:
             toleranceRect = QRectF(
-                checkpoint.x() - self.pathfinding["cp_tolerance"],
-                checkpoint.y() - self.pathfinding["cp_tolerance"],
-                2 * self.pathfinding["cp_tolerance"],
-                2 * self.pathfinding["cp_tolerance"],
+                checkpoint.x() - self.pathfinding.cp_tolerance,
+                checkpoint.y() - self.pathfinding.cp_tolerance,
+                2 * self.pathfinding.cp_tolerance,
+                2 * self.pathfinding.cp_tolerance,
             )
-            if toleranceRect.contains(self.coordinates["center"]):
+            if toleranceRect.contains(self.coordinates.center):
                 if targetPoint:
-                    self.pathfinding["targetPoint"] = None
+                    self.pathfinding.targetPoint = None
                 else:
-                    self.pathfinding["checkpoint"] = None
+                    self.pathfinding.checkpoint = None
                 return True
             else:
                 return False
@@ -650,76 +688,77 @@ class Ship(QGraphicsRectItem):
         is no more points, resets the trajectory, current checkpoint and targetpoint.
 
         """
-        if self.pathfinding["trajectory"] is None:
-            self.pathfinding["checkpoint"] = None
-            self.pathfinding["sel_checkpoint_id"] = None
+        if self.pathfinding.trajectory is None:
+            self.pathfinding.checkpoint = None
+            self.pathfinding.sel_checkpoint_id = None
         else:
-            if self.pathfinding["sel_checkpoint_id"] is None:
-                self.pathfinding["checkpoint"] = self.pathfinding["trajectory"][0]
-                self.pathfinding["sel_checkpoint_id"] = 0
+            if self.pathfinding.sel_checkpoint_id is None:
+                self.pathfinding.checkpoint = self.pathfinding.trajectory[0]
+                self.pathfinding.sel_checkpoint_id = 0
             else:
                 if (
-                    self.pathfinding["sel_checkpoint_id"] + 1
-                    <= len(self.pathfinding["trajectory"]) - 1
+                    self.pathfinding.sel_checkpoint_id + 1
+                    <= len(self.pathfinding.trajectory) - 1
                 ):
-                    self.pathfinding["sel_checkpoint_id"] += 1
-                    self.pathfinding["checkpoint"] = self.pathfinding["trajectory"][
-                        self.pathfinding["sel_checkpoint_id"]
+                    self.pathfinding.sel_checkpoint_id += 1
+                    self.pathfinding.checkpoint = self.pathfinding.trajectory[
+                        self.pathfinding.sel_checkpoint_id
                     ]
                 else:
-                    self.pathfinding["trajectory"] = None
-                    self.pathfinding["checkpoint"] = None
-                    self.pathfinding["targetPoint"] = None
+                    self.pathfinding.trajectory = None
+                    self.pathfinding.checkpoint = None
+                    self.pathfinding.targetPoint = None
 
-    def checkpointInTurnRadius(self):
+    def pushTransform(self, x, y, heading):
         """
 
+        Parameters
+        ----------
+        x : float
+            The x position to display the ship at.
+        y : float
+            The y position to display the ship at.
+        heading : float
+            The heading to display the ship with.
+
         Returns
         -------
-        bool
-            True if the point is reachable, False otherwise.
+        None.
 
         Summary
         -------
-        Calculates if a point is reachable with the hardest turn. returns True if yes,
-        False otherwise.
+        Moves the ship item and its gizmos in the game scene. Called by the
+        kinematics store once per rendered frame. The turrets are child items
+        of the ship, moved along with it by Qt.
 
         """
-        rot_center = QPointF()
-
-        if self.coordinates["rot_direction"] < 0:
-            rot_center = self.coordinates["r_centers"][0]
-        elif self.coordinates["rot_direction"] > 0:
-            rot_center = self.coordinates["r_centers"][1]
-        else:
-            return None
-
-        if geo.distance_A_B(
-            rot_center, self.pathfinding["checkpoint"]
-        ) < cin.rotationRadius(self.instant_vars["speed"], self.hull["turn_rate"]):
-            return False
-        else:
-            return True
+        self.setPos(x, y)
+        self.setRotation(heading)
+        center = QPointF(x + self.rect().width() / 2, y + self.rect().height() / 2)
+        self.update_gizmos(center, heading)
 
-    def updatePos(self):
+    def wakeTurret(self, turret):
         """
 
+        Parameters
+        ----------
+        turret : GunTurret
+            A turret of this ship.
+
         Returns
         -------
         None.
 
         Summary
         -------
-        Update the position of the ship in the game world.
+        Adds turret to the turrets updated at each clock signal.
 
         """
-        headingInRad = math.radians(self.coordinates["heading"])
-        nextPoint = cin.movementBy(self.pos(), self.instant_vars["speed"], headingInRad)
-        self.setPos(nextPoint)
-        self.updateTurretPos()
-        self.update_gizmos()
+        if not turret.isAwake:
+            turret.isAwake = True
+            self.awakeTurrets.append(turret)
 
-    def updateTurretPos(self):
+    def wakeAllTurrets(self):
         """
 
         Returns
@@ -728,24 +767,47 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Updates the position of the ship's turret in game world referential
-        according to the ship's own movements and the position of its turrets
-        in its referential.
+        Wakes all the turrets of the ship, for example when its heading changes.
 
         """
         for turret in self.weapons["turrets_list"]:
-            tur_angle = 180 if turret.d_shipCenter < 0 else 0
-            r = abs(turret.d_shipCenter)
-            # gamma = round(math.degrees(math.atan((turret._height / 2) / r)), 4)
-            teta = math.radians(self.coordinates["heading"] + tur_angle)
-            nextTurPosX = self.coordinates["center"].x() + r * math.cos(teta)
-            nextTurPosY = self.coordinates["center"].y() - 75 + r * math.sin(teta)
+            self.wakeTurret(turret)
+
+    def updateTurrets(self):
+        """
 
-            turret.setPos(nextTurPosX, nextTurPosY)
+        Returns
+        -------
+        None.
 
-    def update_gizmos(self):
+        Summary
+        -------
+        Updates the awake turrets only. Turrets which become idle are put back
+        to sleep, so that the cost of this function is proportional to the
+        number of engaged turrets.
+
+        """
+        if not self.awakeTurrets:
+            return
+        stillAwake = []
+        for turret in self.awakeTurrets:
+            turret.fixedUpdate()
+            if turret.isIdle():
+                turret.isAwake = False
+            else:
+                stillAwake.append(turret)
+        self.awakeTurrets = stillAwake
+
+    def update_gizmos(self, center, heading):
         """
 
+        Parameters
+        ----------
+        center : QPointF
+            The center of the ship.
+        heading : float
+            The heading of the ship.
+
         Returns
         -------
         None.
@@ -755,14 +817,12 @@ class Ship(QGraphicsRectItem):
         Update this unit gizmos.
 
         """
-        self.displays["rangeCirclesDisp"].update_pos(self.coordinates["center"])
+        self.displays["rangeCirclesDisp"].update_pos(center)
         self.displays["lineToDestination"].update_line(
-            self.coordinates["center"], self.pathfinding["targetPoint"]
+            center, self.pathfinding.targetPoint
         )
-        self.displays["lineToTarget"].update_line(
-            self.coordinates["center"], self.playerTarget
-        )
-        self.displays["selected"].update_rect(self.pos(), self.coordinates["heading"])
+        self.displays["lineToTarget"].update_line(center, self.playerTarget)
+        self.displays["selected"].update_rect(self.pos(), heading)
 
     def rotate(self, rotation=None):
         """
@@ -778,10 +838,11 @@ class Ship(QGraphicsRectItem):
         """
         self.setTransformOriginPoint(self.rect().center())
         if rotation:
-            self.setRotation(rotation)
-            self.coordinates["heading"] = rotation
-        else:
-            self.setRotation(self.coordinates["heading"])
+            self.coordinates.heading = rotation
+        # Idle turrets follow the ship heading, wake them if it changed
+        if self.rotation() != self.coordinates.heading:
+            self.wakeAllTurrets()
+        self.setRotation(self.coordinates.heading)
 
     def steer(self, direction, hard=False):
         """
@@ -797,16 +858,14 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Rotates the ship at tur_rate rate in towards direction.
+        Commands the next kinematics step to rotate the ship at turn_rate rate
+        towards direction.
 
         """
         if direction == "PORT":
-            self.coordinates["heading"] -= self.hull["turn_rate"]
-            self.coordinates["rot_direction"] = -1
+            self.kinematics.steer[self.kinIndex] = -1
         elif direction == "STARBOARD":
-            self.coordinates["heading"] += self.hull["turn_rate"]
-            self.coordinates["rot_direction"] = 1
-        self.rotate()
+            self.kinematics.steer[self.kinIndex] = 1
         if hard:
             self.reachSpeed("SLOW")
 
@@ -827,9 +886,12 @@ class Ship(QGraphicsRectItem):
         Summary
         -------
         Tests the returned distances of the detection rays, and decides
-        to steer the ship accordingly.
+        to steer the ship accordingly. The ship does not follow its path during
+        the next kinematics step.
 
         """
+        self.kinematics.dodging[self.kinIndex] = True
+        self.kinematics.dodgeSpeed[self.kinIndex] = math.nan
         if obstaclesDetectionResults:
             if obstaclesDetectionResults[0] and obstaclesDetectionResults[1]:
                 self.steer("STARBOARD", True)
@@ -853,37 +915,16 @@ class Ship(QGraphicsRectItem):
                 self.steer("PORT"),
             else:
                 self.steer("STARBOARD")
-        self.updatePos()
-
-    def move(self):
-        """
-
-        Returns
-        -------
-        None.
-
-        Summary
-        -------
-        Moves the ship according to its speed and direction.
-
-        """
-        if self.pathfinding["checkpoint"] is not None:
-            self.computeHeading()
-            self.rotateToHeading()
-        self.setSpeed()
-        self.updatePos()
-
-        if self.checkpointReached(self.pathfinding["checkpoint"]):
-            self.selectNextCheckpoint()
 
     def attack_move(self):
-        angle = geo.angle(self.pos(), self.playerTarget.pos())
+        targetCenter = self.playerTarget.coordinates.center
+        angle = geo.angle(self.coordinates.center, targetCenter)
         o_point = QPointF(
-            self.playerTarget.pos().x() - 18000 * math.cos(angle),
-            self.playerTarget.pos().y() - 18000 * math.sin(angle),
+            targetCenter.x() - 18000 * math.cos(angle),
+            targetCenter.y() - 18000 * math.sin(angle),
         )
         # Tests if the optimum point is within an obstacle
-        if self.gameScene.itemAt(o_point, self.gameScene.attachedGView.transform()):
+        if self.gameScene.isObstacle(o_point, self):
             print("Point in an obstacle, generating new set of points")
             # If yes, computes new sets alternative points
             for i in range(1000, 4000, 1000):
@@ -896,9 +937,7 @@ class Ship(QGraphicsRectItem):
                 ]
                 for point in point_matrix:
                     # If a point in the new set is NOT within an obstacle, returns it
-                    if not self.gameScene.itemAt(
-                        point, self.gameScene.attachedGView.transform()
-                    ):
+                    if not self.gameScene.isObstacle(point, self):
                         print("Valid point found")
                         return point
                     print("No valid point in this set, new set")
@@ -924,17 +963,16 @@ class Ship(QGraphicsRectItem):
 
         """
         det_distances = [None, None, None]
-        _range = self.det_and_range["det_r_range"]
+        _range = self.det_and_range.det_r_range
 
-        for i, direction in enumerate(self.det_and_range["det_r_angles"]):
+        for i, direction in enumerate(self.det_and_range.det_r_angles):
             det_distances[i] = self.gameScene.detectionRay(
-                geo.parallelepiped_Center(
-                    self.pos(), self.rect().width(), self.rect().height()
-                ),
-                math.radians(self.coordinates["heading"] + direction),
+                self.coordinates.center,
+                math.radians(self.coordinates.heading + direction),
                 _range,
                 250,
                 int((self.rect().width() / 2) + 50),
+                self,
             )
 
         for distance in det_distances:
@@ -952,19 +990,23 @@ class Ship(QGraphicsRectItem):
         Summary
         -------
         Scans the game world for ennemy ships in its detection range.
+        Changes are reported to the fleet contact table.
 
         """
-        self.det_and_range["detected_ships"] = self.gameScene.shipsInDetectionRange(
-            self,
-        )
+        detectedShips = self.gameScene.shipsInDetectionRange(self)
+        if detectedShips != self.det_and_range.detected_ships:
+            self.det_and_range.detected_ships = detectedShips
+            self.contactsChanged = True
+            if self.contactTable is not None:
+                self.contactTable.report(self, detectedShips)
 
     def receiveRadioComm(self, infosList):
         """
 
         Parameters
         ----------
-        infosList : list
-            A list of Ship objects.
+        infosList : tuple
+            A read-only view of Ship objects.
 
         Returns
         -------
@@ -975,7 +1017,31 @@ class Ship(QGraphicsRectItem):
         Receives a list of ennemy ships detected by allied ships.
 
         """
-        self.det_and_range["rcom_ships"] = infosList
+        self.det_and_range.rcom_ships = infosList
+        self.contactsChanged = True
+
+    def receiveTargetAssignment(self, targetShip=None, shotType=None):
+        """
+
+        Parameters
+        ----------
+        targetShip : Ship, optional
+            The ennemy ship assigned by the fleet. The default is None.
+        shotType : str, optional
+            The shot type to use against targetShip. The default is None.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Receives the target assigned by the fleet. As long as it is targetable,
+        the ship shoots it without running its own target selection.
+
+        """
+        self.assignedTarget = targetShip
+        self.assignedShot = shotType
 
     def isInRange(self, otherShip):
         """
@@ -995,10 +1061,9 @@ class Ship(QGraphicsRectItem):
         Returns true if yes, false otherwise.
 
         """
-        otherShipPos = geo.parallelepiped_Center(
-            otherShip.pos(), otherShip.rect().width(), otherShip.rect().height()
+        distance = geo.distance_A_B(
+            self.coordinates.center, otherShip.coordinates.center
         )
-        distance = geo.distance_A_B(self.coordinates["center"], otherShipPos)
         if distance <= self.weapons["guns_range"]:
             return True
         return False
@@ -1020,15 +1085,11 @@ class Ship(QGraphicsRectItem):
         False otherwise.
 
         """
-        ship_center = geo.parallelepiped_Center(
-            other_ship.pos(), other_ship.rect().width(), other_ship.rect().height()
-        )
+        ship_center = other_ship.coordinates.center
         if (
-            self.gameScene.isInLineOfSight(
-                self.coordinates["center"], ship_center, 250,
-            )
+            self.gameScene.isInLineOfSight(self.coordinates.center, ship_center, 250)
             and self.isInRange(other_ship)
-            and other_ship in self.det_and_range["fleet_detected_ships"]
+            and other_ship in self.det_and_range.fleet_detected_ships
         ):
             return True
         return False
@@ -1038,30 +1099,33 @@ class Ship(QGraphicsRectItem):
 
         Returns
         -------
-        sIR : list
-            A list of all detected ennemy ships in gun range.
+        None.
 
         Summary
         -------
-        Computes and returns a list of all enney detected ships within gun range.
+        Computes the set of all ennemy ships detected by the ship or its fleet,
+        and adds the new ones to the target list. Does nothing if neither the
+        ship detections nor the radio communications changed.
 
         """
-        self.det_and_range["fleet_detected_ships"].clear()
-
-        if self.det_and_range["detected_ships"]:
-            self.det_and_range["fleet_detected_ships"].extend(
-                self.det_and_range["detected_ships"]
-            )
-        if self.det_and_range["rcom_ships"]:
-            self.det_and_range["fleet_detected_ships"].extend(
-                self.det_and_range["rcom_ships"]
-            )
+        if not self.contactsChanged:
+            return
+        self.contactsChanged = False
 
-        for ship in self.det_and_range["fleet_detected_ships"]:
-            if ship.data(0) not in self.discoveredShips:
-                _shipHeapItem = ShipHEAPItem(ship)
-                self.targetList.addItem(_shipHeapItem)
-                self.discoveredShips.append(ship.data(0))
+        fleetDetectedShips = self.det_and_range.fleet_detected_ships
+        fleetDetectedShips.clear()
+        for contacts in (
+            self.det_and_range.detected_ships,
+            self.det_and_range.rcom_ships,
+        ):
+            if not contacts:
+                continue
+            for ship in contacts:
+                fleetDetectedShips.add(ship)
+                if ship.data(0) not in self.discoveredShips:
+                    _shipHeapItem = ShipHEAPItem(ship)
+                    self.targetList.addItem(_shipHeapItem)
+                    self.discoveredShips.add(ship.data(0))
 
     def setTarget(self, ennemyShip=None):
         """
@@ -1095,23 +1159,51 @@ class Ship(QGraphicsRectItem):
         -------
         Computes and return the best ship to set as target
         and the best suited shot type.
+        Destroyed or lost contacts are removed from the target list. A target
+        is only evaluated again if its range bucket, line of sight state or hp
+        changed since its last evaluation.
 
         """
+        fleetDetectedShips = self.det_and_range.fleet_detected_ships
 
-        for shipheapitem in self.targetList.items:
+        for shipheapitem in list(self.targetList.items):
             ship = shipheapitem.shipInstance
-            shipheapitem.isTargetable = self.isTargetable(ship)
-            if shipheapitem.isTargetable:
+            if ship.instant_vars.hp <= 0 or ship not in fleetDetectedShips:
+                self.targetList.removeItem(shipheapitem)
+                self.discoveredShips.discard(ship.data(0))
+                continue
+
+            shipCenter = ship.coordinates.center
+            distance = geo.distance_A_B(self.coordinates.center, shipCenter)
+            rangeBucket = eval_table.rangeBucket(distance)
+            # The expensive line of sight check is only done within gun range
+            lineOfSight = distance <= self.weapons["guns_range"] and (
+                self.gameScene.isInLineOfSight(self.coordinates.center, shipCenter, 250)
+            )
+            if (
+                rangeBucket == shipheapitem.rangeBucket
+                and lineOfSight == shipheapitem.isTargetable
+                and ship.instant_vars.hp == shipheapitem.targetHp
+            ):
+                continue
+
+            shipheapitem.rangeBucket = rangeBucket
+            shipheapitem.isTargetable = lineOfSight
+            shipheapitem.targetHp = ship.instant_vars.hp
+            if lineOfSight:
                 (
                     shipheapitem.potentialDamage,
                     shipheapitem.idealShot,
                 ) = self.evaluateTarget(ship)
-                self.targetList.updateItem(shipheapitem)
+            else:
+                # Untargetable ships sink to the bottom of the heap
+                shipheapitem.potentialDamage = -1
+            self.targetList.updateItem(shipheapitem)
 
-        if len(self.targetList.items) > 0:
-            for shipheapitem in self.targetList.items:
-                if shipheapitem.isTargetable:
-                    return (shipheapitem.shipInstance, shipheapitem.idealShot)
+        if self.targetList.size() > 0:
+            bestItem = self.targetList.items[0]
+            if bestItem.isTargetable:
+                return (bestItem.shipInstance, bestItem.idealShot)
 
         return (None, None)
 
@@ -1129,61 +1221,42 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Computes the minimal amount of damage that can be done to target.
+        Returns the minimal amount of damage that can be done to target, read
+        from the precomputed evaluation table.
 
         """
-        shot_choice = ""
-        potential = 0
-        ##################### COMPUTE HIT PROBABILITY PER SALVO #####################
-        #############################################################################
-        targetCenter = geo.parallelepiped_Center(
-            target.pos(), target.rect().width(), target.rect().height()
-        )
-        targetDistance = round(
-            geo.distance_A_B(self.coordinates["center"], targetCenter)
-        )
-        targetArea = round(target.rect().width() * target.rect().height())
-        n_shots = (
-            len(self.weapons["turrets_list"]) * self.weapons["turrets_list"][0].n_guns
+        targetDistance = geo.distance_A_B(
+            self.coordinates.center, target.coordinates.center
         )
-        azimut_error = math.radians(self.weapons["turrets_list"][0].gun_acc)
-        errorOnD = self.p_dat["accy"] * targetDistance
-        errorOnD = round(errorOnD)
-        hitArea = round(
-            errorOnD * math.tan(azimut_error) * (2 * targetDistance - errorOnD)
-        )
-        hitChance = targetArea / hitArea
-        hitProbability = round(1 - (1 - hitChance) ** n_shots, 4)
-        #############################################################################
-        #############################################################################
-
-        ####################### CHOOSES BEST SUITED SHOT TYPE #######################
-        #############################################################################
-        penAtDist = self.table[int(targetDistance / 1000)]
-        dmgHE = min(
-            int((self.p_dat["pen_HE"] / target.hull["armor"]) * self.p_dat["dmg_HE"]),
-            self.p_dat["dmg_HE"],
-        )
-        if penAtDist > target.hull["armor"]:
-            dmgAP = self.p_dat["dmg_AP"]
-            if dmgHE > dmgAP:
-                shot_choice = "HE"
-                potential = dmgHE
-            else:
-                shot_choice = "AP"
-                potential = dmgAP
-        else:
-            shot_choice = "HE"
-            potential = dmgHE
-        potential = round(potential * hitProbability)
-        #############################################################################
-        #############################################################################
-        return (potential, shot_choice)
+        rangeBucket = eval_table.rangeBucket(targetDistance)
+        return eval_table.lookup(self, target, rangeBucket)
 
     def receiveDamage(self, value):
-        self.instant_vars["hp"] -= value
-        if self.instant_vars["hp"] < 0:
-            self.instant_vars["hp"] = 0
+        if self.instant_vars.hp <= 0:
+            return
+        self.instant_vars.hp -= value
+        if self.instant_vars.hp <= 0:
+            self.instant_vars.hp = 0
+            self.sink()
+
+    def sink(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes the ship, its turrets and its gizmos from the battle.
+
+        """
+        for turret in self.weapons["turrets_list"]:
+            turret.setTarget(None)
+        self.awakeTurrets.clear()
+        for gizmo in self.displays.values():
+            self.gameScene.removeItem(gizmo)
+        self.gameScene.removeShip(self)
 
     def receiveCritical(self, crit_code):
         if crit_code == 0:
@@ -1209,16 +1282,13 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Spawns the turrets of the ship at predefined places. See documentation
-        for further informations.
+        Spawns the turrets of the ship at predefined places, as child items of
+        the ship. See documentation for further informations.
 
         """
-        spawnPosList = [
-            QPointF(self.x() + coord[0], self.y() + coord[1])
-            for coord in self.weapons["turrets_pos"]
-        ]
+        spawnPosList = [QPointF(*coord) for coord in self.weapons["turrets_pos"]]
 
-        for i, spawnPos in enumerate(spawnPosList):
+        for spawnPos in spawnPosList:
             if self.weapons["turrets_size"] == "s":
                 currentTurret = tur.small(self.clock, self.gameScene, self)
             elif self.weapons["turrets_size"] == "m":
@@ -1226,13 +1296,11 @@ class Ship(QGraphicsRectItem):
             elif self.weapons["turrets_size"] == "l":
                 currentTurret = tur.large(self.clock, self.gameScene, self)
             try:
+                # Child item: the position is in the ship referential
                 currentTurret.setPos(spawnPos)
-                currentTurret.d_shipCenter = (
-                    self.weapons["turrets_pos"][i][0] - self.rect().width() / 2
-                )
                 currentTurret.setZValue(3)
-                self.gameScene.addItem(currentTurret)
                 self.weapons["turrets_list"].append(currentTurret)
+                self.wakeTurret(currentTurret)
                 currentTurret = None
             except Exception as e:
                 print(e)
@@ -1286,7 +1354,7 @@ class Ship(QGraphicsRectItem):
         print("CONCEALEMENT", str(self.hull["base_concealement"]))
         print("")
         print("----------- DETECTION -------------")
-        print("DETECTION RANGE", str(self.instant_vars["detection_range"]) + "units")
+        print("DETECTION RANGE", str(self.instant_vars.detection_range) + "units")
         print("")
         print("----------- ARMAMENT --------------")
         if self.weapons["turrets_list"] is not None:
@@ -1323,7 +1391,7 @@ class Ship(QGraphicsRectItem):
         if self.data(1) == "ALLY":
             self.displays["rangeCirclesDisp"] = c_gizmo(
                 c,
-                self.instant_vars["detection_range"],
+                self.instant_vars.detection_range,
                 self.weapons["guns_range"],
                 "cyan",
                 "blue",
@@ -1331,7 +1399,7 @@ class Ship(QGraphicsRectItem):
         else:
             self.displays["rangeCirclesDisp"] = c_gizmo(
                 c,
-                self.instant_vars["detection_range"],
+                self.instant_vars.detection_range,
                 self.weapons["guns_range"],
                 "yellow",
                 "red",
@@ -1368,23 +1436,28 @@ class Ship(QGraphicsRectItem):
 
         Summary
         -------
-        Instructions to draw the item on the game scene.
+        Instructions to draw the item on the game scene. When the ship is too
+        small on screen, it is drawn as a point.
 
         """
         if self.data(1) == "ALLY":
             if self.isSelected():
-                painter.setBrush(QBrush(QColor("green")))
-                painter.setPen(QPen(QColor("darkGreen"), 10))
+                brushColor, penColor = "green", "darkGreen"
             else:
-                painter.setBrush(QBrush(QColor("blue")))
-                painter.setPen(QPen(QColor("darkBlue"), 10))
-        if self.data(1) == "ENNEMY":
+                brushColor, penColor = "blue", "darkBlue"
+        elif self.data(1) == "ENNEMY":
             if self.isSelected():
-                painter.setBrush(QBrush(QColor("yellow")))
-                painter.setPen(QPen(QColor("red"), 10))
+                brushColor, penColor = "yellow", "red"
             else:
-                painter.setBrush(QBrush(QColor("red")))
-                painter.setPen(QPen(QColor("darkred"), 10))
+                brushColor, penColor = "red", "darkred"
+        else:
+            return
+        if lod.isPoint(lod.scale(painter), self.rect().width()):
+            painter.setPen(lod.dotPen(brushColor))
+            painter.drawPoint(self.rect().center())
+            return
+        painter.setBrush(QBrush(QColor(brushColor)))
+        painter.setPen(QPen(QColor(penColor), 10))
         painter.drawEllipse(self.rect())
 
 
@@ -1411,6 +1484,9 @@ class ShipHEAPItem(HEAP.HEAPItem):
         self.isTargetable = False
         self.potentialDamage = 0
         self.idealShot = ""
+        # State of the target at its last evaluation
+        self.rangeBucket = None
+        self.targetHp = None
 
     def compareTo(self, otherShipHEAPItem):
         """
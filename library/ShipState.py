@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: ShipState.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import copy
+
+
+class ShipState:
+    """
+
+    Base class of the compact state objects of a ship. Each subclass lists its
+    fields in __slots__, named as the keys of the matching ship config dict.
+
+    ...
+
+    Methods
+    -------
+    fromConfig(config : dict)
+        Creates a state object from a ship config dict.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def fromConfig(cls, config):
+        """
+
+        Parameters
+        ----------
+        config : dict
+            A ship config dict, holding the default value of every field.
+
+        Returns
+        -------
+        state : ShipState
+            A new state object, not sharing any mutable value with config.
+
+        Summary
+        -------
+        Creates a state object from a ship config dict. Raises a KeyError if a
+        field is missing from the config.
+
+        """
+        state = cls()
+        for field in cls.__slots__:
+            setattr(state, field, copy.copy(config[field]))
+        return state
+
+    def __repr__(self):
+        fields = ", ".join(
+            "{}={!r}".format(field, getattr(self, field, None))
+            for field in self.__slots__
+        )
+        return "{}({})".format(type(self).__name__, fields)
+
+
+class Coordinates(ShipState):
+    """
+
+    The position related state of a ship.
+
+    """
+
+    __slots__ = ("center", "r_centers", "heading", "rot_direction")
+
+
+class InstantVars(ShipState):
+    """
+
+    The current values of the ship characteristics.
+
+    """
+
+    __slots__ = ("hp", "shield", "concealement", "detection_range", "speed", "accel")
+
+
+class Pathfinding(ShipState):
+    """
+
+    The state of the ship navigation.
+
+    """
+
+    __slots__ = (
+        "trajectory",
+        "checkpoint",
+        "sel_checkpoint_id",
+        "targetPoint",
+        "cp_tolerance",
+        "t_heading",
+    )
+
+
+class DetectionState(ShipState):
+    """
+
+    The detection state of the ship, and its obstacle detection rays.
+
+    """
+
+    __slots__ = (
+        "detected_ships",
+        "rcom_ships",
+        "fleet_detected_ships",
+        "det_r_angles",
+        "det_r_range",
+    )
+
+
+class SpeedParams(ShipState):
+    """
+
+    The speed options of the ship.
+
+    """
+
+    __slots__ = ("speed_user_override", "default_speed", "speed_options")
+
+
+class RefreshRates(ShipState):
+    """
+
+    The periods of the ship periodic jobs, in ticks.
+
+    """
+
+    __slots__ = ("refresh_rate", "path_update_rate", "print_point_rate")
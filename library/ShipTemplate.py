@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: ShipTemplate.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from collections import ChainMap
+
+
+class ShipTemplate:
+    """
+
+    A copy-on-write ship config. The template holds a read only base config,
+    usually a ConfigRegistry view, shared by all the ships built from it. Each
+    ship config it creates maps every section of the base (naming, hull,
+    techs...) to a ChainMap of a small per ship dict over the base section:
+    reads fall through to the base, writes only touch the per ship dict. A
+    fleet of any size is built without copying the base.
+
+    ...
+
+    Attributes
+    ----------
+    base : dict
+        The read only ship config shared by all the ships of the template.
+
+    mutableFields : dict
+        The fields the ships edit in place, by section, with a factory of
+        their per ship value.
+
+    Methods
+    -------
+    __init__(base : dict)
+        The constructor of the class.
+
+    instance(overrides[None] : dict)
+        Returns a ship config, with overrides over the base.
+
+    """
+
+    mutableFields = {"weapons": {"turrets_list": list}}
+
+    def __init__(self, base):
+        """
+
+        Parameters
+        ----------
+        base : dict
+            The read only ship config, as {section: {field: value}}.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class.
+
+        """
+        self.base = base
+
+    def instance(self, overrides=None):
+        """
+
+        Parameters
+        ----------
+        overrides : dict, optional
+            The values of this ship differing from the base, as
+            {section: {field: value}}. The default is None.
+
+        Returns
+        -------
+        config : dict
+            A ship config, one ChainMap per section, ready for
+            Ship.__dict__.update.
+
+        """
+        overrides = overrides or {}
+        config = {}
+        for section, values in self.base.items():
+            layer = {
+                field: factory()
+                for field, factory in self.mutableFields.get(section, {}).items()
+            }
+            layer.update(overrides.get(section, {}))
+            config[section] = ChainMap(layer, values)
+        return config
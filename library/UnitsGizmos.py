@@ -18,6 +18,8 @@ from PyQt5.QtWidgets import (
     QGraphicsRectItem,
 )
 
+from library.displays.LevelOfDetail import LevelOfDetail as lod
+
 
 class RangeCirclesGizmo(QGraphicsEllipseItem):
     """
@@ -150,9 +152,16 @@ class RangeCirclesGizmo(QGraphicsEllipseItem):
 
         Summary
         -------
-        Instructions to draw the item on the game scene.
+        Instructions to draw the item on the game scene. When the circles are
+        thinner than a pixel on screen, they are drawn one pixel wide.
 
         """
+        if lod.isThin(lod.scale(painter), self.thkc):
+            painter.setPen(lod.thinPen(self.outerColor))
+            painter.drawEllipse(self.rect())
+            painter.setPen(lod.thinPen(self.innerColor))
+            painter.drawEllipse(self.innerRect)
+            return
         painter.setPen(QPen(QColor(self.outerColor), self.thkc, Qt.SolidLine))
         painter.drawEllipse(self.rect())
 
@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: World.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from library.Kinematics import KinematicsStore
+from library.Scheduler import TaskScheduler
+from library.displays.BatchRenderer import BatchRenderer
+
+
+class World:
+    """
+
+    The simulation of a battle. Each clock signal, the main clock calls step()
+    once, which runs all the phases of a tick in a fixed order. Each phase
+    iterates over its own list of participants, then runs its periodic jobs
+    due this tick.
+
+    ...
+
+    Attributes
+    ----------
+    ships : dict
+        The ships in battle, used as an ordered set.
+
+    projectiles : dict
+        The projectiles in flight, used as an ordered set.
+
+    scheduler : TaskScheduler
+        Runs the periodic jobs of the participants, spread over the ticks.
+
+    kinematics : KinematicsStore
+        Moves all the ships in one vectorized step.
+
+    uiSync : dict
+        The functions synchronizing the interface with the battle, used as an
+        ordered set.
+
+    renderer : BatchRenderer
+        The batched renderer, None when the items paint themselves.
+
+    Methods
+    -------
+    __init__(clock : MainClock, gameScene : GameScene)
+        The constructor of the class.
+
+    onRosterChange(event : str, ship : Ship)
+        Adds or removes a ship from the battle, on roster events.
+
+    addProjectile(projectile : Projectile)
+        Adds a projectile to the battle.
+
+    removeProjectile(projectile : Projectile)
+        Removes a projectile from the battle.
+
+    addComms(comms : RadioCommunications)
+        Adds a radio communications system to the battle.
+
+    addUiSync(function : callable)
+        Adds a function called at the end of each tick.
+
+    setBatchedRendering(enabled : bool)
+        Switches the batched renderer on or off.
+
+    detach()
+        Stops following the game scene, when the battle ends.
+
+    step()
+        Runs one tick of the battle.
+
+    render(alpha : float)
+        Displays the moving items between their last two simulated positions.
+
+    restore()
+        Puts back the projectiles at their simulated positions.
+
+    """
+
+    def __init__(self, clock, gameScene):
+        """
+
+        Parameters
+        ----------
+        clock : MainClock
+            The main clock of the game.
+        gameScene : GameScene
+            The main display of the game.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class. Attaches the world to the clock, and
+        follows the ships of the game scene roster.
+
+        """
+        self.ships = {}
+        self.projectiles = {}
+        self.uiSync = {}
+        self.scheduler = TaskScheduler()
+        self.kinematics = KinematicsStore()
+        self.gameScene = gameScene
+        self.renderer = None
+        # Participants leaving while a phase iterates are removed after it
+        self._leaving = []
+        self._stepping = False
+        # (item, dx, dy) moved by the last render
+        self._renderOffsets = []
+
+        clock.world = self
+        gameScene.attachedWorld = self
+        gameScene.roster.addListener(self.onRosterChange)
+
+    def _remove(self, participants, participant):
+        if self._stepping:
+            self._leaving.append((participants, participant))
+        else:
+            participants.pop(participant, None)
+
+    def _flush(self):
+        for participants, participant in self._leaving:
+            participants.pop(participant, None)
+        self._leaving.clear()
+
+    def onRosterChange(self, event, ship):
+        """
+
+        Parameters
+        ----------
+        event : str
+            "ADD" when ship enters the battle, "REMOVE" when it leaves it.
+        ship : Ship
+            The ship concerned by the event.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Adds or removes a ship, its kinematics and its periodic jobs from the
+        battle.
+
+        """
+        if event == "ADD":
+            self.ships[ship] = None
+            self.kinematics.add(ship)
+            ship.scheduleJobs(self.scheduler)
+            if self.renderer:
+                self.renderer.adoptShip(ship)
+        elif event == "REMOVE":
+            self._remove(self.ships, ship)
+            self.kinematics.remove(ship)
+            ship.cancelJobs(self.scheduler)
+            if self.renderer:
+                self.renderer.releaseShip(ship)
+
+    def addProjectile(self, projectile):
+        """
+
+        Parameters
+        ----------
+        projectile : Projectile
+            The projectile to add.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Adds a projectile to the battle. Fired during the fire control phase,
+        it moves from the next projectiles phase, and is interpolated from the
+        next tick.
+
+        """
+        projectile.prevPos = None
+        self.projectiles[projectile] = None
+        if self.renderer:
+            self.renderer.adopt(projectile)
+
+    def removeProjectile(self, projectile):
+        """
+
+        Parameters
+        ----------
+        projectile : Projectile
+            The projectile to remove.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes a projectile from the battle.
+
+        """
+        self._remove(self.projectiles, projectile)
+        if self.renderer:
+            self.renderer.release(projectile)
+
+    def addComms(self, comms):
+        """
+
+        Parameters
+        ----------
+        comms : RadioCommunications
+            The radio communications system to add.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Adds a radio communications system to the battle, run every
+        radioCommsRate + 1 ticks in the comms phase.
+
+        """
+        self.scheduler.schedule("COMMS", comms.fixedUpdate, comms.radioCommsRate + 1)
+
+    def addUiSync(self, function):
+        """
+
+        Parameters
+        ----------
+        function : callable
+            A function without parameters.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Adds a function called at the end of each tick, to update the interface.
+
+        """
+        self.uiSync[function] = None
+
+    def setBatchedRendering(self, enabled):
+        """
+
+        Parameters
+        ----------
+        enabled : bool
+            True to paint the battle with the batched renderer, False to let
+            each item paint itself.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Switches the batched renderer on or off.
+
+        """
+        if enabled and self.renderer is None:
+            self.renderer = BatchRenderer(self, self.gameScene)
+        elif not enabled and self.renderer is not None:
+            self.renderer.close()
+            self.renderer = None
+
+    def detach(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Stops following the roster of the game scene and switches the batched
+        renderer off, so that a world left behind by a cancelled or ended
+        battle does not receive the ships of the next one.
+
+        """
+        self.gameScene.roster.removeListener(self.onRosterChange)
+        self.setBatchedRendering(False)
+        if self.gameScene.attachedWorld is self:
+            self.gameScene.attachedWorld = None
+
+    def step(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Runs one tick of the battle, phase by phase: sensing, comms, targeting,
+        fire control, movement, projectiles, damage and ui sync. Participants
+        leaving during a phase are removed at the end of that phase. The
+        positions before the tick are kept for the render interpolation.
+
+        The ships items are not moved by a step: the geometric queries of the
+        simulation test the ships at their simulated state, in the kinematics
+        store.
+
+        """
+        ships = self.ships
+        projectiles = self.projectiles
+        self.restore()
+        for projectile in projectiles:
+            projectile.prevPos = projectile.pos()
+        scheduler = self.scheduler
+        scheduler.startTick()
+        self._stepping = True
+        try:
+            # Sensing
+            scheduler.run("SENSING")
+            self._flush()
+            # Comms
+            scheduler.run("COMMS")
+            self._flush()
+            # Targeting
+            scheduler.run("TARGETING")
+            self._flush()
+            # Fire control
+            for ship in ships:
+                ship.updateTurrets()
+            self._flush()
+            # Movement
+            for ship in ships:
+                ship.navigate()
+            self.kinematics.step()
+            self.kinematics.sync()
+            scheduler.run("MOVEMENT")
+            self._flush()
+            # Projectiles
+            for projectile in projectiles:
+                projectile.move()
+            self._flush()
+            # Damage
+            for projectile in projectiles:
+                projectile.checkImpact()
+            self._flush()
+            # Ui sync
+            for ship in ships:
+                ship.syncDisplay()
+            for function in self.uiSync:
+                function()
+            self._flush()
+        finally:
+            self._stepping = False
+
+    def render(self, alpha):
+        """
+
+        Parameters
+        ----------
+        alpha : float
+            The fraction of a tick elapsed since the last step, in [0, 1[.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Moves the ships, their turrets and the projectiles to their positions
+        interpolated between the last two steps. The ships items are only
+        moved here, once per frame. The simulated positions of the projectiles
+        are restored before the next step. Ends the frame of the debug overlay.
+
+        """
+        self.kinematics.push(alpha)
+        self.gameScene.debugOverlay.endFrame()
+        self.restore()
+        offsets = self._renderOffsets
+        k = 1 - alpha
+        for projectile in self.projectiles:
+            prevPos = projectile.prevPos
+            if prevPos is None:
+                continue
+            pos = projectile.pos()
+            dx = (prevPos.x() - pos.x()) * k
+            dy = (prevPos.y() - pos.y()) * k
+            projectile.moveBy(dx, dy)
+            offsets.append((projectile, dx, dy))
+        if self.renderer:
+            self.renderer.update()
+
+    def restore(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Puts back the projectiles moved by the last render at their simulated
+        positions.
+
+        """
+        for item, dx, dy in self._renderOffsets:
+            item.moveBy(-dx, -dy)
+        self._renderOffsets.clear()
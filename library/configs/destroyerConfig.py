@@ -88,13 +88,6 @@ instant_vars = {
     "accel": 0,
 }
 
-iterators = {
-    "next_path_update": 99,
-    "next_radar_scan": 0,
-    "next_target_lock": 0,
-    "next_point_print": 0,
-}
-
 speed_params = {
     "speed_user_override": None,
     "default_speed": "FAST",
@@ -10,14 +10,13 @@
 """
 
 import random
-import copy
 
 from os import path
 
-from library.configs import ai_fleet_configs
-from library.configs import battleshipConfig
 from library.InGameData import TechsData as tech_dat
-from library.utils.Config import Config
+from library.ShipTemplate import ShipTemplate
+from library.utils.ConfigRegistry import ConfigRegistry
+from library.utils.Imports import NamePool
 
 
 class GameController:
@@ -25,84 +24,90 @@ class GameController:
         self.tf301_ref = parent
         self.clock = parent.mainClock
         self.currently_displayed_ship = None
-        self.all_doctrines = ai_fleet_configs.doctrines
+        NamePool.reset()
+        ai_cfg = path.join(
+            path.dirname(path.realpath(__file__)), "../configs/ai_fleet_configs.py"
+        )
+        self.all_doctrines = ConfigRegistry.view(ai_cfg)["doctrines"]
         bb_cfg = path.join(
             path.dirname(path.realpath(__file__)), "../configs/battleshipConfig.py"
         )
-        self.bb_dict, _ = Config._file2dict(bb_cfg)
+        self.bb_template = ShipTemplate(ConfigRegistry.view(bb_cfg))
 
         ca_cfg = path.join(
             path.dirname(path.realpath(__file__)), "../configs/cruiserConfig.py"
         )
-        self.ca_dict, _ = Config._file2dict(ca_cfg)
+        self.ca_template = ShipTemplate(ConfigRegistry.view(ca_cfg))
 
         dd_cfg = path.join(
             path.dirname(path.realpath(__file__)), "../configs/destroyerConfig.py"
         )
-        self.dd_dict, _ = Config._file2dict(dd_cfg)
+        self.dd_template = ShipTemplate(ConfigRegistry.view(dd_cfg))
 
         # pt_cfg = path.join(
         #     path.dirname(path.realpath(__file__)), "../configs/corvetteConfig.py"
         # )
         # self.pt_dict, pt_txt = Config._file2dict(pt_cfg)
+        self.templates = [self.bb_template, self.ca_template, self.dd_template]
 
-        self.clock.clockSignal.connect(self.fixed_update)
+        self.clock.world.addUiSync(self.fixed_update)
 
     def fixed_update(self):
         if self.currently_displayed_ship:
             self.update_ship_display()
 
-    def generate_ai_fleet(self, funds):
-        doctrine = self.choose_random_doctrine()
+    def generate_ai_fleet(self, funds, doctrine=None):
+        if doctrine is None:
+            doctrine = self.choose_random_doctrine()
         doctrine_ship_prios = self.all_doctrines[doctrine][0]
         # doctrine_tech_prios = self.all_doctrines[doctrine][1]
         target_single_ship_cost = [
-            battleshipConfig.naming["base_cost"],
+            self.bb_template.base["naming"]["base_cost"],
             4000,
             2500,
             2000,
         ]
-        _sum = 0
-        ratios = []
-        funds_per_ship_type = []
+        _sum = sum(doctrine_ship_prios)
         ships_per_type = []
         funds_left = 0
-        buyable_techs_per_level = []
-        all_ships = []
+        for prio, ship_cost in zip(doctrine_ship_prios, target_single_ship_cost):
+            fund = int(round(prio / _sum, 2) * funds)
+            ships_per_type.append(fund // ship_cost)
+            funds_left += fund % ship_cost
+        buyable_techs_per_level = [
+            funds_left // tech_cost for tech_cost in tech_dat.cost_per_tech
+        ]
 
-        for prio in doctrine_ship_prios:
-            _sum += prio
-        for prio in doctrine_ship_prios:
-            ratios.append(round(prio / _sum, 2))
-        for ratio in ratios:
-            funds_per_ship_type.append(int(ratio * funds))
-        for i, fund in enumerate(funds_per_ship_type):
-            ships_per_type.append(fund // target_single_ship_cost[i])
-            funds_left += fund % target_single_ship_cost[i]
-        for tech_cost in tech_dat.cost_per_tech:
-            buyable_techs_per_level.append(funds_left // tech_cost)
-        for i, n_ships in enumerate(ships_per_type):
-            for _ in range(n_ships):
-                if i == 0:
-                    all_ships.append(copy.deepcopy(self.bb_dict))
-                elif i == 1:
-                    all_ships.append(copy.deepcopy(self.ca_dict))
-                elif i == 2:
-                    all_ships.append(copy.deepcopy(self.dd_dict))
-                # else:
-                #     all_ships.append(copy.deepcopy(self.pt_dict))
-
-        j = 0
-        for i in range(buyable_techs_per_level[0]):
-            if j > len(all_ships) - 1:
-                j = 0
-            if all_ships[j]["techs"]["guns_tech"] == 0:
-                all_ships[j]["techs"]["guns_tech"] = 1
-            elif all_ships[j]["techs"]["radar_tech"] == 0:
-                all_ships[j]["techs"]["radar_tech"] = 1
-            elif all_ships[j]["techs"]["fc_tech"] == 0:
-                all_ships[j]["techs"]["fc_tech"] = 1
-            j += 1
+        # No PT template yet, PT ships are not built
+        templates = [
+            template
+            for template, n_ships in zip(self.templates, ships_per_type)
+            for _ in range(n_ships)
+        ]
+        # Techs are handed out one at a time to each ship in turn, so ship j
+        # of n gets techs // n upgrades, plus one if j < techs % n. Each
+        # upgrade sets the next tech still at 0 among guns, radar and fc.
+        n_ships = len(templates)
+        n_techs = buyable_techs_per_level[0]
+        all_ships = []
+        for j, template in enumerate(templates):
+            n_upgrades = n_techs // n_ships + (j < n_techs % n_ships)
+            base_techs = template.base["techs"]
+            upgrades = [
+                tech
+                for tech in ("guns_tech", "radar_tech", "fc_tech")
+                if base_techs[tech] == 0
+            ][:n_upgrades]
+            all_ships.append(
+                template.instance(
+                    {
+                        "naming": {
+                            "_name": NamePool.draw(template.base["naming"]["_type"])
+                        },
+                        "techs": {tech: 1 for tech in upgrades},
+                    }
+                )
+            )
 
         return all_ships
 
@@ -121,11 +126,11 @@ class GameController:
             self.tf301_ref.gun_range_value_lbl.setText(str(ship.weapons["guns_range"]))
             self.tf301_ref.accuracy_value_lbl.setText("TBD")
             self.tf301_ref.max_det_range_value_lbl.setText(
-                str(ship.instant_vars["detection_range"])
+                str(ship.instant_vars.detection_range)
             )
             self.tf301_ref.hp_progress_bar.setMinimum(0)
             self.tf301_ref.hp_progress_bar.setMaximum(ship.hull["max_hp"])
-            self.tf301_ref.hp_progress_bar.setValue(ship.instant_vars["hp"])
+            self.tf301_ref.hp_progress_bar.setValue(ship.instant_vars.hp)
             self.tf301_ref.bridge_state_lbl.setText(ship.crit_components["BRIDGE"])
             self.tf301_ref.engine_state_lbl.setText(ship.crit_components["ENGINE"])
             self.tf301_ref.radar_state_lbl.setText(ship.crit_components["RADAR"])
@@ -137,7 +142,7 @@ class GameController:
 
     def update_ship_display(self):
         self.tf301_ref.hp_progress_bar.setValue(
-            self.currently_displayed_ship.instant_vars["hp"]
+            self.currently_displayed_ship.instant_vars.hp
         )
         self.tf301_ref.bridge_state_lbl.setText(
             self.currently_displayed_ship.crit_components["BRIDGE"]
@@ -16,8 +16,8 @@ from os import path
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from library.InGameData import TechsData as tech_dat
-from library.utils.Config import Config
-from library.utils.Imports import Imports
+from library.utils.ConfigRegistry import ConfigRegistry
+from library.utils.Imports import NamePool
 from library.displays import InteractiveList
 from . import dialogsUtils
 
@@ -34,6 +34,9 @@ class BattleSetup:
     __init__()
         Constructor of the class.
 
+    loadFleetConfigs()
+        Loads the ship and turret configs, once.
+
     createFleetUI()
         Displays fleet creator window.
 
@@ -104,23 +107,54 @@ class BattleSetup:
         Summary
         -------
         Constructor of the class.
-        Load default configs for all ship types and map generator.
+        Load default configs for the map generator. The ship configs are
+        loaded when the fleet creator is opened.
+
+        """
+        map_cfg = path.join(
+            path.dirname(path.realpath(__file__)), "../configs/mapGenConfig.py"
+        )
+        self.map_dict = ConfigRegistry.copy(map_cfg)
+
+        self.bb_dict = self.ca_dict = self.dd_dict = self.tur_dict = None
+        self.currentMapConfig = {}
+        self.currentShip = {}
+        self.currentTurDict = {}
+        self.allShips = {}
+        self.radioButtonsEnabled = False
+        self.shipCounter = 0
+        self.currentShipKey = 0
+        self.fleetCost = 0
+        self.resetMapConfig()
+
+    def loadFleetConfigs(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Load default configs for all ship types and turrets, once.
 
         """
+        if self.bb_dict is not None:
+            return
         bb_cfg = path.join(
             path.dirname(path.realpath(__file__)), "../configs/battleshipConfig.py"
         )
-        self.bb_dict, _ = Config._file2dict(bb_cfg)
+        self.bb_dict = ConfigRegistry.copy(bb_cfg)
 
         ca_cfg = path.join(
             path.dirname(path.realpath(__file__)), "../configs/cruiserConfig.py"
         )
-        self.ca_dict, _ = Config._file2dict(ca_cfg)
+        self.ca_dict = ConfigRegistry.copy(ca_cfg)
 
         dd_cfg = path.join(
             path.dirname(path.realpath(__file__)), "../configs/destroyerConfig.py"
         )
-        self.dd_dict, _ = Config._file2dict(dd_cfg)
+        self.dd_dict = ConfigRegistry.copy(dd_cfg)
 
         # pt_cfg = path.join(
         #     path.dirname(path.realpath(__file__)), "../configs/corvetteConfig.py"
@@ -130,22 +164,7 @@ class BattleSetup:
         tur_cfg = path.join(
             path.dirname(path.realpath(__file__)), "../configs/turretConfig.py"
         )
-        self.tur_dict, _ = Config._file2dict(tur_cfg)
-
-        map_cfg = path.join(
-            path.dirname(path.realpath(__file__)), "../configs/mapGenConfig.py"
-        )
-        self.map_dict, _ = Config._file2dict(map_cfg)
-
-        self.currentMapConfig = {}
-        self.currentShip = {}
-        self.currentTurDict = {}
-        self.allShips = {}
-        self.radioButtonsEnabled = False
-        self.shipCounter = 0
-        self.currentShipKey = 0
-        self.fleetCost = 0
-        self.resetMapConfig()
+        self.tur_dict = ConfigRegistry.copy(tur_cfg)
 
     def createFleetUi(self):
         """
@@ -159,6 +178,7 @@ class BattleSetup:
         Generates fleet creator UI, binds buttons and actions to function.
 
         """
+        self.loadFleetConfigs()
         fleet_setup = QtWidgets.QDialog()
         fleet_setup.setObjectName("fleet_setup")
         fleet_setup.resize(812, 660)
@@ -1380,27 +1400,9 @@ class BattleSetup:
         Adds a reference into the list.
 
         """
-        if self.currentShip["naming"]["_type"] == "BB":
-            name_file = path.join(
-                path.dirname(path.realpath(__file__)),
-                "../../resources/names/names_battleships.txt",
-            )
-        elif self.currentShip["naming"]["_type"] == "CA":
-            name_file = path.join(
-                path.dirname(path.realpath(__file__)),
-                "../../resources/names/names_cruisers.txt",
-            )
-        elif self.currentShip["naming"]["_type"] == "DD":
-            name_file = path.join(
-                path.dirname(path.realpath(__file__)),
-                "../../resources/names/names_destroyers.txt",
-            )
-        elif self.currentShip["naming"]["_type"] == "PT":
-            name_file = path.join(
-                path.dirname(path.realpath(__file__)),
-                "../../resources/names/names_submarine.txt",
-            )
-        self.currentShip["naming"]["_name"] = Imports.random_name(name_file)
+        self.currentShip["naming"]["_name"] = NamePool.draw(
+            self.currentShip["naming"]["_type"]
+        )
         self.allShips[self.shipCounter] = copy.deepcopy(self.currentShip)
         self.listView.addToList(
             self.shipCounter,
@@ -1431,7 +1433,8 @@ class BattleSetup:
         """
         for shipKey in shipKeysList:
             try:
-                self.allShips.pop(shipKey)
+                naming = self.allShips.pop(shipKey)["naming"]
+                NamePool.release(naming["_type"], naming["_name"])
             except KeyError as ke:
                 print("Could not find ship to delete", "\n", ke)
 
@@ -1449,6 +1452,8 @@ class BattleSetup:
         Clears the current fleet from all ships.
 
         """
+        for ship in self.allShips.values():
+            NamePool.release(ship["naming"]["_type"], ship["naming"]["_name"])
         self.allShips.clear()
         self.listView.clearList()
         self.updateFleetCost()
@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: BatchRenderer.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import numpy as np
+
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import QBrush, QColor, QPainterPath, QPen, QTransform
+from PyQt5.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+from library.displays.LevelOfDetail import LevelOfDetail as lod
+
+
+class RenderLayer(QGraphicsItem):
+    """
+
+    Base class of the layers of the batched renderer. A layer is a single item
+    painting all the entities of its layer, bounded by the area they cover.
+    Its shape is empty, so hit tests (selection, hover, collisions) go through
+    it to the entity items below. Each layer paints the entities intersecting
+    the exposed rect of the paint option.
+
+    ...
+
+    Attributes
+    ----------
+    renderer : BatchRenderer
+        The renderer owning the layer.
+
+    Methods
+    -------
+    __init__(renderer : BatchRenderer, zValue : float)
+        The constructor of the class.
+
+    refresh()
+        Fits the bounds of the layer to its entities and repaints it.
+
+    boundingRect()
+        Returns the area covered by the entities, as of the last refresh.
+
+    shape()
+        Returns an empty shape, so that the layer is never hit.
+
+    """
+
+    def __init__(self, renderer, zValue):
+        """
+
+        Parameters
+        ----------
+        renderer : BatchRenderer
+            The renderer owning the layer.
+        zValue : float
+            The z value of the entities of the layer.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class.
+
+        """
+        super(RenderLayer, self).__init__()
+
+        self.renderer = renderer
+        self.setZValue(zValue)
+        self.setData(2, False)  # Not an obstacle
+        self.setAcceptHoverEvents(False)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self._bounds = QRectF()
+
+    def refresh(self):
+        # Moving the bounds repaints the area they leave, update() the new one
+        bounds = self.bounds()
+        if bounds != self._bounds:
+            self.prepareGeometryChange()
+            self._bounds = bounds
+        self.update()
+
+    def boundingRect(self):
+        return self._bounds
+
+    def shape(self):
+        return QPainterPath()
+
+
+def hullsBounds(store, margin):
+    # The hulls of the kinematics store at their displayed state, whatever
+    # their heading
+    if not store.ships:
+        return QRectF()
+    reach = np.hypot(store.halfWidth, store.halfHeight) + margin
+    centersX = store.renderX + store.halfWidth
+    centersY = store.renderY + store.halfHeight
+    x0 = float((centersX - reach).min())
+    y0 = float((centersY - reach).min())
+    x1 = float((centersX + reach).max())
+    y1 = float((centersY + reach).max())
+    return QRectF(x0, y0, x1 - x0, y1 - y0)
+
+
+def itemsBounds(items, margin=0):
+    bounds = QRectF()
+    for item in items:
+        bounds = bounds.united(item.sceneBoundingRect())
+    if bounds.isNull():
+        return bounds
+    return bounds.adjusted(-margin, -margin, margin, margin)
+
+
+class HullLayer(RenderLayer):
+    """
+
+    Paints all the hulls from the interpolated arrays of the kinematics store,
+    grouped by style. Hulls too small on screen are drawn as points.
+
+    """
+
+    # (tag, selected) -> (brush color, pen color)
+    styles = {
+        ("ALLY", False): ("blue", "darkBlue"),
+        ("ALLY", True): ("green", "darkGreen"),
+        ("ENNEMY", False): ("red", "darkred"),
+        ("ENNEMY", True): ("yellow", "red"),
+    }
+    thk = 10
+
+    def __init__(self, renderer, zValue):
+        super(HullLayer, self).__init__(renderer, zValue)
+        self.tools = {
+            key: (QBrush(QColor(brush)), QPen(QColor(pen), self.thk))
+            for key, (brush, pen) in self.styles.items()
+        }
+
+    def bounds(self):
+        return hullsBounds(self.renderer.world.kinematics, self.thk)
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        store = self.renderer.world.kinematics
+        if not store.ships:
+            return
+        centersX = (store.renderX + store.halfWidth).tolist()
+        centersY = (store.renderY + store.halfHeight).tolist()
+        headings = store.renderHeading.tolist()
+        halfWidths = store.halfWidth.tolist()
+        halfHeights = store.halfHeight.tolist()
+        groups = {}
+        for i, ship in enumerate(store.ships):
+            reach = max(halfWidths[i], halfHeights[i]) + self.thk
+            if not exposed.intersects(
+                QRectF(centersX[i] - reach, centersY[i] - reach, 2 * reach, 2 * reach)
+            ):
+                continue
+            key = (ship.data(1), ship.isSelected())
+            groups.setdefault(key, []).append(i)
+
+        scale = lod.scale(painter)
+        base = painter.worldTransform()
+        for key, indexes in groups.items():
+            if key not in self.tools:
+                continue
+            brush, pen = self.tools[key]
+            painter.setBrush(brush)
+            painter.setPen(lod.dotPen(self.styles[key][0]))
+            dots = {i for i in indexes if lod.isPoint(scale, 2 * halfWidths[i])}
+            for i in dots:
+                painter.drawPoint(QPointF(centersX[i], centersY[i]))
+            painter.setPen(pen)
+            for i in indexes:
+                if i in dots:
+                    continue
+                w, h = halfWidths[i], halfHeights[i]
+                transform = QTransform()
+                transform.translate(centersX[i], centersY[i])
+                transform.rotate(headings[i])
+                painter.setWorldTransform(transform * base)
+                painter.drawEllipse(QRectF(-w, -h, 2 * w, 2 * h))
+        painter.setWorldTransform(base)
+
+
+class TurretLayer(RenderLayer):
+    """
+
+    Paints all the turrets of the ships with shared tools. Turrets too small
+    on screen are not drawn.
+
+    """
+
+    def __init__(self, renderer, zValue):
+        super(TurretLayer, self).__init__(renderer, zValue)
+        self.brush = QBrush(QColor("darkGray"))
+        self.pens = {}
+
+    def bounds(self):
+        # The turrets are inside the hulls of their ships
+        return hullsBounds(self.renderer.world.kinematics, HullLayer.thk)
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        scale = lod.scale(painter)
+        painter.setBrush(self.brush)
+        currentThk = None
+        for ship in self.renderer.world.kinematics.ships:
+            for turret in ship.weapons["turrets_list"]:
+                if lod.isHidden(scale, turret.rect().width()):
+                    continue
+                polygon = turret.mapToScene(turret.rect())
+                if not exposed.intersects(polygon.boundingRect()):
+                    continue
+                if turret.thk != currentThk:
+                    currentThk = turret.thk
+                    if currentThk not in self.pens:
+                        self.pens[currentThk] = QPen(QColor("black"), currentThk)
+                    painter.setPen(self.pens[currentThk])
+                painter.drawPolygon(polygon)
+
+
+class ShellLayer(RenderLayer):
+    """
+
+    Paints all the projectiles in flight, grouped by colors and thickness.
+    Projectiles too small on screen are not drawn.
+
+    """
+
+    thk = 10  # The thickest projectile pen
+
+    def __init__(self, renderer, zValue):
+        super(ShellLayer, self).__init__(renderer, zValue)
+        self.tools = {}
+
+    def bounds(self):
+        return itemsBounds(self.renderer.world.projectiles, self.thk)
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        scale = lod.scale(painter)
+        groups = {}
+        for projectile in self.renderer.world.projectiles:
+            if lod.isHidden(scale, projectile.rect().width()):
+                continue
+            polygon = projectile.mapToScene(projectile.rect())
+            if not exposed.intersects(polygon.boundingRect()):
+                continue
+            key = (tuple(projectile.colors), projectile.thk)
+            groups.setdefault(key, []).append(polygon)
+        for (colors, thk), polygons in groups.items():
+            if (colors, thk) not in self.tools:
+                self.tools[(colors, thk)] = (
+                    QBrush(QColor(colors[0])),
+                    QPen(QColor(colors[1]), thk),
+                )
+            brush, pen = self.tools[(colors, thk)]
+            painter.setBrush(brush)
+            painter.setPen(pen)
+            for polygon in polygons:
+                painter.drawPolygon(polygon)
+
+
+class OverlayLayer(RenderLayer):
+    """
+
+    Paints the visible gizmos of all the ships.
+
+    """
+
+    def __init__(self, renderer, zValue):
+        super(OverlayLayer, self).__init__(renderer, zValue)
+        self.option = QStyleOptionGraphicsItem()
+
+    def bounds(self):
+        return itemsBounds(
+            gizmo
+            for ship in self.renderer.world.kinematics.ships
+            for gizmo in ship.displays.values()
+            if gizmo.isVisible()
+        )
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        base = painter.worldTransform()
+        for ship in self.renderer.world.kinematics.ships:
+            for gizmo in ship.displays.values():
+                if gizmo.isVisible() and exposed.intersects(gizmo.sceneBoundingRect()):
+                    painter.setWorldTransform(gizmo.sceneTransform() * base)
+                    gizmo.paint(painter, self.option)
+        painter.setWorldTransform(base)
+
+
+class BatchRenderer:
+    """
+
+    An optional renderer painting the battle in one item per layer: hulls,
+    turrets, shells and overlays. The terrain is painted in the scene
+    background by the terrain pyramid. The entity items stay in the scene,
+    for selection, hover and collisions, but are flagged ItemHasNoContents so
+    that Qt does not paint them one by one.
+
+    ...
+
+    Attributes
+    ----------
+    world : World
+        The battle to render.
+
+    gameScene : GameScene
+        The main display of the game.
+
+    layers : dict
+        The render layers, by name.
+
+    Methods
+    -------
+    __init__(world : World, gameScene : GameScene)
+        The constructor of the class.
+
+    adopt(item : QGraphicsItem)
+        Stops Qt from painting item, the layers paint it instead.
+
+    release(item : QGraphicsItem)
+        Lets Qt paint item again.
+
+    adoptShip(ship : Ship)
+        Adopts a ship, its turrets and its gizmos.
+
+    releaseShip(ship : Ship)
+        Releases a ship, its turrets and its gizmos.
+
+    update()
+        Repaints the layers. Called once per rendered frame.
+
+    close()
+        Removes the layers and releases all the adopted items.
+
+    """
+
+    def __init__(self, world, gameScene):
+        """
+
+        Parameters
+        ----------
+        world : World
+            The battle to render.
+        gameScene : GameScene
+            The main display of the game.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class. Adds the layers to the game scene and
+        adopts the entities already in battle.
+
+        """
+        self.world = world
+        self.gameScene = gameScene
+        self.adopted = set()
+        self.layers = {
+            "hulls": HullLayer(self, 2),
+            "turrets": TurretLayer(self, 3),
+            "shells": ShellLayer(self, 4),
+            "overlays": OverlayLayer(self, 5),
+        }
+        for layer in self.layers.values():
+            gameScene.addItem(layer)
+        for ship in world.ships:
+            self.adoptShip(ship)
+        for projectile in world.projectiles:
+            self.adopt(projectile)
+        self.update()
+
+    def adopt(self, item):
+        """
+
+        Parameters
+        ----------
+        item : QGraphicsItem
+            An entity item painted by a layer.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Stops Qt from painting item, the layers paint it instead.
+
+        """
+        item.setFlag(QGraphicsItem.ItemHasNoContents, True)
+        self.adopted.add(item)
+
+    def release(self, item):
+        """
+
+        Parameters
+        ----------
+        item : QGraphicsItem
+            An adopted item.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Lets Qt paint item again, when it leaves the battle or the renderer
+        is closed.
+
+        """
+        if item in self.adopted:
+            self.adopted.discard(item)
+            item.setFlag(QGraphicsItem.ItemHasNoContents, False)
+
+    def adoptShip(self, ship):
+        """
+
+        Parameters
+        ----------
+        ship : Ship
+            A ship entering the battle.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Adopts a ship, its turrets and its gizmos.
+
+        """
+        self.adopt(ship)
+        for turret in ship.weapons["turrets_list"]:
+            self.adopt(turret)
+        for gizmo in ship.displays.values():
+            self.adopt(gizmo)
+
+    def releaseShip(self, ship):
+        """
+
+        Parameters
+        ----------
+        ship : Ship
+            A ship leaving the battle.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Releases a ship, its turrets and its gizmos.
+
+        """
+        self.release(ship)
+        for turret in ship.weapons["turrets_list"]:
+            self.release(turret)
+        for gizmo in ship.displays.values():
+            self.release(gizmo)
+
+    def update(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Fits the layers to their entities and repaints them. Called once per
+        rendered frame.
+
+        """
+        for layer in self.layers.values():
+            layer.refresh()
+
+    def close(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes the layers from the game scene, and lets Qt paint the adopted
+        items again.
+
+        """
+        for item in list(self.adopted):
+            self.release(item)
+        for layer in self.layers.values():
+            if layer.scene() is self.gameScene:
+                self.gameScene.removeItem(layer)
@@ -9,12 +9,13 @@
     Python version: 3.8.1
 """
 
-from library.Ship import Ship
 from PyQt5.QtCore import QRectF, Qt, QPointF
 from PyQt5.QtGui import QPen, QBrush, QColor
-from PyQt5.QtWidgets import QGraphicsScene, QGraphicsView
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsView
 
-from library import Island, Waypoint
+from library import Island, DebugOverlay
+from library.InGameData import ShipRoster
+from library.displays.TerrainPyramid import TerrainPyramid
 from library.utils.MathsFormulas import Geometrics as geo, Cinematics as cin
 
 
@@ -23,10 +24,9 @@ class GameScene(QGraphicsScene):
     attachedGView = None
     attachedLView = None
     attachedGController = None
+    attachedWorld = None
     nextShipID = 0
     currentItem = None
-    waypoints = []  # Deletable points
-    trajpoints = []  # Permanent points
 
     def __init__(self, parent=None):
         super(GameScene, self).__init__(parent)
@@ -37,7 +37,12 @@ class GameScene(QGraphicsScene):
         self.innerBB = 0
         self.innerArea = 0
         self.shipList = {}
+        self.roster = ShipRoster()
         self.islandsList = []
+        self.debugOverlay = DebugOverlay.DebugOverlay()
+        self.addItem(self.debugOverlay)
+        # Static geometry of the map, painted in the background
+        self.terrain = TerrainPyramid()
 
     def mousePressEvent(self, mouseDown):
         if (self.innerBL <= int(mouseDown.scenePos().x()) <= self.innerBR) and (
@@ -49,7 +54,7 @@ class GameScene(QGraphicsScene):
             if mouseDown.button() == Qt.LeftButton:
                 if selected_item:
                     self.attachedLView.selectInList([selected_item.data(0)])
-                    if self.attachedGController and isinstance(selected_item, Ship):
+                    if self.attachedGController and selected_item.data(3) == "SHIP":
                         self.attachedGController.display_current_ship_stats(
                             selected_item
                         )
@@ -67,7 +72,7 @@ class GameScene(QGraphicsScene):
                         item.setTarget()
                     mouseDown.accept()
                 elif selected_item:
-                    if isinstance(selected_item, Ship):
+                    if selected_item.data(3) == "SHIP":
                         for item in self.selectedItems():
                             if selected_item.data(1) == "ISLAND":
                                 continue
@@ -90,48 +95,68 @@ class GameScene(QGraphicsScene):
         self.innerBT = int(mapExtension)
         self.innerBB = int(innerMap + mapExtension)
 
+    def drawBackground(self, painter, rect):
+        super(GameScene, self).drawBackground(painter, rect)
+        self.terrain.paint(painter, rect)
+
     def displayMap(self, obstaclesList):
+        self.terrain.setSceneRect(self.sceneRect())
         for obstacle in obstaclesList:
             self.currentItem = Island.Island(self, obstacle)
             self.currentItem.setData(0, None)
             self.currentItem.setData(1, "ISLAND")
             self.currentItem.setZValue(1)
+            # Painted by the terrain pyramid, the item is kept for the queries
+            self.currentItem.setFlag(QGraphicsItem.ItemHasNoContents, True)
             self.addItem(self.currentItem)
             self.islandsList.append(self.currentItem)
             self.currentItem = None
+        self.terrain.setIslands(self.islandsList)
         self.disp_Map_Borders()
 
     def shipsInDetectionRange(self, refShip):
         shipsInDRange = []
 
-        for ship in self.shipList.values():
-            if (ship.data(0) != refShip.data(0)) & (ship.data(1) != refShip.data(1)):
-                effScanRange = (
-                    refShip.instant_vars["detection_range"]
-                    - (refShip.instant_vars["detection_range"] - 1000)
-                    * ship.instant_vars["concealement"]
-                )
-                shipCenter = geo.parallelepiped_Center(
-                    ship.pos(), ship.rect().width(), ship.rect().height()
-                )
-                refShipCenter = geo.parallelepiped_Center(
-                    refShip.pos(), refShip.rect().width(), refShip.rect().height()
-                )
-                distance = geo.distance_A_B(refShipCenter, shipCenter)
-                if distance <= effScanRange:
-                    shipsInDRange.append(ship)
+        for ship in self.roster.opponents(refShip.data(1)):
+            effScanRange = (
+                refShip.instant_vars.detection_range
+                - (refShip.instant_vars.detection_range - 1000)
+                * ship.instant_vars.concealement
+            )
+            distance = geo.distance_A_B(
+                refShip.coordinates.center, ship.coordinates.center
+            )
+            if distance <= effScanRange:
+                shipsInDRange.append(ship)
         return shipsInDRange
 
-    def detectionRay(self, origin, angleInRad, distance, resolution, offset=0):
+    def isIsland(self, pos):
+        for _item in self.items(pos):
+            if _item.data(1) == "ISLAND":
+                return True
+        return False
+
+    def isObstacle(self, pos, ignore=None):
+        # The ships are tested at their simulated state, not at the position
+        # of their items, which is interpolated for the display
+        if self.isIsland(pos):
+            return True
+        if self.attachedWorld:
+            for ship in self.attachedWorld.kinematics.shipsAt(pos.x(), pos.y()):
+                if ship is not ignore:
+                    return True
+        return False
+
+    def detectionRay(
+        self, origin, angleInRad, distance, resolution, offset=0, ignore=None
+    ):
         currentPos = origin
 
         for i in range(offset, distance - resolution, resolution):
             currentPos = cin.movementBy(currentPos, i, angleInRad)
             # self.addLine(origin.x(), origin.y(), currentPos.x(), currentPos.y())
-            _item = self.itemAt(currentPos, self.attachedGView.transform())
-            if _item:
-                if _item.data(2):
-                    return i
+            if self.isObstacle(currentPos, ignore):
+                return i
         return None
 
     def isInLineOfSight(self, origin, target, resolution):
@@ -141,17 +166,15 @@ class GameScene(QGraphicsScene):
 
         while int(geo.distance_A_B(origin, currentPos)) < distance:
             currentPos = cin.movementBy(currentPos, resolution, angleInrad)
-            _item = self.itemAt(currentPos, self.attachedGView.transform())
-            if _item:
-                if _item.data(1) == "ISLAND":
-                    # self.addLine(
-                    #     origin.x(),
-                    #     origin.y(),
-                    #     currentPos.x(),
-                    #     currentPos.y(),
-                    #     QPen(QColor("red"), 4),
-                    # )
-                    return False
+            if self.isIsland(currentPos):
+                # self.addLine(
+                #     origin.x(),
+                #     origin.y(),
+                #     currentPos.x(),
+                #     currentPos.y(),
+                #     QPen(QColor("red"), 4),
+                # )
+                return False
         # self.addLine(
         #     origin.x(),
         #     origin.y(),
@@ -180,70 +203,23 @@ class GameScene(QGraphicsScene):
         return True
 
     def dispGrid(self, step):
-        for i in range(0, int(self.height()), step):
-            self.addLine(0, i, int(self.width()), i, QPen(QColor("black"), 4))
-
-        for i in range(0, int(self.width()), step):
-            self.addLine(i, 0, i, self.height(), QPen(QColor("black"), 4))
+        self.terrain.setGrid(step)
+        self.invalidate(self.sceneRect(), QGraphicsScene.BackgroundLayer)
 
     def disp_Map_Borders(self):
-        self.addLine(
-            self.innerBL,
-            self.innerBT,
-            self.innerBR,
-            self.innerBT,
-            QPen(QColor("red"), 60),
-        )
-        self.addLine(
-            self.innerBL,
-            self.innerBT,
-            self.innerBL,
-            self.innerBB,
-            QPen(QColor("red"), 60),
-        )
-        self.addLine(
-            self.innerBR,
-            self.innerBT,
-            self.innerBR,
-            self.innerBB,
-            QPen(QColor("red"), 60),
-        )
-        self.addLine(
-            self.innerBL,
-            self.innerBB,
-            self.innerBR,
-            self.innerBB,
-            QPen(QColor("red"), 60),
+        self.terrain.setBorders(
+            QRectF(
+                self.innerBL,
+                self.innerBT,
+                self.innerBR - self.innerBL,
+                self.innerBB - self.innerBT,
+            )
         )
+        self.invalidate(self.sceneRect(), QGraphicsScene.BackgroundLayer)
 
     def dispPenalties(self, penaltyMap, step):
-        baseColor = [255, 255, 255]
-
-        for i, line in enumerate(penaltyMap):
-            for j, penalty in enumerate(line):
-                c_color = QColor(
-                    baseColor[0] * ((100 - penalty * 10) / 100),
-                    baseColor[1] * ((100 - penalty * 10) / 100),
-                    baseColor[2] * ((100 - penalty * 10) / 100),
-                )
-                self.addRect(
-                    j * step, i * step, step, step, QPen(c_color), QBrush(c_color)
-                )
-
-    def printPoint(self, point, size, color, permanent=False):
-        c_point = Waypoint.Waypoint(
-            point.x() - int(size / 2), point.y() - int(size / 2), size, size, color
-        )
-        if permanent:
-            self.trajpoints.append(c_point)
-        else:
-            self.waypoints.append(c_point)
-        self.addItem(c_point)
-
-    def clearWaypoints(self):
-        for item in self.waypoints:
-            self.removeItem(item)
-        self.waypoints.clear()
+        self.terrain.setPenalties(penaltyMap, step)
+        self.invalidate(self.sceneRect(), QGraphicsScene.BackgroundLayer)
 
     def addShip(self, shipObject):
         thisShipId = self.nextShipID
@@ -256,6 +232,20 @@ class GameScene(QGraphicsScene):
                 thisShipId, shipObject.naming["_type"], shipObject.naming["_name"]
             )
         self.nextShipID += 1
+        self.roster.add(shipObject)
+
+    def removeShip(self, shipObject):
+        self.shipList.pop(shipObject.data(0), None)
+        self.roster.remove(shipObject)
+        if shipObject.data(1) == "ALLY":
+            self.attachedLView.removeFromList([shipObject.data(0)])
+        if (
+            self.attachedGController
+            and self.attachedGController.currently_displayed_ship is shipObject
+        ):
+            self.attachedGController.display_current_ship_stats()
+        self.debugOverlay.clearWaypoints(shipObject)
+        self.removeItem(shipObject)
 
     def select_unselect_items(self, item_ids_list):
         item_to_display = None
@@ -278,12 +268,14 @@ class GameScene(QGraphicsScene):
             self.removeItem(item)
         self.islandsList.clear()
 
-        self.clearWaypoints()
-        for item in self.trajpoints:
-            self.removeItem(item)
-        self.trajpoints.clear()
+        self.terrain.clear()
+        self.invalidate(self.sceneRect(), QGraphicsScene.BackgroundLayer)
 
+        # The debug overlay outlives the battles
+        self.debugOverlay.clear()
+        self.removeItem(self.debugOverlay)
         self.clear()
+        self.addItem(self.debugOverlay)
         self.update()
 
     def destroyObject(self, _object):
@@ -291,8 +283,12 @@ class GameScene(QGraphicsScene):
         del _object
 
     def clearGameScene(self):
+        if self.attachedWorld:
+            self.attachedWorld.detach()
         for ship in self.shipList.values():
             self.removeItem(ship)
+        self.shipList.clear()
+        self.roster.clear()
         self.nextShipID = 0
         self.clearMap()
 
@@ -321,6 +317,8 @@ class GameView(QGraphicsView):
         self.zoomInFactor = 1.1
         self.zoomOutFactor = 1 / self.zoomInFactor
         self.ctrlKeyDown = False
+        # The background only holds the static terrain
+        self.setCacheMode(QGraphicsView.CacheBackground)
 
     def wheelEvent(self, event):
         """
@@ -391,12 +389,20 @@ class GameView(QGraphicsView):
         If the key pressed is Control, set the bool ctrlKeyDown to True.
         If the key pressed is Back, reset the transform of the GraphicView,
         along with reseting the view anchors to center and scaling it back to 1.
+        If the key pressed is F3, switch the debug overlay on or off.
+        If the key pressed is F4, switch the batched renderer on or off.
 
         """
         if keyEvent.key() == Qt.Key_Control:
             self.ctrlKeyDown = True
         if keyEvent.key() == Qt.Key_Backspace:
             self.resetZoom()
+        if keyEvent.key() == Qt.Key_F3:
+            overlay = self.gameScene.debugOverlay
+            overlay.setOverlayEnabled(not overlay.enabled)
+        if keyEvent.key() == Qt.Key_F4 and self.gameScene.attachedWorld:
+            world = self.gameScene.attachedWorld
+            world.setBatchedRendering(world.renderer is None)
         super(GameView, self).keyPressEvent(keyEvent)
 
     def keyReleaseEvent(self, keyEvent):
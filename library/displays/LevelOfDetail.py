@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: LevelOfDetail.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QPen
+from PyQt5.QtWidgets import QStyleOptionGraphicsItem
+
+
+class LevelOfDetail:
+    """
+
+    The level of detail policies of the battle display. They are keyed on the
+    size an item has on screen, which is its size in the scene times the scale
+    of the view (the GameView zoom times the scale fitting the map in the
+    view), so that they do not depend on the size of the map.
+
+    ...
+
+    Attributes
+    ----------
+    pointSize : int
+        Under this on screen length, in pixels, a ship is drawn as a point.
+
+    hideSize : int
+        Under this on screen length, in pixels, turrets and shells are not
+        drawn.
+
+    dotWidth : int
+        The on screen diameter of a ship drawn as a point, in pixels.
+
+    Methods
+    -------
+    scale(painter : QPainter)
+        Returns the number of pixels per scene unit of painter.
+
+    isPoint(scale : float, length : float)
+        Returns True if an item of this length is drawn as a point.
+
+    isHidden(scale : float, length : float)
+        Returns True if a detail item of this length is not drawn.
+
+    isThin(scale : float, thickness : float)
+        Returns True if a line of this thickness is thinner than a pixel.
+
+    dotPen(color : str)
+        Returns the pen drawing a ship as a point.
+
+    thinPen(color : str)
+        Returns a one pixel wide pen.
+
+    """
+
+    pointSize = 12
+    hideSize = 3
+    dotWidth = 6
+    _pens = {}
+
+    @staticmethod
+    def scale(painter):
+        """
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter of an item.
+
+        Returns
+        -------
+        float
+            The number of pixels per scene unit.
+
+        """
+        return QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+            painter.worldTransform()
+        )
+
+    @classmethod
+    def isPoint(cls, scale, length):
+        return length * scale < cls.pointSize
+
+    @classmethod
+    def isHidden(cls, scale, length):
+        return length * scale < cls.hideSize
+
+    @classmethod
+    def isThin(cls, scale, thickness):
+        return thickness * scale < 1
+
+    @classmethod
+    def _cosmeticPen(cls, color, width):
+        key = (color, width)
+        if key not in cls._pens:
+            pen = QPen(QColor(color), width)
+            pen.setCosmetic(True)
+            pen.setCapStyle(Qt.RoundCap)
+            cls._pens[key] = pen
+        return cls._pens[key]
+
+    @classmethod
+    def dotPen(cls, color):
+        """
+
+        Parameters
+        ----------
+        color : str
+            The color of the point.
+
+        Returns
+        -------
+        QPen
+            A round, cosmetic pen, drawing points of dotWidth pixels whatever
+            the zoom.
+
+        """
+        return cls._cosmeticPen(color, cls.dotWidth)
+
+    @classmethod
+    def thinPen(cls, color):
+        """
+
+        Parameters
+        ----------
+        color : str
+            The color of the line.
+
+        Returns
+        -------
+        QPen
+            A cosmetic pen, one pixel wide whatever the zoom.
+
+        """
+        return cls._cosmeticPen(color, 1)
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: TerrainPyramid.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import math
+
+from collections import OrderedDict
+
+from PyQt5.QtCore import QLineF, QRectF, Qt
+from PyQt5.QtGui import QBrush, QColor, QImage, QPainter, QPen, QPixmap
+
+
+class TerrainPyramid:
+    """
+
+    A cache of the static geometry of a map (islands, map borders, penalty
+    heat map and grid) pre-rendered into pixmap tiles, at several zoom levels.
+    Each level doubles the resolution of the previous one. Tiles are rendered
+    the first time they are displayed, then blitted, so that panning and
+    zooming do not repaint the static geometry. The least recently used tiles
+    are dropped past maxTiles.
+
+    ...
+
+    Attributes
+    ----------
+    tileSize : int
+        The size of a tile, in pixels.
+
+    nLevels : int
+        The number of zoom levels.
+
+    maxTiles : int
+        The maximum number of tiles kept in memory.
+
+    sceneRect : QRectF
+        The area covered by the pyramid.
+
+    Methods
+    -------
+    __init__(tileSize[256] : int, nLevels[7] : int, maxTiles[256] : int)
+        The constructor of the class.
+
+    setSceneRect(rect : QRectF)
+        Sets the area covered by the pyramid.
+
+    setIslands(islands : list of Island)
+        Sets the islands to render.
+
+    setBorders(rect : QRectF)
+        Sets the borders of the playable area to render.
+
+    setGrid(step : int)
+        Sets the step of the grid to render, None for no grid.
+
+    setPenalties(penaltyMap : list of lists, step : int)
+        Sets the penalty heat map to render.
+
+    clear()
+        Removes all the geometry and tiles.
+
+    invalidate()
+        Drops all the rendered tiles.
+
+    paint(painter : QPainter, rect : QRectF)
+        Draws the tiles covering rect, at the level matching the painter scale.
+
+    """
+
+    tileSize = 256
+    nLevels = 7
+    maxTiles = 256
+    borderPen = QPen(QColor("red"), 60)
+    gridPen = QPen(QColor("black"), 4)
+
+    def __init__(self, tileSize=256, nLevels=7, maxTiles=256):
+        """
+
+        Parameters
+        ----------
+        tileSize : int, optional
+            The size of a tile, in pixels. The default is 256.
+        nLevels : int, optional
+            The number of zoom levels. The default is 7.
+        maxTiles : int, optional
+            The maximum number of tiles kept in memory. The default is 256.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        The constructor of the class.
+
+        """
+        self.tileSize = tileSize
+        self.nLevels = nLevels
+        self.maxTiles = maxTiles
+        self.sceneRect = QRectF()
+        self.islands = []
+        self.borders = None
+        self.gridStep = None
+        self.penalties = None
+        self.penaltiesRect = None
+        self.scales = []
+        self.tiles = OrderedDict()  # (level, column, row) -> QPixmap
+
+    def setSceneRect(self, rect):
+        """
+
+        Parameters
+        ----------
+        rect : QRectF
+            The area covered by the pyramid, usually the scene rect.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Sets the area covered by the pyramid. The coarsest level fits the
+        whole area in a single tile.
+
+        """
+        self.sceneRect = QRectF(rect)
+        side = max(rect.width(), rect.height(), 1)
+        self.scales = [self.tileSize / side * 2 ** k for k in range(self.nLevels)]
+        self.invalidate()
+
+    def setIslands(self, islands):
+        """
+
+        Parameters
+        ----------
+        islands : list of Island
+            The islands of the map.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Sets the islands to render.
+
+        """
+        self.islands = [
+            (island.polygon().boundingRect(), island.polygon(), island)
+            for island in islands
+        ]
+        self.invalidate()
+
+    def setBorders(self, rect):
+        """
+
+        Parameters
+        ----------
+        rect : QRectF
+            The playable area.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Sets the borders of the playable area to render.
+
+        """
+        self.borders = QRectF(rect)
+        self.invalidate()
+
+    def setGrid(self, step):
+        """
+
+        Parameters
+        ----------
+        step : int
+            The size of a grid cell, None for no grid.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Sets the step of the grid to render.
+
+        """
+        self.gridStep = step
+        self.invalidate()
+
+    def setPenalties(self, penaltyMap, step):
+        """
+
+        Parameters
+        ----------
+        penaltyMap : list of lists of int
+            The penalty of each cell of the map, row by row, in [0, 10].
+        step : int
+            The size of a cell.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Sets the penalty heat map to render. It is stored as an image with one
+        pixel per cell, stretched over the map when a tile is rendered.
+
+        """
+        rows = len(penaltyMap)
+        columns = len(penaltyMap[0]) if rows else 0
+        image = QImage(max(columns, 1), max(rows, 1), QImage.Format_RGB32)
+        image.fill(QColor("white"))
+        for i, line in enumerate(penaltyMap):
+            for j, penalty in enumerate(line):
+                value = int(255 * ((100 - penalty * 10) / 100))
+                image.setPixelColor(j, i, QColor(value, value, value))
+        self.penalties = image
+        self.penaltiesRect = QRectF(0, 0, columns * step, rows * step)
+        self.invalidate()
+
+    def clear(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes all the geometry and tiles.
+
+        """
+        self.islands = []
+        self.borders = None
+        self.gridStep = None
+        self.penalties = None
+        self.penaltiesRect = None
+        self.invalidate()
+
+    def invalidate(self):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Drops all the rendered tiles, to be rendered again when displayed.
+
+        """
+        self.tiles.clear()
+
+    def _level(self, viewScale):
+        for level, scale in enumerate(self.scales):
+            if scale >= viewScale:
+                return level
+        return len(self.scales) - 1
+
+    def _renderTile(self, level, column, row):
+        scale = self.scales[level]
+        tileSide = self.tileSize / scale
+        area = QRectF(
+            self.sceneRect.left() + column * tileSide,
+            self.sceneRect.top() + row * tileSide,
+            tileSide,
+            tileSide,
+        )
+        pixmap = QPixmap(self.tileSize, self.tileSize)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.scale(scale, scale)
+        painter.translate(-area.left(), -area.top())
+
+        if self.penalties is not None and self.penaltiesRect.intersects(area):
+            painter.drawImage(self.penaltiesRect, self.penalties)
+        if self.gridStep:
+            painter.setPen(self.gridPen)
+            step = self.gridStep
+            for y in range(
+                int(area.top() // step) * step, int(area.bottom()) + 1, step
+            ):
+                painter.drawLine(QLineF(area.left(), y, area.right(), y))
+            for x in range(
+                int(area.left() // step) * step, int(area.right()) + 1, step
+            ):
+                painter.drawLine(QLineF(x, area.top(), x, area.bottom()))
+        for bounds, polygon, island in self.islands:
+            margin = island.thickness
+            if bounds.adjusted(-margin, -margin, margin, margin).intersects(area):
+                painter.setBrush(QBrush(island.colorInner))
+                painter.setPen(QPen(island.colorBorder, island.thickness, Qt.SolidLine))
+                painter.drawPolygon(polygon)
+        if self.borders is not None:
+            painter.setPen(self.borderPen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(self.borders)
+        painter.end()
+        return pixmap
+
+    def _tile(self, level, column, row):
+        key = (level, column, row)
+        pixmap = self.tiles.get(key)
+        if pixmap is None:
+            pixmap = self._renderTile(level, column, row)
+            self.tiles[key] = pixmap
+            if len(self.tiles) > self.maxTiles:
+                self.tiles.popitem(last=False)
+        else:
+            self.tiles.move_to_end(key)
+        return pixmap
+
+    def paint(self, painter, rect):
+        """
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter of the scene background, in scene coordinates.
+        rect : QRectF
+            The exposed area of the scene.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Draws the tiles covering rect, at the level matching the painter
+        scale.
+
+        """
+        if not self.scales:
+            return
+        area = rect.intersected(self.sceneRect)
+        if area.isEmpty():
+            return
+        level = self._level(painter.worldTransform().m11())
+        tileSide = self.tileSize / self.scales[level]
+        left, top = self.sceneRect.left(), self.sceneRect.top()
+        firstColumn = int((area.left() - left) // tileSide)
+        lastColumn = int(math.ceil((area.right() - left) / tileSide))
+        firstRow = int((area.top() - top) // tileSide)
+        lastRow = int(math.ceil((area.bottom() - top) / tileSide))
+        for row in range(firstRow, lastRow):
+            for column in range(firstColumn, lastColumn):
+                painter.drawPixmap(
+                    QRectF(
+                        left + column * tileSide,
+                        top + row * tileSide,
+                        tileSide,
+                        tileSide,
+                    ),
+                    self._tile(level, column, row),
+                    QRectF(0, 0, self.tileSize, self.tileSize),
+                )
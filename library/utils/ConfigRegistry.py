@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: ConfigRegistry.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import copy
+import hashlib
+import marshal
+import os.path as osp
+
+from glob import glob
+from os import makedirs, replace, stat
+
+from library.utils.Config import Config
+
+CONFIGS_DIR = osp.join(osp.dirname(osp.dirname(osp.realpath(__file__))), "configs")
+SNAPSHOT_VERSION = 1
+
+
+class FrozenDict(dict):
+    """
+
+    A read only dict, handed out as a view of a registered config. Nested
+    dicts are frozen too, and nested lists are turned into tuples. A shallow
+    copy (copy()) is a plain dict, a deep copy (copy.deepcopy) is a plain,
+    fully mutable, dict.
+
+    ...
+
+    Attributes
+    ----------
+    None
+
+    Methods
+    -------
+    freeze(value : object)
+        Returns a read only version of value.
+
+    thaw(value : object)
+        Returns a mutable deep copy of value.
+
+    """
+
+    def _readOnly(self, *args, **kwargs):
+        raise TypeError(f"'{self.__class__.__name__}' object is read only")
+
+    __setitem__ = __delitem__ = _readOnly
+    clear = pop = popitem = setdefault = update = _readOnly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return FrozenDict.thaw(self)
+
+    def copy(self):
+        return dict(self)
+
+    @staticmethod
+    def freeze(value):
+        """
+
+        Parameters
+        ----------
+        value : object
+            A config value.
+
+        Returns
+        -------
+        object
+            value, with dicts turned into FrozenDicts and lists into tuples.
+
+        """
+        if isinstance(value, dict):
+            return FrozenDict((k, FrozenDict.freeze(v)) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return tuple(FrozenDict.freeze(v) for v in value)
+        return value
+
+    @staticmethod
+    def thaw(value):
+        """
+
+        Parameters
+        ----------
+        value : object
+            A config value, possibly frozen.
+
+        Returns
+        -------
+        object
+            A deep copy of value, with FrozenDicts turned into dicts and
+            tuples into lists.
+
+        """
+        if isinstance(value, dict):
+            return {k: FrozenDict.thaw(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [FrozenDict.thaw(v) for v in value]
+        return copy.deepcopy(value)
+
+
+class ConfigRegistry:
+    """
+
+    A process wide cache of the config files. Each file is parsed once by
+    Config._file2dict, then served from memory until its modification time
+    changes. Callers get either a read only view, shared by everyone and free
+    to hand out, or a deep copy they can edit.
+
+    Only the modification time of the file itself is checked, not the one of
+    its _base_ files.
+
+    The configs of library/configs are also compiled into a snapshot, a
+    marshal file keyed on a hash of their sources. On first use, the registry
+    is filled from the snapshot in a single read. When the sources changed,
+    they are parsed by Config._file2dict and the snapshot is written again.
+
+    ...
+
+    Attributes
+    ----------
+    entries : dict
+        The parsed configs, by absolute path. Each entry is a tuple
+        (mtime : float, cfg_dict : dict, cfg_text : str, view : FrozenDict).
+
+    snapshotChecked : bool
+        True once the snapshot has been loaded or rebuilt.
+
+    Methods
+    -------
+    view(filename : str)
+        Returns a read only view of a config.
+
+    copy(filename : str)
+        Returns a mutable deep copy of a config.
+
+    load(filename : str)
+        Drop-in replacement of Config._file2dict, returns a deep copy of a
+        config and its text.
+
+    invalidate(filename[None] : str)
+        Drops a config, or all the configs, from the registry.
+
+    loadSnapshot(directory[CONFIGS_DIR] : str)
+        Fills the registry from the snapshot of directory, rebuilding the
+        snapshot if the sources changed.
+
+    """
+
+    entries = {}
+    snapshotChecked = False
+
+    @classmethod
+    def _entry(cls, filename):
+        if not cls.snapshotChecked:
+            cls.loadSnapshot()
+        filename = osp.abspath(osp.expanduser(filename))
+        mtime = stat(filename).st_mtime
+        entry = cls.entries.get(filename)
+        if entry is None or entry[0] != mtime:
+            cfg_dict, cfg_text = Config._file2dict(filename)
+            entry = (mtime, cfg_dict, cfg_text, FrozenDict.freeze(cfg_dict))
+            cls.entries[filename] = entry
+        return entry
+
+    @classmethod
+    def view(cls, filename):
+        """
+
+        Parameters
+        ----------
+        filename : str
+            The path of the config file.
+
+        Returns
+        -------
+        FrozenDict
+            A read only view of the config. The same object is returned until
+            the file changes.
+
+        """
+        return cls._entry(filename)[3]
+
+    @classmethod
+    def copy(cls, filename):
+        """
+
+        Parameters
+        ----------
+        filename : str
+            The path of the config file.
+
+        Returns
+        -------
+        dict
+            A mutable deep copy of the config.
+
+        """
+        return copy.deepcopy(cls._entry(filename)[1])
+
+    @classmethod
+    def load(cls, filename):
+        """
+
+        Parameters
+        ----------
+        filename : str
+            The path of the config file.
+
+        Returns
+        -------
+        cfg_dict : dict
+            A mutable deep copy of the config.
+        cfg_text : str
+            The text of the config and of its bases.
+
+        """
+        entry = cls._entry(filename)
+        return copy.deepcopy(entry[1]), entry[2]
+
+    @classmethod
+    def invalidate(cls, filename=None):
+        """
+
+        Parameters
+        ----------
+        filename : str, optional
+            The path of the config file. The default is None, for all the
+            configs.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Drops a config, or all the configs, from the registry. They are parsed
+        again on their next use.
+
+        """
+        if filename is None:
+            cls.entries.clear()
+        else:
+            cls.entries.pop(osp.abspath(osp.expanduser(filename)), None)
+
+    @staticmethod
+    def snapshotPath(directory):
+        return osp.join(directory, "__pycache__", "configs.snapshot")
+
+    @staticmethod
+    def sourcesHash(sources):
+        """
+
+        Parameters
+        ----------
+        sources : list of str
+            The paths of the config files.
+
+        Returns
+        -------
+        str
+            A hash of the names and contents of the config files.
+
+        """
+        sha = hashlib.sha1()
+        for source in sources:
+            sha.update(osp.basename(source).encode())
+            with open(source, "rb") as f:
+                sha.update(f.read())
+        return sha.hexdigest()
+
+    @classmethod
+    def loadSnapshot(cls, directory=CONFIGS_DIR):
+        """
+
+        Parameters
+        ----------
+        directory : str, optional
+            The directory of the config files. The default is CONFIGS_DIR.
+
+        Returns
+        -------
+        bool
+            True if the registry was filled from the snapshot, False if the
+            snapshot was rebuilt.
+
+        Summary
+        -------
+        Fills the registry with all the configs of directory. If the snapshot
+        matches the sources, it is read at once. Otherwise the sources are
+        parsed and the snapshot is written again. Failing to write it (read
+        only install) is not an error.
+
+        """
+        cls.snapshotChecked = True
+        sources = sorted(
+            source
+            for source in glob(osp.join(directory, "*.py"))
+            if osp.basename(source) != "__init__.py"
+        )
+        digest = cls.sourcesHash(sources)
+        snapshotPath = cls.snapshotPath(directory)
+
+        try:
+            with open(snapshotPath, "rb") as f:
+                snapshot = marshal.loads(f.read())
+            valid = snapshot["version"] == SNAPSHOT_VERSION and (
+                snapshot["hash"] == digest
+            )
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            valid = False
+
+        if valid:
+            for source in sources:
+                cfg_dict, cfg_text = snapshot["configs"][osp.basename(source)]
+                cls.entries[osp.abspath(source)] = (
+                    stat(source).st_mtime,
+                    cfg_dict,
+                    cfg_text,
+                    FrozenDict.freeze(cfg_dict),
+                )
+            return True
+
+        configs = {}
+        for source in sources:
+            _, cfg_dict, cfg_text, _ = cls._entry(source)
+            configs[osp.basename(source)] = (cfg_dict, cfg_text)
+        try:
+            makedirs(osp.dirname(snapshotPath), exist_ok=True)
+            with open(snapshotPath + ".tmp", "wb") as f:
+                f.write(
+                    marshal.dumps(
+                        {
+                            "version": SNAPSHOT_VERSION,
+                            "hash": digest,
+                            "configs": configs,
+                        }
+                    )
+                )
+            replace(snapshotPath + ".tmp", snapshotPath)
+        except (OSError, ValueError):
+            pass
+        return False
+
+
+if __name__ == "__main__":
+    # Build step: python -m library.utils.ConfigRegistry
+    ConfigRegistry.loadSnapshot()
@@ -66,6 +66,9 @@ class HEAP():
     updateItem(_heapItem)
         Updates an exisiting _heapItem position in the dataset
 
+    removeItem(_heapItem)
+        Removes an existing _heapItem from the dataset.
+
     contains(_heapItem)
         Returns True or False depending on the presence of _heapItem in the
         dataset.
@@ -139,10 +142,36 @@ class HEAP():
 
         Summary
         -------
-        Updates _heapItem position in the heap dataset.
+        Updates _heapItem position in the heap dataset, whether its Priority
+        increased or decreased.
 
         """
         self.sortUp(_heapItem)
+        self.sortDown(_heapItem)
+
+    def removeItem(self, _heapItem):
+        """
+
+        Parameters
+        ----------
+        _heapItem : HEAPItem
+            The HEAPItem to remove.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Removes _heapItem from the dataset. The last HEAPItem of the dataset
+        takes its place and is sorted to its new position.
+
+        """
+        lastItem = self.items.pop()
+        if lastItem is not _heapItem:
+            self.items[_heapItem.heapIndex] = lastItem
+            lastItem.heapIndex = _heapItem.heapIndex
+            self.updateItem(lastItem)
 
     def contains(self, _heapItem):
         """
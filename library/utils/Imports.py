@@ -5,27 +5,172 @@
     Author: Grégory LARGANGE
     Date created: 17/11/2021
     Last modified by: Grégory LARGANGE
-    Date last modified: 17/11/2021
+    Date last modified: 19/10/2026
     Python version: 3.8.1
 """
 
 
+from os import path
 from random import randint
 
 
+NAMES_DIR = path.join(
+    path.dirname(path.realpath(__file__)), "..", "..", "resources", "names"
+)
+
+
 class Imports:
     @staticmethod
     def extract_text(text_file_path):
         lines = []
         with open(text_file_path, "r") as txtf:
-            for _ in txtf:
-                currentLine = txtf.readline().rstrip("\n")
-                lines.append(currentLine)
-        txtf.close()
+            for line in txtf:
+                currentLine = line.strip()
+                if currentLine:
+                    lines.append(currentLine)
 
         return lines
 
     @classmethod
     def random_name(cls, text_file_path):
-        names_list = cls.extract_text(text_file_path)
+        names_list = NamePool.names(text_file_path)
         return names_list[randint(0, len(names_list) - 1)]
+
+
+class NamePool:
+    """
+
+    The ship names, shared by the player fleet creator and the ai fleet
+    generator. Each names file is read once into an indexed list. Names are
+    drawn at random without replacement in O(1), by swapping the drawn index
+    with the last free one, so that no two ships of a battle share a name.
+    When all the names of a type are drawn, the pool of that type is refilled.
+
+    ...
+
+    Attributes
+    ----------
+    files : dict
+        The names file of each ship type.
+
+    loaded : dict
+        The names of each names file, by path.
+
+    free : dict
+        The indexes of the names not drawn yet, by ship type.
+
+    Methods
+    -------
+    names(text_file_path : str)
+        Returns the names of a file, read once.
+
+    draw(_type : str)
+        Returns a random name not drawn yet for a ship type.
+
+    release(_type : str, name : str)
+        Puts a drawn name back in the pool.
+
+    reset()
+        Puts all the names back in the pool.
+
+    """
+
+    files = {
+        "BB": "names_battleships.txt",
+        "CA": "names_cruisers.txt",
+        "DD": "names_destroyers.txt",
+        "PT": "names_submarines.txt",
+    }
+    loaded = {}
+    free = {}
+
+    @classmethod
+    def names(cls, text_file_path):
+        """
+
+        Parameters
+        ----------
+        text_file_path : str
+            The path of a names file, one name per line.
+
+        Returns
+        -------
+        list of str
+            The names of the file.
+
+        """
+        text_file_path = path.abspath(text_file_path)
+        if text_file_path not in cls.loaded:
+            cls.loaded[text_file_path] = Imports.extract_text(text_file_path)
+        return cls.loaded[text_file_path]
+
+    @classmethod
+    def _typeNames(cls, _type):
+        return cls.names(path.join(NAMES_DIR, cls.files[_type]))
+
+    @classmethod
+    def draw(cls, _type):
+        """
+
+        Parameters
+        ----------
+        _type : str
+            The type of the ship, "BB", "CA", "DD" or "PT".
+
+        Returns
+        -------
+        str
+            A name of the type, not drawn since the last reset.
+
+        """
+        names = cls._typeNames(_type)
+        free = cls.free.get(_type)
+        if not free:
+            free = cls.free[_type] = list(range(len(names)))
+        i = randint(0, len(free) - 1)
+        free[i], free[-1] = free[-1], free[i]
+        return names[free.pop()]
+
+    @classmethod
+    def release(cls, _type, name):
+        """
+
+        Parameters
+        ----------
+        _type : str
+            The type of the ship.
+        name : str
+            A name drawn for that type.
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Puts a drawn name back in the pool, when its ship is removed.
+
+        """
+        if _type not in cls.free:
+            return
+        names = cls._typeNames(_type)
+        free = cls.free[_type]
+        if name in names:
+            index = names.index(name)
+            if index not in free:
+                free.append(index)
+
+    @classmethod
+    def reset(cls):
+        """
+
+        Returns
+        -------
+        None.
+
+        Summary
+        -------
+        Puts all the names back in the pool, for a new battle.
+
+        """
+        cls.free.clear()
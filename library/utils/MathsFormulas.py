@@ -11,6 +11,8 @@
 
 import math
 
+import numpy as np
+
 from PyQt5.QtCore import QPointF
 
 
@@ -31,6 +33,12 @@ class Geometrics:
     distance_A_B(pointA : QPointF, pointB : QPointF)
         Returns the distance betwenn pointA and pointB.
 
+    distance_xy(ax : float, ay : float, bx : float, by : float)
+        Scalar fast path of distance_A_B.
+
+    distance_array(ax, ay, bx, by : numpy.ndarray)
+        Vectorized distance_A_B.
+
     pythagore(sideB : float, sideC : float)
         To be applied in a sqaure rectangle. Returns the hypothenuse of a triangle
         of sides A, B, C, where A is the hypothenuse.
@@ -43,10 +51,22 @@ class Geometrics:
         Returns angle a (in radians) opposite to side A in any regular triangle
         of sides A, B, C.
 
+    angle(pointA : QPointF, pointB : QPointF)
+        Returns the angle between pointA and pointB.
+
+    angle_xy(ax : float, ay : float, bx : float, by : float)
+        Scalar fast path of angle.
+
+    angle_array(ax, ay, bx, by : numpy.ndarray)
+        Vectorized angle.
+
     smallestAngle(targetAngleDeg : float, curAngleDeg : float)
         Returns the smallest angle possible to go from curAngleDeg to
         targetAngleDeg.
 
+    smallestAngle_array(targetAngleDeg, curAngleDeg : numpy.ndarray)
+        Vectorized smallestAngle.
+
     checkSegmentsIntersect(segmentAB : list of QPointF, segmentCD : list of QPointF)
         Returns True if there is an intersection between segmentAB and segmentCD,
         False otherwise.
@@ -105,6 +125,52 @@ class Geometrics:
         )
         return distance
 
+    @staticmethod
+    def distance_xy(ax, ay, bx, by):
+        """
+
+        Parameters
+        ----------
+        ax, ay : float
+            The coordinates of point A.
+        bx, by : float
+            The coordinates of point B.
+
+        Returns
+        -------
+        float
+            The distance between A and B.
+
+        Summary
+        -------
+        Scalar fast path of distance_A_B, on plain floats.
+
+        """
+        return math.hypot(bx - ax, by - ay)
+
+    @staticmethod
+    def distance_array(ax, ay, bx, by):
+        """
+
+        Parameters
+        ----------
+        ax, ay : numpy.ndarray or float
+            The coordinates of the points A.
+        bx, by : numpy.ndarray or float
+            The coordinates of the points B.
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances between the points A and B, broadcast together.
+
+        Summary
+        -------
+        Vectorized distance_A_B.
+
+        """
+        return np.hypot(np.subtract(bx, ax), np.subtract(by, ay))
+
     @staticmethod
     def pythagore(sideB, sideC):
         """
@@ -215,6 +281,52 @@ class Geometrics:
         )
         return angleInRad
 
+    @staticmethod
+    def angle_xy(ax, ay, bx, by):
+        """
+
+        Parameters
+        ----------
+        ax, ay : float
+            The coordinates of the reference point.
+        bx, by : float
+            The coordinates of the point to get the angle of.
+
+        Returns
+        -------
+        float
+            The angle between A and B in rad, in [-pi, pi].
+
+        Summary
+        -------
+        Scalar fast path of angle, on plain floats.
+
+        """
+        return math.atan2(by - ay, bx - ax)
+
+    @staticmethod
+    def angle_array(ax, ay, bx, by):
+        """
+
+        Parameters
+        ----------
+        ax, ay : numpy.ndarray or float
+            The coordinates of the reference points.
+        bx, by : numpy.ndarray or float
+            The coordinates of the points to get the angle of.
+
+        Returns
+        -------
+        numpy.ndarray
+            The angles between the points A and B in rad, in [-pi, pi].
+
+        Summary
+        -------
+        Vectorized angle.
+
+        """
+        return np.arctan2(np.subtract(by, ay), np.subtract(bx, ax))
+
     @staticmethod
     def smallestAngle(targetAngleDeg, curAngleDeg):
         """
@@ -242,6 +354,31 @@ class Geometrics:
         diff = diff1 if abs(diff1) < abs(diff2) else diff2
         return diff
 
+    @staticmethod
+    def smallestAngle_array(targetAngleDeg, curAngleDeg):
+        """
+
+        Parameters
+        ----------
+        targetAngleDeg : numpy.ndarray or float
+            The target angles.
+        curAngleDeg : numpy.ndarray or float
+            The initial angles.
+
+        Returns
+        -------
+        numpy.ndarray
+            The smallest angles.
+
+        Summary
+        -------
+        Vectorized smallestAngle.
+
+        """
+        diff1 = np.subtract(targetAngleDeg, curAngleDeg)
+        diff2 = diff1 + np.where(np.less(targetAngleDeg, curAngleDeg), 360, -360)
+        return np.where(np.abs(diff1) < np.abs(diff2), diff1, diff2)
+
     @staticmethod
     def checkSegmentsIntersect(segmentAB, segmentCD):
         """
@@ -332,6 +469,12 @@ class Cinematics:
     movementBy(originPoint : QPointF, moveDistance : float, angleInRad : float)
         Calculates the new position of a point after a movement.
 
+    movementBy_xy(x : float, y : float, moveDistance : float, angleInRad : float)
+        Scalar fast path of movementBy.
+
+    movementBy_array(x, y, moveDistance, angleInRad : numpy.ndarray)
+        Vectorized movementBy.
+
     brakeDistance(vinit : float, deceleration : float)
         Calculates the breaking distance of an object. Assumes a uniform linear
         movement.
@@ -345,6 +488,22 @@ class Cinematics:
         Calculates the position of rotation centers of an object with a circular
         uniform movement.
 
+    rotationCenters_xy(x : float, y : float, heading : float, speed : float,
+                       rotSpeedInD_s : float)
+        Scalar fast path of rotationCenters.
+
+    rotationCenters_array(x, y, heading, speed, rotSpeedInD_s : numpy.ndarray)
+        Vectorized rotationCenters.
+
+    decceleratedDistance(v0 : float, deceleration : float, time : float)
+        Calculates the distance travelled by an object with a linear
+        deceleration after time.
+
+    interceptTime(dx : float, dy : float, t_vx : float, t_vy : float,
+                  v0 : float, deceleration : float)
+        Calculates the time needed by a linearly decelerating projectile to
+        intercept a target moving at constant velocity.
+
     """
 
     @staticmethod
@@ -376,6 +535,62 @@ class Cinematics:
         newPoint = QPointF(newX, newY)
         return newPoint
 
+    @staticmethod
+    def movementBy_xy(x, y, moveDistance, angleInRad):
+        """
+
+        Parameters
+        ----------
+        x, y : float
+            The initial position of the moving point.
+        moveDistance : float
+            The absolute ditance travelled by the point.
+        angleInRad : float
+            The angle of travel of the moving point.
+
+        Returns
+        -------
+        tuple of float
+            The position of the point after its movement.
+
+        Summary
+        -------
+        Scalar fast path of movementBy, on plain floats.
+
+        """
+        return (
+            round(x + moveDistance * math.cos(angleInRad), 2),
+            round(y + moveDistance * math.sin(angleInRad), 2),
+        )
+
+    @staticmethod
+    def movementBy_array(x, y, moveDistance, angleInRad):
+        """
+
+        Parameters
+        ----------
+        x, y : numpy.ndarray or float
+            The initial positions of the moving points.
+        moveDistance : numpy.ndarray or float
+            The absolute ditances travelled by the points.
+        angleInRad : numpy.ndarray or float
+            The angles of travel of the moving points.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The positions of the points after their movement.
+
+        Summary
+        -------
+        Vectorized movementBy.
+
+        """
+        return (
+            np.round(x + moveDistance * np.cos(angleInRad), 2),
+            np.round(y + moveDistance * np.sin(angleInRad), 2),
+        )
+
     @staticmethod
     def brakeDistance(vinit, deceleration):
         """
@@ -469,6 +684,186 @@ class Cinematics:
 
         return [port_rc, starport_rc]
 
+    @staticmethod
+    def rotationCenters_xy(x, y, heading, speed, rotSpeedInD_s):
+        """
+
+        Parameters
+        ----------
+        x, y : float
+            The center of the object.
+        heading : float
+            The movement's direction of the object.
+        speed : float
+            The linear speed of the object.
+        rotSpeedInD_s : float
+            The rotation speed of the object.
+
+        Returns
+        -------
+        tuple of float
+            The port and starboard rotation centers, as (p_x, p_y, s_x, s_y).
+
+        Summary
+        -------
+        Scalar fast path of rotationCenters, on plain floats.
+
+        """
+        radius = int((180 * speed) / (math.pi * rotSpeedInD_s))
+        h_l = math.radians(heading - 90)
+        h_r = math.radians(heading + 90)
+        return (
+            round(x + radius * math.cos(h_l), 2),
+            round(y + radius * math.sin(h_l), 2),
+            round(x + radius * math.cos(h_r), 2),
+            round(y + radius * math.sin(h_r), 2),
+        )
+
+    @staticmethod
+    def rotationCenters_array(x, y, heading, speed, rotSpeedInD_s):
+        """
+
+        Parameters
+        ----------
+        x, y : numpy.ndarray or float
+            The centers of the objects.
+        heading : numpy.ndarray or float
+            The movement's directions of the objects.
+        speed : numpy.ndarray or float
+            The linear speeds of the objects.
+        rotSpeedInD_s : numpy.ndarray or float
+            The rotation speeds of the objects.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The port and starboard rotation centers, as (p_x, p_y, s_x, s_y).
+
+        Summary
+        -------
+        Vectorized rotationCenters.
+
+        """
+        radius = np.trunc((180 * np.asarray(speed)) / (math.pi * rotSpeedInD_s))
+        h_l = np.radians(np.subtract(heading, 90))
+        h_r = np.radians(np.add(heading, 90))
+        return (
+            np.round(x + radius * np.cos(h_l), 2),
+            np.round(y + radius * np.sin(h_l), 2),
+            np.round(x + radius * np.cos(h_r), 2),
+            np.round(y + radius * np.sin(h_r), 2),
+        )
+
+    @staticmethod
+    def decceleratedDistance(v0, deceleration, time):
+        """
+
+        Parameters
+        ----------
+        v0 : float
+            The initial speed of the object.
+        deceleration : float
+            The constant deceleration of the object (positive value).
+        time : float
+            The time of travel.
+
+        Returns
+        -------
+        distance : float
+            The distance travelled by the object.
+
+        Summary
+        -------
+        Returns the distance travelled after time by an object starting at
+        speed v0 and slowing down linearly. The object is considered stopped
+        once its speed reaches 0.
+
+        """
+        if deceleration > 0:
+            time = min(time, v0 / deceleration)
+        distance = v0 * time - (deceleration / 2) * time ** 2
+        return distance
+
+    @classmethod
+    def interceptTime(cls, dx, dy, t_vx, t_vy, v0, deceleration, tolerance=0.01):
+        """
+
+        Parameters
+        ----------
+        dx : float
+            The x distance from the shooter to the target.
+        dy : float
+            The y distance from the shooter to the target.
+        t_vx : float
+            The speed of the target on the x axis.
+        t_vy : float
+            The speed of the target on the y axis.
+        v0 : float
+            The initial speed of the projectile.
+        deceleration : float
+            The constant deceleration of the projectile (positive value).
+        tolerance : float, optional
+            The accepted error on the intercept distance. The default is 0.01.
+
+        Returns
+        -------
+        float or None
+            The time of flight to the intercept point, None if the projectile
+            can not catch the target.
+
+        Summary
+        -------
+        Solves |D + V.t| = v0.t - deceleration.t² / 2 for t.
+        The constant speed version of this equation is a quadratic, whose
+        root is a lower bound of the decelerated time of flight. This root
+        is then refined with a few Newton iterations on the exact equation,
+        which converges monotonically from below.
+
+        """
+        # Constant speed quadratic: (V² - v0²)t² + 2(D.V)t + D² = 0
+        a = t_vx ** 2 + t_vy ** 2 - v0 ** 2
+        b = 2 * (dx * t_vx + dy * t_vy)
+        c = dx ** 2 + dy ** 2
+
+        if abs(a) < 1e-9:
+            if b >= 0:
+                return None
+            time = -c / b
+        else:
+            delta = b ** 2 - 4 * a * c
+            if delta < 0:
+                return None
+            sqrt_delta = math.sqrt(delta)
+            roots = [
+                t
+                for t in ((-b - sqrt_delta) / (2 * a), (-b + sqrt_delta) / (2 * a))
+                if t >= 0
+            ]
+            if not roots:
+                return None
+            time = min(roots)
+
+        if deceleration <= 0:
+            return time
+
+        # Newton refinement on f(t) = |D + V.t| - (v0.t - deceleration.t² / 2)
+        t_max = v0 / deceleration  # The projectile stops at t_max
+        for _ in range(8):
+            if time > t_max:
+                return None
+            px = dx + t_vx * time
+            py = dy + t_vy * time
+            g = math.sqrt(px ** 2 + py ** 2)
+            f = g - cls.decceleratedDistance(v0, deceleration, time)
+            if abs(f) <= tolerance:
+                break
+            d_g = (px * t_vx + py * t_vy) / g if g > 0 else 0
+            d_f = d_g - (v0 - deceleration * time)
+            if d_f >= 0:
+                return None
+            time -= f / d_f
+        return time if time <= t_max else None
+
 
 class Controllers:
     """
@@ -487,6 +882,10 @@ class Controllers:
                  customDiff : optional float)
         Applies a proportional controller to the input.
 
+    proportional_array(targetValue, currentValue, maxGain,
+                       customDiff : numpy.ndarray)
+        Vectorized proportional.
+
     """
 
     @staticmethod
@@ -529,3 +928,33 @@ class Controllers:
             gain = maxGain
 
         return gain
+
+    @staticmethod
+    def proportional_array(targetValue, currentValue, maxGain, customDiff=None):
+        """
+
+        Parameters
+        ----------
+        targetValue : numpy.ndarray or float
+            The values to reach.
+        currentValue : numpy.ndarray or float
+            The current values.
+        maxGain : numpy.ndarray or float
+            The maximum gains that can be applied to the inputs.
+        customDiff : numpy.ndarray or float, optional
+            User can input here its custom error calculation. The default is None.
+
+        Returns
+        -------
+        numpy.ndarray
+            The calculated gains to apply.
+
+        Summary
+        -------
+        Vectorized proportional. The scalar version already works on plain
+        floats.
+
+        """
+        if customDiff is None:
+            customDiff = np.subtract(targetValue, currentValue)
+        return np.clip(customDiff, np.negative(maxGain), maxGain)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: conftest.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+
+    Shared fixtures: an offscreen game, and a battle spawned in it.
+"""
+
+import os
+import random
+import sys
+
+from os import path
+
+import pytest
+
+ROOT = path.dirname(path.dirname(path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from library.utils.ConfigRegistry import ConfigRegistry  # noqa: E402
+
+MAP_GEN = path.join(ROOT, "library", "configs", "mapGenConfig.py")
+
+
+@pytest.fixture(scope="session")
+def ui():
+    from PyQt5 import QtWidgets
+
+    import TaskForce301
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = QtWidgets.QMainWindow()
+    ui = TaskForce301.Ui_TSKF301MainWindow()
+    ui.setupUi(window)
+    ui.initData()
+    ui.headless = (app, window)
+    return ui
+
+
+def startBattle(ui, seed=301):
+    from library import MainClock, World
+    from library.controllers.game_controller import GameController
+
+    mapGen = ConfigRegistry.view(MAP_GEN)
+    random.seed(seed)
+    ui.mainClock = MainClock.MainClock(25)
+    ui.world = World.World(ui.mainClock, ui.gameScene)
+    ui._game_controller = GameController(ui)
+    ui.gameScene.attachedGController = ui._game_controller
+    funds = mapGen["funds"]["Small"]
+    allies = ui._game_controller.generate_ai_fleet(funds)
+    ennemies = ui._game_controller.generate_ai_fleet(funds)
+
+    mapSize = mapGen["size"]["Small"]
+    ui.newGame(
+        mapSize,
+        mapGen["mapExtension"],
+        mapGen["mapResolution"],
+        mapGen["obstruction"]["Open"],
+        list(mapGen["obstacles"]),
+    )
+    ui.spawnShips(mapSize, mapGen["mapExtension"], 1500, allies, ennemies)
+    return ui
+
+
+def endBattle(ui):
+    ui.gameScene.clearGameScene()
+    ui.shipsListView.clearList()
+    ui.initData()
+
+
+@pytest.fixture
+def battle(ui):
+    yield startBattle(ui)
+    endBattle(ui)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_batch_renderer.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from PyQt5.QtCore import QPointF
+
+
+def test_layers_are_bounded_by_their_entities(battle):
+    world = battle.world
+    world.setBatchedRendering(True)
+    for ship in world.ships:
+        ship.updatePath(QPointF(ship.coordinates.center.x(), 1000))
+    for _ in range(20):
+        world.step()
+        world.render(0.5)
+
+    layers = world.renderer.layers
+    sceneRect = battle.gameScene.sceneRect()
+    hulls = layers["hulls"].boundingRect()
+    assert hulls.width() * hulls.height() < sceneRect.width() * sceneRect.height() / 4
+    for ship in world.ships:
+        assert hulls.contains(ship.sceneBoundingRect())
+        for turret in ship.weapons["turrets_list"]:
+            assert layers["turrets"].boundingRect().contains(turret.sceneBoundingRect())
+    assert layers["shells"].boundingRect().isNull() == (not world.projectiles)
+    world.setBatchedRendering(False)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_config_registry.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import copy
+
+import pytest
+
+from library.utils.ConfigRegistry import ConfigRegistry, FrozenDict
+
+
+def test_frozen_dict_is_read_only():
+    frozen = FrozenDict.freeze({"hull": {"hp": 100}, "turrets": [{"size": 2}]})
+    assert frozen == {"hull": {"hp": 100}, "turrets": ({"size": 2},)}
+    for edit in (
+        lambda: frozen.__setitem__("hull", {}),
+        lambda: frozen["hull"].__setitem__("hp", 0),
+        lambda: frozen["turrets"][0].update(size=3),
+        lambda: frozen.pop("hull"),
+        lambda: frozen.setdefault("techs", {}),
+        frozen.clear,
+    ):
+        with pytest.raises(TypeError):
+            edit()
+    assert frozen == {"hull": {"hp": 100}, "turrets": ({"size": 2},)}
+
+    # Copies are mutable, only a deep copy is mutable all the way down
+    shallow = frozen.copy()
+    shallow["hull"] = None
+    assert type(shallow) is dict and frozen["hull"] == {"hp": 100}
+    deep = copy.deepcopy(frozen)
+    deep["hull"]["hp"] = 0
+    deep["turrets"].append({"size": 3})
+    assert frozen == {"hull": {"hp": 100}, "turrets": ({"size": 2},)}
+
+
+def test_views_are_shared_and_copies_are_not(tmp_path, monkeypatch):
+    monkeypatch.setattr(ConfigRegistry, "entries", {})
+    monkeypatch.setattr(ConfigRegistry, "snapshotChecked", True)
+    config = tmp_path / "shipConfig.py"
+    config.write_text("hull = dict(hp=100)\n")
+
+    view = ConfigRegistry.view(str(config))
+    assert view is ConfigRegistry.view(str(config))
+    edited = ConfigRegistry.copy(str(config))
+    edited["hull"]["hp"] = 0
+    assert view["hull"]["hp"] == 100
+
+
+def test_snapshot_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(ConfigRegistry, "entries", {})
+    monkeypatch.setattr(ConfigRegistry, "snapshotChecked", False)
+    (tmp_path / "hullConfig.py").write_text("hull = dict(hp=100, armor=[1, 2])\n")
+    (tmp_path / "techsConfig.py").write_text("techs = dict(guns=2)\n")
+
+    def load():
+        ConfigRegistry.invalidate()
+        fromSnapshot = ConfigRegistry.loadSnapshot(str(tmp_path))
+        entries = {
+            name: ConfigRegistry.entries[str(tmp_path / name)][1:3]
+            for name in ("hullConfig.py", "techsConfig.py")
+        }
+        return fromSnapshot, entries
+
+    fromSnapshot, parsed = load()
+    assert not fromSnapshot
+    assert (tmp_path / "__pycache__" / "configs.snapshot").exists()
+    fromSnapshot, loaded = load()
+    assert fromSnapshot
+    assert loaded == parsed
+    assert loaded["hullConfig.py"][0]["hull"] == {"hp": 100, "armor": [1, 2]}
+
+    # Editing a source rebuilds the snapshot
+    (tmp_path / "techsConfig.py").write_text("techs = dict(guns=3)\n")
+    fromSnapshot, edited = load()
+    assert not fromSnapshot
+    assert edited["techsConfig.py"][0]["techs"] == {"guns": 3}
+    assert load()[0]
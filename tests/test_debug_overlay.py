@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_debug_overlay.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from PyQt5.QtCore import QPointF
+
+
+def test_enabling_the_overlay_keeps_the_qt_activation(ui):
+    from library.DebugOverlay import DebugOverlay
+
+    overlay = DebugOverlay()
+    assert "setActive" not in vars(DebugOverlay)
+    overlay.setOverlayEnabled(True)
+    assert overlay.enabled and overlay.isVisible()
+    overlay.setOverlayEnabled(False)
+    assert not overlay.enabled and not overlay.isVisible()
+
+
+def test_bounds_follow_the_trail(ui):
+    from library.DebugOverlay import DebugOverlay
+
+    overlay = DebugOverlay(capacity=4)
+    ui.gameScene.addItem(overlay)
+    overlay.setOverlayEnabled(True)
+    try:
+        for i in range(4):
+            overlay.addTrailPoint(QPointF(i * 1000, 0), 100, "blue")
+        overlay.endFrame()
+        assert overlay.boundingRect().left() < 0 < overlay.boundingRect().right()
+
+        # The first points are dropped, the bounds shrink with them
+        for i in range(4, 8):
+            overlay.addTrailPoint(QPointF(i * 1000, 0), 100, "blue")
+        overlay.endFrame()
+        bounds = overlay.boundingRect()
+        assert bounds.left() > 3000
+        assert bounds.right() < 7100 + 2 * overlay.thk
+    finally:
+        ui.gameScene.removeItem(overlay)
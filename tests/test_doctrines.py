@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_doctrines.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from benchmarks import doctrines
+
+
+def test_headless_battle_runs(ui):
+    doctrines.initWorker()
+    _, names = doctrines.presets()
+    row = doctrines.runBattle(
+        (names[0], names[-1], "Small", "Medium", "Light", 301, 200)
+    )
+    assert row["ticks"] == 200
+    assert row["result"] in ("win", "loss", "draw")
+    assert row["ticks_per_s"] > 0
+
+
+def test_rally_point_is_traversible(ui):
+    from PyQt5.QtCore import QPointF
+
+    from library.Mapping import Astar
+
+    gameMap = [[0] * 5 for _ in range(5)]
+    gameMap[2][2] = gameMap[2][3] = 10
+    astar = Astar(gameMap, 100)
+    point = doctrines.rallyPoint(astar, QPointF(200, 200))
+    node = astar.getNode(round(point.y() / 100), round(point.x() / 100))
+    assert node.traversible
+    assert abs(point.x() - 200) + abs(point.y() - 200) == 100
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_gun_turret.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from PyQt5.QtCore import QPointF
+
+
+def test_target_speed_is_measured_per_tick(battle):
+    roster = battle.gameScene.roster
+    shooter = next(iter(roster.team("ALLY")))
+    target = next(iter(roster.team("ENNEMY")))
+    turret = shooter.weapons["turrets_list"][0]
+    scheduler = battle.world.scheduler
+    start = QPointF(target.coordinates.center)
+
+    turret.setTarget(target)
+    scheduler.tick += shooter.refresh.refresh_rate + 1
+    target.coordinates.center = start + QPointF(60, -30)
+    turret.setTarget(target)
+
+    ticks = shooter.refresh.refresh_rate + 1
+    assert turret.t_v_x == 60 / ticks
+    assert turret.t_v_y == -30 / ticks
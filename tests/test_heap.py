@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_heap.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import random
+
+from library.Ship import ShipHEAPItem
+from library.utils.HEAP import HEAP
+
+
+def assertHeap(heap):
+    for index, item in enumerate(heap.items):
+        assert item.heapIndex == index
+        if index:
+            parent = heap.items[(index - 1) // 2]
+            assert parent.potentialDamage >= item.potentialDamage
+
+
+def test_remove_and_update_keep_the_heap_ordered():
+    rng = random.Random(301)
+    heap = HEAP()
+    items = []
+    for ship in range(64):
+        item = ShipHEAPItem(ship)
+        item.potentialDamage = rng.random()
+        heap.addItem(item)
+        items.append(item)
+    assertHeap(heap)
+
+    for _ in range(200):
+        item = rng.choice(items)
+        if rng.random() < 0.2 and len(items) > 1:
+            heap.removeItem(item)
+            items.remove(item)
+            assert item not in heap.items
+        else:
+            # Raises or lowers the priority
+            item.potentialDamage = rng.random()
+            heap.updateItem(item)
+        assertHeap(heap)
+        assert heap.size() == len(items)
+
+    best = max(items, key=lambda item: item.potentialDamage)
+    assert heap.items[0] is best
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_imports.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from library.utils.Imports import NamePool
+
+
+def test_names_are_drawn_without_replacement(monkeypatch):
+    monkeypatch.setattr(NamePool, "free", {})
+    names = NamePool._typeNames("DD")
+    drawn = [NamePool.draw("DD") for _ in names]
+    assert sorted(drawn) == sorted(names)
+    assert not NamePool.free["DD"]
+
+    # The pool of a type is refilled once all its names are drawn
+    assert NamePool.draw("DD") in names
+    assert len(NamePool.free["DD"]) == len(names) - 1
+
+
+def test_names_are_released_and_reset(monkeypatch):
+    monkeypatch.setattr(NamePool, "free", {})
+    names = NamePool._typeNames("CA")
+    name = NamePool.draw("CA")
+    other = NamePool.draw("CA")
+    NamePool.release("CA", name)
+    NamePool.release("CA", name)
+    assert len(NamePool.free["CA"]) == len(names) - 1
+    assert names.index(name) in NamePool.free["CA"]
+    assert names.index(other) not in NamePool.free["CA"]
+
+    NamePool.reset()
+    assert NamePool.free == {}
+    NamePool.release("CA", other)
+    assert NamePool.free == {}
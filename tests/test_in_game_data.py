@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_in_game_data.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from library.InGameData import ContactTable, ShipRoster, TargetEvaluationTable
+
+
+def test_shooter_without_turrets_scores_zero(battle):
+    ships = list(battle.gameScene.shipList.values())
+    shooter, target = ships[0], ships[-1]
+    armed = TargetEvaluationTable.evaluate(shooter, target, 0)
+    turrets = shooter.weapons["turrets_list"]
+    shooter.weapons["turrets_list"] = []
+    try:
+        assert TargetEvaluationTable.evaluate(shooter, target, 0)[0] == 0
+        TargetEvaluationTable.build(ships)
+    finally:
+        shooter.weapons["turrets_list"] = turrets
+    TargetEvaluationTable.build(ships)
+    assert TargetEvaluationTable.lookup(shooter, target, 0) == armed
+
+
+def test_range_bucket_follows_the_bucket_size(monkeypatch):
+    monkeypatch.setattr(TargetEvaluationTable, "bucketSize", 500)
+    assert TargetEvaluationTable.rangeBucket(1499) == 2
+    assert TargetEvaluationTable.rangeBucket(1500) == 3
+
+
+def fleets(battle):
+    roster = battle.gameScene.roster
+    allies = list(roster.team("ALLY"))
+    ennemies = list(roster.team("ENNEMY"))
+    for ship in allies:
+        ship.weapons["guns_range"] = 10 ** 6
+    return allies, ennemies
+
+
+def test_assigned_targets_are_in_line_of_sight(battle, monkeypatch):
+    allies, ennemies = fleets(battle)
+    scene = battle.gameScene
+    monkeypatch.setattr(scene, "isInLineOfSight", lambda *args: True)
+    battle.rComs.assignTargets(allies, ennemies)
+    assert all(ship.assignedTarget in ennemies for ship in allies)
+
+    monkeypatch.setattr(scene, "isInLineOfSight", lambda *args: False)
+    battle.rComs.assignTargets(allies, ennemies)
+    assert all(ship.assignedTarget is None for ship in allies)
+
+
+def test_player_targets_are_kept(battle, monkeypatch):
+    allies, ennemies = fleets(battle)
+    monkeypatch.setattr(battle.gameScene, "isInLineOfSight", lambda *args: True)
+    allies[0].playerTarget = ennemies[0]
+    battle.rComs.assignTargets(allies, ennemies)
+    assert allies[0].assignedTarget is None
+    assert all(ship.assignedTarget in ennemies for ship in allies[1:])
+
+
+def test_evaluations_depend_on_the_number_of_turrets(battle):
+    ships = list(battle.gameScene.shipList.values())
+    shooter = max(ships, key=lambda ship: len(ship.weapons["turrets_list"]))
+    target = ships[-1]
+    far = len(shooter.table) - 1
+    TargetEvaluationTable.build(ships)
+    armed = TargetEvaluationTable.lookup(shooter, target, far)
+    turrets = shooter.weapons["turrets_list"]
+    shooter.weapons["turrets_list"] = turrets[:1]
+    try:
+        damaged = TargetEvaluationTable.lookup(shooter, target, far)
+    finally:
+        shooter.weapons["turrets_list"] = turrets
+    assert len(turrets) > 1
+    assert damaged[0] < armed[0]
+    assert TargetEvaluationTable.lookup(shooter, target, far) == armed
+
+
+def test_contact_table_version_follows_the_contacts():
+    table = ContactTable()
+    table.report("scout", ["bb", "dd"])
+    assert table.version == 2
+    view = table.view()
+    assert set(view) == {"bb", "dd"}
+
+    # Contacts already reported by another ship do not change the table
+    table.report("picket", ["dd"])
+    table.report("scout", ["bb"])
+    assert table.version == 2
+    assert table.view() is view
+
+    table.removeReporter("picket")
+    assert table.version == 3
+    assert table.view() == ("bb",)
+
+    table.removeContact("bb")
+    table.removeContact("bb")
+    assert table.version == 4
+    assert table.view() == ()
+    table.report("scout", [])
+    assert table.version == 4
+
+
+class TaggedShip:
+    def __init__(self, tag):
+        self.tag = tag
+
+    def data(self, key):
+        return self.tag
+
+
+def test_roster_notifies_its_listeners():
+    roster = ShipRoster()
+    allies = roster.team("ALLY")
+    events = []
+
+    def listener(event, ship):
+        events.append((event, ship))
+
+    roster.addListener(listener)
+
+    ally, ennemy = TaggedShip("ALLY"), TaggedShip("ENNEMY")
+    roster.add(ally)
+    roster.add(ennemy)
+    assert list(allies) == [ally]
+    assert list(roster.opponents("ALLY")) == [ennemy]
+
+    roster.remove(ally)
+    roster.remove(ally)
+    assert events == [("ADD", ally), ("ADD", ennemy), ("REMOVE", ally)]
+    assert not allies
+
+    roster.removeListener(listener)
+    roster.add(ally)
+    assert len(events) == 3
+    assert list(allies) == [ally]
+
+    roster.addListener(listener)
+    roster.clear()
+    roster.add(ennemy)
+    assert len(events) == 3
+    assert not allies
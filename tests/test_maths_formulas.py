@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_maths_formulas.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import math
+
+import pytest
+
+from library.utils.MathsFormulas import Cinematics
+
+
+def test_intercept_time_of_a_receding_target():
+    # d + u.t = v0.t - a.t² / 2, with the target receding at u along x
+    d, u, v0, a = 3000, 10, 400, 20
+    expected = ((v0 - u) - math.sqrt((v0 - u) ** 2 - 2 * a * d)) / a
+    time = Cinematics.interceptTime(d, 0, u, 0, v0, a)
+    assert time == pytest.approx(expected, abs=1e-4)
+
+
+def test_intercept_time_without_deceleration():
+    # |(3, 4).t + (300, 400)| = 25.t, the target flees along the line of fire
+    assert Cinematics.interceptTime(300, 400, 3, 4, 25, 0) == pytest.approx(25)
+
+
+def test_intercept_time_out_of_reach():
+    # The shell stops after v0² / 2a = 4000 < 5000
+    assert Cinematics.interceptTime(5000, 0, 0, 0, 400, 20) is None
+    assert Cinematics.interceptTime(300, 400, 30, 40, 25, 0) is None
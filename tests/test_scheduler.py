@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_scheduler.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from library.Scheduler import TaskScheduler
+
+
+def runTicks(scheduler, n, phase="AI"):
+    for _ in range(n):
+        scheduler.startTick()
+        scheduler.run(phase)
+
+
+def test_jobs_are_spread_over_their_period():
+    scheduler = TaskScheduler(budget=1.0)
+    runs = {}
+    jobs = [
+        scheduler.schedule(
+            "AI", lambda i=i: runs.setdefault(scheduler.tick, []).append(i), 3
+        )
+        for i in range(6)
+    ]
+    assert [job.slot for job in jobs] == [0, 1, 2, 0, 1, 2]
+
+    runTicks(scheduler, 9)
+    assert sorted(runs) == list(range(1, 10))
+    assert all(len(ticked) == 2 for ticked in runs.values())
+    assert all(tick % 3 == jobs[i].slot for tick in runs for i in runs[tick])
+
+    # A cancelled job frees its slot for the next one
+    scheduler.cancel(jobs[4])
+    assert scheduler.schedule("AI", lambda: None, 3).slot == jobs[4].slot
+    runs.clear()
+    runTicks(scheduler, 3)
+    assert 4 not in sum(runs.values(), [])
+
+
+def test_low_priority_jobs_wait_for_the_budget():
+    scheduler = TaskScheduler(budget=0)
+    calls = []
+    scheduler.schedule("AI", lambda: calls.append("high"), 1)
+    scheduler.schedule("AI", lambda: calls.append("low"), 1, lowPriority=True)
+
+    runTicks(scheduler, 3)
+    assert calls == ["high"] * 3
+
+    scheduler.budget = 1.0
+    runTicks(scheduler, 1)
+    assert calls[3:] == ["high", "low"]
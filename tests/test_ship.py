@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_ship.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+
+def test_spawned_ships_have_all_their_turrets(battle):
+    ships = list(battle.gameScene.shipList.values())
+    assert ships
+    for ship in ships:
+        assert len(ship.weapons["turrets_list"]) == len(ship.weapons["turrets_pos"])
+        for turret in ship.weapons["turrets_list"]:
+            assert turret.parentItem() is ship
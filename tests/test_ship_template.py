@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_ship_template.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from library.ShipTemplate import ShipTemplate
+from library.utils.ConfigRegistry import FrozenDict
+
+BASE = FrozenDict.freeze(
+    {
+        "hull": {"hp": 100, "speed": 30},
+        "weapons": {"guns_range": 8000, "turrets_list": []},
+    }
+)
+
+
+def test_ship_configs_do_not_leak_into_each_other():
+    template = ShipTemplate(BASE)
+    first = template.instance({"hull": {"speed": 25}})
+    second = template.instance()
+
+    first["weapons"]["turrets_list"].append("turret")
+    first["hull"]["hp"] = 50
+    assert second["weapons"]["turrets_list"] == []
+    assert first["weapons"]["turrets_list"] is not second["weapons"]["turrets_list"]
+    assert dict(second["hull"]) == {"hp": 100, "speed": 30}
+    assert dict(first["hull"]) == {"hp": 50, "speed": 25}
+    assert BASE["hull"] == {"hp": 100, "speed": 30}
+    assert BASE["weapons"]["turrets_list"] == ()
+
+
+def test_fleet_ships_own_their_turrets(battle):
+    ships = list(battle.gameScene.shipList.values())
+    turretLists = [ship.weapons["turrets_list"] for ship in ships]
+    assert len(set(map(id, turretLists))) == len(ships)
+    for ship in ships:
+        assert all(
+            turret.parentItem() is ship for turret in ship.weapons["turrets_list"]
+        )
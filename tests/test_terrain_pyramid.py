@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_terrain_pyramid.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+from PyQt5.QtCore import QRectF
+from PyQt5.QtGui import QImage, QPainter
+
+from library.displays.TerrainPyramid import TerrainPyramid
+
+
+def paintedTiles(pyramid, rect, scale=1.0):
+    image = QImage(64, 64, QImage.Format_ARGB32)
+    painter = QPainter(image)
+    painter.scale(scale, scale)
+    pyramid.invalidate()
+    pyramid.paint(painter, rect)
+    painter.end()
+    return set(pyramid.tiles)
+
+
+def test_levels_follow_the_view_scale(ui):
+    pyramid = TerrainPyramid(tileSize=256, nLevels=4)
+    pyramid.setSceneRect(QRectF(0, 0, 1024, 1024))
+    assert pyramid.scales == [0.25, 0.5, 1, 2]
+    assert pyramid._level(0.1) == 0
+    assert pyramid._level(0.25) == 0
+    assert pyramid._level(0.3) == 1
+    assert pyramid._level(1) == 2
+    assert pyramid._level(8) == 3
+
+    assert paintedTiles(pyramid, QRectF(0, 0, 1024, 1024), 0.25) == {(0, 0, 0)}
+    assert paintedTiles(pyramid, QRectF(300, 300, 100, 400), 0.5) == {
+        (1, 0, 0),
+        (1, 0, 1),
+    }
+
+
+def test_only_the_exposed_tiles_are_rendered(ui):
+    pyramid = TerrainPyramid(tileSize=256, nLevels=4)
+    pyramid.setSceneRect(QRectF(-512, -512, 1024, 1024))
+    assert paintedTiles(pyramid, QRectF(-212, -212, 200, 200)) == {(2, 1, 1)}
+    assert paintedTiles(pyramid, QRectF(-512, -512, 256, 256)) == {(2, 0, 0)}
+    assert paintedTiles(pyramid, QRectF(-312, -312, 200, 200)) == {
+        (2, 0, 0),
+        (2, 0, 1),
+        (2, 1, 0),
+        (2, 1, 1),
+    }
+    # Outside of the pyramid
+    assert paintedTiles(pyramid, QRectF(600, 600, 100, 100)) == set()
+
+    # The least recently used tiles are dropped
+    pyramid.maxTiles = 2
+    assert len(paintedTiles(pyramid, QRectF(-312, -312, 200, 200))) == 2
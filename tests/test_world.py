@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+    File name: test_world.py
+    Author: Grégory LARGANGE
+    Date created: 19/10/2026
+    Last modified by: Grégory LARGANGE
+    Date last modified: 19/10/2026
+    Python version: 3.8.1
+"""
+
+import math
+
+from PyQt5.QtCore import QPointF
+
+from conftest import endBattle, startBattle
+
+
+def heading(ship):
+    return math.radians(ship.coordinates.heading)
+
+
+def test_ship_items_move_once_per_frame(battle, monkeypatch):
+    from library.Ship import Ship
+
+    world = battle.world
+    for ship in world.ships:
+        ship.updatePath(QPointF(ship.coordinates.center.x(), 1000))
+    pushes = []
+    pushTransform = Ship.pushTransform
+
+    def countPush(ship, x, y, heading):
+        pushes.append(ship)
+        pushTransform(ship, x, y, heading)
+
+    monkeypatch.setattr(Ship, "pushTransform", countPush)
+    for _ in range(40):
+        world.step()
+        world.render(0.3)
+    assert len(pushes) == 40 * len(world.ships)
+
+
+def test_queries_test_the_ships_at_their_simulated_state(battle):
+    world = battle.world
+    for ship in world.ships:
+        ship.updatePath(QPointF(ship.coordinates.center.x(), 1000))
+    for _ in range(40):
+        world.step()
+        world.render(0.3)
+
+    # The items are displayed behind their simulated state
+    ship = max(world.ships, key=lambda s: s.instant_vars.speed)
+    assert ship.instant_vars.speed > 0
+    assert ship.mapToScene(ship.rect().center()) != ship.coordinates.center
+    for ship in world.ships:
+        center = ship.coordinates.center
+        assert ship in world.kinematics.shipsAt(center.x(), center.y())
+        assert battle.gameScene.isObstacle(center)
+        bow = QPointF(
+            center.x() + ship.rect().width() / 2 * 0.9 * math.cos(heading(ship)),
+            center.y() + ship.rect().width() / 2 * 0.9 * math.sin(heading(ship)),
+        )
+        stern = QPointF(2 * center.x() - bow.x(), 2 * center.y() - bow.y())
+        assert ship in world.kinematics.shipsAt(bow.x(), bow.y())
+        assert ship in world.kinematics.shipsAt(stern.x(), stern.y())
+        beam = QPointF(
+            center.x() - ship.rect().height() * math.sin(heading(ship)),
+            center.y() + ship.rect().height() * math.cos(heading(ship)),
+        )
+        assert ship not in world.kinematics.shipsAt(beam.x(), beam.y())
+
+
+def test_consecutive_battles_with_a_sinking(ui):
+    from library import MainClock, World
+
+    roster = ui.gameScene.roster
+    for seed in (301, 302):
+        # A battle setup cancelled by the player leaves a world behind
+        ui.mainClock = MainClock.MainClock(25)
+        ui.world = World.World(ui.mainClock, ui.gameScene)
+        ui.initData()
+        assert not roster._listeners
+
+        world = startBattle(ui, seed).world
+        ship = next(iter(roster.team("ENNEMY")))
+        ship.receiveDamage(ship.instant_vars.hp)
+        for _ in range(5):
+            world.step()
+            world.render(1)
+        assert ship not in world.ships
+        assert ship.kinIndex is None
+        endBattle(ui)
+        assert ui.gameScene.attachedWorld is None